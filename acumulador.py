@@ -0,0 +1,173 @@
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class Acumulador:
+    """
+    Junta las filas de muchas actas por columnas, para armar el resultado de una sola vez.
+
+    En lugar de guardar un DataFrame por acta y unirlos al final con `pd.concat`, los
+    valores de cada columna se guardan en buffers que se copian una única vez, al armar
+    el resultado. Las columnas con la información general del acta (Actividad, Fecha,
+    Estado...), que se repiten en todas las filas del acta, se guardan como categorías:
+    un código por acta en lugar de un valor por alumno, y en el resultado quedan con
+    dtype `category` (diccionario en Arrow/Parquet).
+
+    La información general de cada acta se toma de `df.attrs["info"]`, que completa
+    `funcs.armar_acta`, así no hace falta leer esas columnas fila por fila.
+    """
+
+    def __init__(self) -> None:
+        self.filas = 0
+        # Columnas en el orden en que aparecieron
+        self._orden: Dict[str, None] = {}
+        # Columnas comunes: partes (fila inicial, valores)
+        self._planas: Dict[str, List[Tuple[int, np.ndarray]]] = {}
+        # Columnas categóricas: valor -> código, y partes (fila inicial, filas, códigos)
+        self._categorias: Dict[str, Dict[Any, int]] = {}
+        self._codigos: Dict[str, List[Tuple[int, int, Union[int, np.ndarray]]]] = {}
+
+    def __len__(self) -> int:
+        return self.filas
+
+    def agregar(self, df: pd.DataFrame) -> None:
+        """
+        Agrega las filas de un acta.
+
+        Args:
+            df: Filas del acta; las columnas de `df.attrs["info"]` se guardan como categorías.
+        """
+        info = df.attrs.get("info", {})
+        for col in df.columns:
+            if col in info:
+                self._agregar_constante(col, self.filas, len(df), info[col])
+            else:
+                self._agregar_valores(col, self.filas, df[col].to_numpy())
+        self.filas += len(df)
+
+    def extender(self, otro: "Acumulador") -> None:
+        """
+        Agrega al final las filas de otro acumulador.
+
+        Args:
+            otro: Acumulador con las filas a agregar.
+        """
+        for col in otro._orden:
+            if col in otro._planas:
+                for inicio, valores in otro._planas[col]:
+                    self._agregar_valores(col, self.filas + inicio, valores)
+                continue
+            categorias = list(otro._categorias[col]) + [None]
+            if col not in self._orden:
+                self._nueva_columna(col, categorica=True)
+            if col in self._planas:
+                categorias = np.array(categorias, dtype=object)
+                for inicio, n, codigos in otro._codigos[col]:
+                    valores = np.broadcast_to(categorias[codigos], (n,))
+                    self._planas[col].append((self.filas + inicio, valores))
+                continue
+            # Pasar los códigos del otro acumulador a los de este
+            nuevos = np.array(
+                [self._codigo(col, v) for v in categorias], dtype=np.int32
+            )
+            for inicio, n, codigos in otro._codigos[col]:
+                if isinstance(codigos, np.ndarray):
+                    codigos = nuevos[codigos]
+                else:
+                    codigos = int(nuevos[codigos])
+                self._codigos[col].append((self.filas + inicio, n, codigos))
+        self.filas += otro.filas
+
+    def _nueva_columna(self, col: str, categorica: bool) -> None:
+        self._orden[col] = None
+        if categorica:
+            self._categorias[col] = {}
+            self._codigos[col] = []
+        else:
+            self._planas[col] = []
+
+    def _agregar_constante(self, col: str, inicio: int, n: int, valor: Any) -> None:
+        if col not in self._orden:
+            self._nueva_columna(col, categorica=True)
+        if col in self._planas:
+            self._planas[col].append((inicio, np.full(n, valor, dtype=object)))
+        elif n:
+            self._codigos[col].append((inicio, n, self._codigo(col, valor)))
+
+    def _agregar_valores(self, col: str, inicio: int, valores: np.ndarray) -> None:
+        if col not in self._orden:
+            self._nueva_columna(col, categorica=False)
+        if col in self._planas:
+            self._planas[col].append((inicio, valores))
+        elif len(valores):
+            codigos = np.array([self._codigo(col, v) for v in valores], dtype=np.int32)
+            self._codigos[col].append((inicio, len(valores), codigos))
+
+    def _codigo(self, col: str, valor: Any) -> int:
+        if pd.isna(valor):
+            return -1
+        return self._categorias[col].setdefault(valor, len(self._categorias[col]))
+
+    def _columna_plana(self, partes: List[Tuple[int, np.ndarray]]) -> np.ndarray:
+        dtypes = [valores.dtype for _, valores in partes]
+        completa = sum(len(valores) for _, valores in partes) == self.filas
+        if dtypes and all(d.kind in "iuf" for d in dtypes):
+            dtype = np.result_type(*dtypes)
+            if not completa:
+                # Como en pd.concat, las filas sin la columna quedan en NaN
+                dtype = np.result_type(dtype, np.float64)
+        elif dtypes and completa and all(d.kind == "b" for d in dtypes):
+            dtype = np.dtype(bool)
+        else:
+            dtype = np.dtype(object)
+        if completa:
+            columna = np.empty(self.filas, dtype=dtype)
+        else:
+            columna = np.full(self.filas, np.nan, dtype=dtype)
+        for inicio, valores in partes:
+            columna[inicio : inicio + len(valores)] = valores
+        return columna
+
+    def a_dataframe(self) -> pd.DataFrame:
+        """
+        Arma el resultado.
+
+        Returns:
+            DataFrame con todas las filas, en el orden en que se agregaron. Las columnas
+            de información general del acta quedan con dtype `category`.
+        """
+        datos: Dict[str, Any] = {}
+        for col in self._orden:
+            if col in self._planas:
+                datos[col] = self._columna_plana(self._planas[col])
+                continue
+            codigos = np.full(self.filas, -1, dtype=np.int32)
+            for inicio, n, codigo in self._codigos[col]:
+                codigos[inicio : inicio + n] = codigo
+            categorias = pd.Index(list(self._categorias[col]))
+            datos[col] = pd.Categorical.from_codes(codigos, categories=categorias)
+        return pd.DataFrame(datos, index=pd.RangeIndex(self.filas))
+
+    def a_arrow(self) -> Any:
+        """
+        Arma el resultado como tabla de Arrow (requiere pyarrow).
+
+        Las columnas de texto con valores de distintos tipos (números y texto según el
+        acta) se pasan a texto, y las categóricas quedan como diccionarios.
+
+        Returns:
+            `pyarrow.Table` con todas las filas.
+        """
+        import pyarrow as pa
+
+        df = self.a_dataframe()
+        for col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].astype("string")
+            elif isinstance(df[col].dtype, pd.CategoricalDtype) and (
+                df[col].cat.categories.dtype == object
+            ):
+                df[col] = df[col].astype("string").astype("category")
+        return pa.Table.from_pandas(df, preserve_index=False)
@@ -0,0 +1,177 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+# Tamaño máximo por defecto de la caché en disco
+MAX_MB = 512
+
+
+def clave_acta(*partes: Any) -> Optional[str]:
+    """
+    Arma la clave de un acta en la caché a partir de lo que la identifica en el listado.
+
+    Args:
+        *partes: Identidad del acta, por ejemplo ("examen", fila del listado) o
+            ("comision", fila de la comisión, fila del acta, estado).
+
+    Returns:
+        Clave (hash) del acta, o None si alguna parte está vacía (no se pudo identificar
+        la fila, y el acta no se debe cachear).
+    """
+    if any(p is None or str(p) == "" for p in partes):
+        return None
+    texto = json.dumps([str(p) for p in partes], ensure_ascii=False)
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def es_cerrada(estado: Any) -> bool:
+    """Indica si el estado corresponde a un acta cerrada, que ya no cambia."""
+    return "cerrada" in str(estado).lower()
+
+
+class CacheActas:
+    """
+    Caché en disco del HTML de las actas cerradas, para no volver a abrirlas.
+
+    Un acta cerrada no cambia, así que alcanza con guardar una vez el HTML de su página
+    y de cada página de alumnos para poder rearmarla en las corridas siguientes sin
+    tráfico con el servidor. Las páginas se guardan comprimidas y por contenido
+    (`paginas/<sha1>.html.gz`, así las repetidas ocupan una sola vez) y cada acta es un
+    índice `actas/<clave>.json` con la lista de sus páginas.
+
+    Cuando la caché supera `max_mb`, se borran las actas usadas hace más tiempo.
+
+    Args:
+        carpeta: Carpeta de la caché.
+        max_mb: Tamaño máximo en MB.
+    """
+
+    def __init__(self, carpeta: str, max_mb: float = MAX_MB):
+        self.carpeta = carpeta
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._dir_paginas = os.path.join(carpeta, "paginas")
+        self._dir_actas = os.path.join(carpeta, "actas")
+        os.makedirs(self._dir_paginas, exist_ok=True)
+        os.makedirs(self._dir_actas, exist_ok=True)
+        self._lock = threading.Lock()
+
+        # Referencias a cada página, para borrar solo las que no usa ninguna acta
+        self._referencias: Dict[str, int] = {}
+        self._bytes = 0
+        for nombre in os.listdir(self._dir_actas):
+            indice = self._leer_indice(nombre[: -len(".json")])
+            if indice is None:
+                continue
+            for sha in indice:
+                self._referencias[sha] = self._referencias.get(sha, 0) + 1
+            self._bytes += os.path.getsize(self._path_acta(nombre[: -len(".json")]))
+        for nombre in os.listdir(self._dir_paginas):
+            sha = nombre.split(".")[0]
+            if sha in self._referencias:
+                self._bytes += os.path.getsize(os.path.join(self._dir_paginas, nombre))
+            else:
+                os.remove(os.path.join(self._dir_paginas, nombre))
+
+    def _path_acta(self, clave: str) -> str:
+        return os.path.join(self._dir_actas, f"{clave}.json")
+
+    def _path_pagina(self, sha: str) -> str:
+        return os.path.join(self._dir_paginas, f"{sha}.html.gz")
+
+    def _leer_indice(self, clave: str) -> Optional[List[str]]:
+        try:
+            with open(self._path_acta(clave), "r", encoding="utf-8") as f:
+                return json.load(f)["paginas"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def obtener(self, clave: str) -> Optional[List[str]]:
+        """
+        Busca un acta en la caché.
+
+        Args:
+            clave: Clave del acta (ver `clave_acta`).
+
+        Returns:
+            HTML de la página del acta y de cada página de alumnos, o None si no está.
+        """
+        with self._lock:
+            indice = self._leer_indice(clave)
+            if indice is None:
+                return None
+            try:
+                htmls = []
+                for sha in indice:
+                    with gzip.open(self._path_pagina(sha), "rt", encoding="utf-8") as f:
+                        htmls.append(f.read())
+            except (OSError, EOFError):
+                self._borrar(clave, indice)
+                return None
+            # Marcar el acta como usada recién, para el orden de borrado
+            os.utime(self._path_acta(clave))
+            return htmls
+
+    def guarda(self, estado: Any) -> bool:
+        """Indica si se guarda un acta con este estado: solo las cerradas, que no cambian."""
+        return es_cerrada(estado)
+
+    def guardar(self, clave: str, htmls: List[str]) -> None:
+        """
+        Guarda el HTML de un acta.
+
+        Args:
+            clave: Clave del acta (ver `clave_acta`).
+            htmls: HTML de la página del acta y de cada página de alumnos, en orden.
+        """
+        with self._lock:
+            anterior = self._leer_indice(clave)
+            if anterior is not None:
+                self._borrar(clave, anterior)
+            indice = []
+            for html in htmls:
+                sha = hashlib.sha1(html.encode("utf-8")).hexdigest()
+                path = self._path_pagina(sha)
+                if self._referencias.get(sha, 0) == 0:
+                    with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+                        f.write(html)
+                    os.replace(path + ".tmp", path)
+                    self._bytes += os.path.getsize(path)
+                self._referencias[sha] = self._referencias.get(sha, 0) + 1
+                indice.append(sha)
+            with open(self._path_acta(clave), "w", encoding="utf-8") as f:
+                json.dump({"paginas": indice}, f)
+            self._bytes += os.path.getsize(self._path_acta(clave))
+            self._recortar()
+
+    def _borrar(self, clave: str, indice: List[str]) -> None:
+        """Borra un acta y las páginas que no use ninguna otra."""
+        try:
+            self._bytes -= os.path.getsize(self._path_acta(clave))
+            os.remove(self._path_acta(clave))
+        except OSError:
+            pass
+        for sha in indice:
+            self._referencias[sha] = self._referencias.get(sha, 1) - 1
+            if self._referencias[sha] <= 0:
+                self._referencias.pop(sha)
+                try:
+                    self._bytes -= os.path.getsize(self._path_pagina(sha))
+                    os.remove(self._path_pagina(sha))
+                except OSError:
+                    pass
+
+    def _recortar(self) -> None:
+        """Borra las actas usadas hace más tiempo hasta quedar por debajo del máximo."""
+        if self._bytes <= self.max_bytes:
+            return
+        actas = []
+        for nombre in os.listdir(self._dir_actas):
+            clave = nombre[: -len(".json")]
+            actas.append((os.path.getmtime(self._path_acta(clave)), clave))
+        for _, clave in sorted(actas):
+            if self._bytes <= self.max_bytes:
+                break
+            self._borrar(clave, self._leer_indice(clave) or [])
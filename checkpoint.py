@@ -0,0 +1,346 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+from tqdm import tqdm
+
+import progreso
+from acumulador import Acumulador
+from salida import Salida, Ubicacion
+
+# Clave de una unidad de trabajo: (página, comisión, acta). En examenes no hay comisión.
+# Con acta=None la clave marca la comisión terminada; con comisión y acta None, la página.
+Clave = Tuple[int, Optional[int], Optional[int]]
+
+# Identidad de una unidad de trabajo en el listado: la de la fila del acta o comisión
+# (la `identidad` de `fx.filas_listado`), o la lista de las filas de la página
+Identidad = Union[str, List[str]]
+
+
+class Checkpoint:
+    """
+    Registro durable del avance de una corrida, para poder reanudarla.
+
+    Cada acta terminada se agrega como una línea JSON al archivo, y se marcan también las
+    comisiones y páginas completas. Al reanudar se leen esas líneas para saltear lo ya hecho.
+
+    Junto con la posición se guarda la identidad de cada acta, comisión y página en el
+    listado. Si el listado cambió entre corridas (se publicó un acta nueva, cambió el
+    orden de las filas), lo que está en otra posición no se confunde con lo ya hecho: un
+    acta se saltea si ya se registró con la misma identidad, esté donde esté, y una
+    comisión o página solo si su identidad sigue siendo la misma.
+
+    Las filas de las actas van a la salida particionada: el checkpoint guarda solo dónde
+    quedaron, y cada acta se registra recién cuando sus filas están en disco. Al reanudar
+    se descarta de la salida lo que no llegó a registrarse.
+
+    Las actas que fallan con error no se registran, así se reintentan al reanudar. Por
+    eso la página o comisión de un acta que falló (ver `fallo`) no se marca como completa.
+
+    Args:
+        path: Ruta al archivo de checkpoint (JSON lines).
+        filtro: Filtro de la corrida (año, llamado/periodo); al reanudar tiene que coincidir.
+        reanudar: Si es True, se continúa el checkpoint existente; si no, se empieza uno nuevo.
+        salida: Salida donde escribir las filas de las actas (opcional).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        filtro: Dict[str, Any],
+        reanudar: bool = False,
+        salida: Optional[Salida] = None,
+    ):
+        self.path = path
+        self.filtro = filtro
+        self.salida = salida
+        self._hechos: Set[Clave] = set()
+        # Identidad de lo hecho en cada posición, y de todas las actas hechas
+        self._identidades: Dict[Clave, Any] = {}
+        self._actas_hechas: Set[str] = set()
+        self._ubicaciones: List[Ubicacion] = []
+        # Páginas (comision None) y comisiones con alguna acta que falló en esta corrida
+        self._fallidos: Set[Tuple[int, Optional[int]]] = set()
+        self._lock = threading.Lock()
+        if reanudar and os.path.exists(path):
+            self._cargar()
+            modo = "a"
+        else:
+            modo = "w"
+        if salida is not None:
+            salida.reanudar(self._ubicaciones)
+        self._file = open(path, modo, encoding="utf-8")
+        if modo == "w":
+            self._guardar({"tipo": "filtro", "filtro": filtro})
+
+    def _cargar(self) -> None:
+        """Lee el checkpoint existente y valida que sea de la misma corrida."""
+        for registro in self._registros():
+            if registro["tipo"] == "filtro":
+                if registro["filtro"] != self.filtro:
+                    raise ValueError(
+                        f"El checkpoint {self.path} es de otra corrida "
+                        f"({registro['filtro']}), no se puede reanudar con {self.filtro}"
+                    )
+            else:
+                self._marcar(registro)
+                if registro.get("salida") is not None:
+                    self._ubicaciones.append(registro["salida"])
+
+    def _registros(self):
+        """Itera los registros del archivo, ignorando una última línea truncada."""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for linea in f:
+                try:
+                    yield json.loads(linea)
+                except json.JSONDecodeError:
+                    continue
+
+    def _escribir(
+        self, registro: Dict[str, Any], df: Optional[pd.DataFrame] = None
+    ) -> None:
+        """Guarda el registro cuando todo lo anterior (y las filas `df`) esté en la salida."""
+        if self.salida is None:
+            self._guardar(registro)
+        elif df is None:
+            self.salida.cuando_se_guarde(lambda: self._guardar(registro))
+        else:
+            self.salida.escribir(
+                df, lambda ubicacion: self._guardar({**registro, "salida": ubicacion})
+            )
+
+    def _guardar(self, registro: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            if registro["tipo"] != "filtro":
+                self._marcar(registro)
+
+    def _marcar(self, registro: Dict[str, Any]) -> None:
+        clave = _clave(registro)
+        self._hechos.add(clave)
+        identidad = registro.get("identidad")
+        if identidad is not None:
+            self._identidades[clave] = identidad
+            if registro["tipo"] == "acta":
+                self._actas_hechas.add(identidad)
+
+    def hecho(
+        self,
+        pagina: int,
+        comision: Optional[int] = None,
+        acta: Optional[int] = None,
+        identidad: Optional[Identidad] = None,
+    ) -> bool:
+        """
+        Indica si la página, comisión o acta ya fue completada.
+
+        Args:
+            pagina: Página del listado.
+            comision: Comisión dentro de la página (None en examenes, o para preguntar por la página).
+            acta: Acta dentro de la página o comisión (None para preguntar por la comisión o página).
+            identidad: Identidad actual en el listado (ver `Identidad`). Si se da, un acta
+                cuenta como hecha si se registró con esa identidad en cualquier posición,
+                y una comisión o página solo si se registró con la misma identidad. Sin
+                identidad (o si se registró sin ella) se compara solo la posición.
+
+        Returns:
+            True si ya está registrada como terminada.
+        """
+        clave = (pagina, comision, acta)
+        if identidad is None:
+            return clave in self._hechos
+        if acta is not None and identidad in self._actas_hechas:
+            return True
+        return clave in self._hechos and self._identidades.get(clave) in (
+            None,
+            identidad,
+        )
+
+    def registrar_acta(
+        self,
+        pagina: int,
+        comision: Optional[int],
+        acta: int,
+        actividad: str,
+        df: Optional[pd.DataFrame] = None,
+        estado: str = "ok",
+        identidad: Optional[str] = None,
+    ) -> None:
+        """
+        Registra un acta terminada.
+
+        Args:
+            pagina: Página del listado.
+            comision: Comisión dentro de la página (None en examenes).
+            acta: Acta dentro de la página o comisión.
+            actividad: Actividad del acta.
+            df: Filas del acta, que se escriben en la salida (None si no tiene, por ejemplo
+                si está anulada o vacía; se ignoran si el checkpoint no tiene salida).
+            estado: Resultado del acta ("ok", "vacía", "Acta anulada", ...).
+            identidad: Identidad del acta en el listado (ver `Identidad`).
+        """
+        if df is not None and df.empty:
+            df = None
+        self._escribir(
+            {
+                "tipo": "acta",
+                "pagina": pagina,
+                "comision": comision,
+                "acta": acta,
+                "actividad": actividad,
+                "estado": estado,
+                "identidad": identidad,
+            },
+            df,
+        )
+
+    def fallo(self, pagina: int, comision: Optional[int] = None) -> None:
+        """
+        Anota que un acta (o una comisión entera) falló con error.
+
+        La comisión y su página ya no se marcan como completas, así al reanudar se vuelve
+        a ellas y se reintenta lo que no se registró.
+
+        Args:
+            pagina: Página del listado.
+            comision: Comisión dentro de la página (None en examenes).
+        """
+        with self._lock:
+            self._fallidos.add((pagina, None))
+            if comision is not None:
+                self._fallidos.add((pagina, comision))
+
+    def terminar_comision(
+        self, pagina: int, comision: int, identidad: Optional[str] = None
+    ) -> None:
+        """
+        Marca una comisión como completa, salvo que algo de ella haya fallado.
+
+        Args:
+            pagina: Página del listado.
+            comision: Comisión dentro de la página.
+            identidad: Identidad de la fila de la comisión (ver `Identidad`).
+        """
+        if (pagina, comision) in self._fallidos:
+            return
+        self._escribir(
+            {
+                "tipo": "comision",
+                "pagina": pagina,
+                "comision": comision,
+                "acta": None,
+                "identidad": identidad,
+            }
+        )
+
+    def terminar_pagina(
+        self, pagina: int, identidades: Optional[List[str]] = None
+    ) -> None:
+        """
+        Marca una página del listado como completa, salvo que algo de ella haya fallado.
+
+        Args:
+            pagina: Página del listado.
+            identidades: Identidades de las filas de la página (ver `Identidad`).
+        """
+        if (pagina, None) in self._fallidos:
+            return
+        self._escribir(
+            {
+                "tipo": "pagina",
+                "pagina": pagina,
+                "comision": None,
+                "acta": None,
+                "identidad": identidades,
+            }
+        )
+
+    def cerrar(self) -> None:
+        """Cierra la salida (registrando lo que quedaba pendiente) y el archivo de checkpoint."""
+        if self.salida is not None:
+            self.salida.cerrar()
+        with self._lock:
+            self._file.close()
+
+
+def filtro_guardado(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Lee el filtro con el que se empezó un checkpoint, sin abrirlo.
+
+    Args:
+        path: Ruta al archivo de checkpoint.
+
+    Returns:
+        El filtro guardado, o None si el archivo no existe o no lo tiene.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        for linea in f:
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                continue
+            if registro.get("tipo") == "filtro":
+                return registro["filtro"]
+    return None
+
+
+def _clave(registro: Dict[str, Any]) -> Clave:
+    return registro["pagina"], registro["comision"], registro["acta"]
+
+
+def registrar_resultado(
+    df: Any,
+    act: str,
+    dfs: Acumulador,
+    checkpoint: Optional[Checkpoint],
+    pagina: int,
+    comision: Optional[int],
+    acta: int,
+    identidad: Optional[str] = None,
+) -> None:
+    """
+    Informa el resultado de un acta y lo registra en el checkpoint y en el progreso.
+
+    Si el checkpoint tiene salida, las filas se escriben ahí; si no, se agregan a `dfs`.
+
+    Args:
+        df: DataFrame del acta, o string con el motivo si no se pudo obtener.
+        act: Actividad del acta.
+        dfs: Filas de la página, a las que se agrega el acta.
+        checkpoint: Checkpoint de la corrida (opcional).
+        pagina: Página del listado.
+        comision: Comisión dentro de la página (None en examenes).
+        acta: Acta dentro de la página o comisión.
+        identidad: Identidad del acta en el listado (ver `Identidad`).
+    """
+    if isinstance(df, str):
+        tqdm.write(f"{df} {act}")
+        if df == "Error en acta":
+            progreso.error(f"{df} {act}")
+            if checkpoint is not None:
+                checkpoint.fallo(pagina, comision)
+            return
+        if checkpoint is not None:
+            checkpoint.registrar_acta(
+                pagina, comision, acta, act, estado=df, identidad=identidad
+            )
+    elif df.empty:
+        tqdm.write(f"Acta {act} vacía")
+        if checkpoint is not None:
+            checkpoint.registrar_acta(
+                pagina, comision, acta, act, estado="vacía", identidad=identidad
+            )
+    else:
+        if checkpoint is None or checkpoint.salida is None:
+            dfs.agregar(df)
+        if checkpoint is not None:
+            checkpoint.registrar_acta(
+                pagina, comision, acta, act, df, identidad=identidad
+            )
+    progreso.acta(act)
@@ -1,7 +1,7 @@
 import os
+import re
 import numpy as np
-import time
-from typing import Any, Tuple, Union, List, Optional, Dict
+from typing import Any, Callable, Tuple, Union, List, Optional, Dict, Set
 
 from selenium import webdriver
 from selenium.common import exceptions
@@ -11,14 +11,81 @@ from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from webdriver_manager.firefox import GeckoDriverManager
 
 from tqdm import tqdm
-from IPython.display import clear_output
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from io import StringIO
 import pandas as pd
 import argparse
 
+from opciones import PERFILES
+from metricas import medir
+from reintentos import SinReintento, SinTabla
+from reportes import COMISIONES, EXAMENES, Reporte
+
+# Selector de cuántas filas muestra un cuadro por página (`<cuadro>__tamanio_pagina`...)
+_RE_TAMAÑO_PAGINA = re.compile(
+    r"tama(n|ñ)i?o_?pag|tam_pag|filas_?por_?pag|por_pagina|cant_filas", re.I
+)
+# Textos de los controles de un cuadro que muestran todas sus filas
+_TEXTOS_VER_TODO = ("ver todos", "ver todo", "mostrar todos", "mostrar todo", "todos")
+# Evento Toba de un control: js_<componente>.set_evento(new evento_ei('<evento>', ...
+_RE_EVENTO_CONTROL = re.compile(
+    r"js_(?P<componente>\w+)\.set_evento\(\s*new evento_ei\(\s*'(?P<evento>[^']*)'"
+)
+
+# Tiempo (en segundos) sin cambios en el DOM para considerar que la página se estabilizó
+QUIETUD_DOM = 0.2
+
+_JS_PAGINA_ESTABLE = """
+var quietud = arguments[0] * 1000;
+if (!window.__scraper_observer) {
+    window.__scraper_ultimo_cambio = Date.now();
+    window.__scraper_observer = new MutationObserver(function () {
+        window.__scraper_ultimo_cambio = Date.now();
+    });
+    window.__scraper_observer.observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    return false;
+}
+var sin_pedidos = typeof jQuery === "undefined" || jQuery.active === 0;
+return document.readyState === "complete" && sin_pedidos
+    && Date.now() - window.__scraper_ultimo_cambio >= quietud;
+"""
+
+
+def esperar_respuesta(
+    browser: webdriver.Firefox, timeout: float = 1, quietud: float = QUIETUD_DOM
+) -> bool:
+    """
+    Espera a que la página termine de responder a la última acción.
+
+    Considera que la página está lista cuando terminó de cargar, no hay pedidos
+    pendientes y el DOM no cambió durante `quietud` segundos. Vuelve apenas se cumple
+    eso, en lugar de dormir un tiempo fijo.
+
+    Args:
+        browser: Instancia del navegador.
+        timeout: Tiempo máximo de espera en segundos.
+        quietud: Tiempo sin mutaciones del DOM para considerar estable la página.
+
+    Returns:
+        True si la página se estabilizó antes del timeout, False si no.
+    """
+    try:
+        WebDriverWait(
+            browser,
+            timeout,
+            poll_frequency=0.05,
+            ignored_exceptions=(exceptions.JavascriptException,),
+        ).until(lambda b: b.execute_script(_JS_PAGINA_ESTABLE, quietud))
+        return True
+    except exceptions.TimeoutException:
+        return False
+
 
 def fill_textbox(
     browser: webdriver.Firefox,
@@ -35,19 +102,18 @@ def fill_textbox(
         selector: XPath del elemento textbox.
         text: Texto a ingresar.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     for _ in range(3):
         try:
             box = WebDriverWait(browser, timeout).until(
                 EC.element_to_be_clickable((By.XPATH, selector))
             )
-            time.sleep(residual_timeout)
             box.clear()
             box.send_keys(text)
             return  # Sale si se logra la acción
         except Exception:
-            time.sleep(timeout)
+            esperar_respuesta(browser, timeout)
             continue
 
 
@@ -64,12 +130,223 @@ def click_by_xpath(
         browser: Instancia del navegador.
         selector: XPath del elemento a clickejar.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     WebDriverWait(browser, timeout).until(
         EC.element_to_be_clickable((By.XPATH, selector))
     ).click()
-    time.sleep(residual_timeout)
+    esperar_respuesta(browser, residual_timeout)
+
+
+def clear_output(wait: bool = False) -> None:
+    """
+    Limpia la salida de la celda, como `IPython.display.clear_output`.
+
+    IPython es opcional: se importa recién acá, así no demora el arranque, y si no está
+    instalado no se hace nada.
+
+    Args:
+        wait: Si es True, espera a que haya salida nueva para limpiar.
+    """
+    try:
+        from IPython.display import clear_output as limpiar
+    except ImportError:
+        return
+    limpiar(wait=wait)
+
+
+def leer_credenciales(siu_credentials: str) -> Tuple[str, str]:
+    """
+    Lee el usuario y la contraseña de SIU desde un archivo de texto.
+
+    Args:
+        siu_credentials: Ruta al archivo con el usuario en la primera línea y la contraseña en la segunda.
+
+    Returns:
+        Tupla (usuario, contraseña).
+    """
+    with open(siu_credentials, "r") as f:
+        lines = f.readlines()
+    siu_user = lines[0].strip()
+    siu_pass = lines[1].strip() if len(lines) > 1 else ""
+    return siu_user, siu_pass
+
+
+# Preferencias de Firefox que evitan descargar y renderizar lo que el scraper no usa.
+# Las imágenes se bloquean pero el atributo src sigue en el HTML, así que get_statuses
+# puede seguir distinguiendo rojo.png/verde.png/azul.png. El CSS y el JS se mantienen
+# porque Toba los necesita para mostrar y navegar los cuadros.
+PREFERENCIAS_LIVIANAS: Dict[str, Any] = {
+    # Imágenes y fuentes
+    "permissions.default.image": 2,
+    "browser.display.use_document_fonts": 0,
+    "gfx.downloadable_fonts.enabled": False,
+    # Cachés en disco y sesiones guardadas
+    "browser.cache.disk.enable": False,
+    "browser.cache.offline.enable": False,
+    "browser.sessionstore.resume_from_crash": False,
+    "browser.sessionhistory.max_total_viewers": 0,
+    # Pedidos especulativos
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "network.http.speculative-parallel-limit": 0,
+    "network.predictor.enabled": False,
+    # Multimedia, notificaciones y animaciones
+    "media.autoplay.default": 5,
+    "media.peerconnection.enabled": False,
+    "dom.webnotifications.enabled": False,
+    "dom.push.enabled": False,
+    "toolkit.cosmeticAnimations.enabled": False,
+    "ui.prefersReducedMotion": 1,
+    # Servicios en segundo plano
+    "app.update.auto": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.safebrowsing.downloads.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "extensions.pocket.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+}
+
+
+# Archivo donde se guarda la ruta del geckodriver que ya funcionó, para no resolverlo
+# (ni consultar a GitHub con GeckoDriverManager) en cada navegador que se abre
+ARCHIVO_DRIVER = os.path.join(
+    os.path.expanduser("~"), ".siu_guarani", "geckodriver.txt"
+)
+
+
+def ruta_driver_guardada() -> Optional[str]:
+    """
+    Ruta del geckodriver guardada en ARCHIVO_DRIVER, si existe y el ejecutable sigue ahí.
+
+    Returns:
+        Ruta al geckodriver o None.
+    """
+    try:
+        with open(ARCHIVO_DRIVER, "r", encoding="utf-8") as f:
+            ruta = f.read().strip()
+    except OSError:
+        return None
+    return ruta if ruta and os.path.isfile(ruta) else None
+
+
+def guardar_ruta_driver(ruta: Optional[str]) -> None:
+    """
+    Guarda la ruta del geckodriver en ARCHIVO_DRIVER para las próximas corridas.
+
+    Args:
+        ruta: Ruta al geckodriver (si es None o no existe, no se guarda nada).
+    """
+    if not ruta or not os.path.isfile(ruta) or ruta == ruta_driver_guardada():
+        return
+    try:
+        os.makedirs(os.path.dirname(ARCHIVO_DRIVER), exist_ok=True)
+        with open(ARCHIVO_DRIVER, "w", encoding="utf-8") as f:
+            f.write(ruta)
+    except OSError:
+        pass
+
+
+def carpeta_perfil_worker(carpeta_perfil: Optional[str], k: int) -> Optional[str]:
+    """
+    Carpeta de perfil persistente del worker `k`.
+
+    Firefox no deja abrir dos instancias con el mismo perfil, así que cada worker usa su
+    propia subcarpeta; el worker `k` reutiliza siempre la misma entre corridas.
+
+    Args:
+        carpeta_perfil: Carpeta base de perfiles (None para usar perfiles temporales).
+        k: Número de worker.
+
+    Returns:
+        Carpeta del perfil del worker, o None.
+    """
+    if carpeta_perfil is None:
+        return None
+    return os.path.join(carpeta_perfil, f"worker{k}")
+
+
+def opciones_navegador(
+    perfil: str = "normal", carpeta_perfil: Optional[str] = None
+) -> Options:
+    """
+    Arma las opciones de Firefox para el perfil indicado.
+
+    Perfiles:
+        - normal: Firefox visible, sin cambios.
+        - liviano: Firefox visible, sin imágenes, fuentes, cachés en disco ni servicios en segundo plano.
+        - scraping: Igual que liviano, pero sin ventana (headless). Solo sirve si el proxy
+          no pide credenciales de forma interactiva.
+
+    Args:
+        perfil: Nombre del perfil, uno de PERFILES.
+        carpeta_perfil: Carpeta de un perfil de Firefox persistente (opcional). Se crea
+            si no existe y se usa en el lugar, sin copiarla: lo que Firefox guarda en la
+            primera corrida (certificados, excepciones del proxy, caché de la sesión)
+            queda para las siguientes. Si es None, Firefox arranca con un perfil temporal.
+
+    Returns:
+        Opciones de Firefox.
+    """
+    if perfil not in PERFILES:
+        raise ValueError(
+            f"Perfil '{perfil}' no válido. Opciones: {', '.join(PERFILES)}"
+        )
+    options = Options()
+    if perfil in ("liviano", "scraping"):
+        for pref, value in PREFERENCIAS_LIVIANAS.items():
+            options.set_preference(pref, value)
+    if perfil == "scraping":
+        options.add_argument("-headless")
+    if carpeta_perfil is not None:
+        os.makedirs(carpeta_perfil, exist_ok=True)
+        options.add_argument("-profile")
+        options.add_argument(os.path.abspath(carpeta_perfil))
+    return options
+
+
+def abrir_navegador(
+    perfil: str = "normal", carpeta_perfil: Optional[str] = None
+) -> webdriver.Firefox:
+    """
+    Abre una instancia de Firefox.
+
+    El geckodriver se busca primero en la ruta guardada por una corrida anterior (ver
+    ARCHIVO_DRIVER), después donde lo encuentre Selenium y recién al final se instala
+    con GeckoDriverManager. La ruta que funciona se guarda, así las corridas siguientes
+    (y cada worker) arrancan sin resolver el driver y sin conexión a internet.
+
+    Args:
+        perfil: Perfil del navegador, uno de PERFILES (ver `opciones_navegador`).
+        carpeta_perfil: Carpeta de un perfil persistente (ver `opciones_navegador`).
+
+    Returns:
+        Instancia del navegador.
+    """
+    ruta = ruta_driver_guardada()
+    if ruta is not None:
+        try:
+            return webdriver.Firefox(
+                service=FirefoxService(ruta),
+                options=opciones_navegador(perfil, carpeta_perfil),
+            )
+        except Exception:
+            pass
+    try:
+        browser = webdriver.Firefox(options=opciones_navegador(perfil, carpeta_perfil))
+    except Exception:
+        ruta = GeckoDriverManager().install()
+        browser = webdriver.Firefox(
+            service=FirefoxService(ruta),
+            options=opciones_navegador(perfil, carpeta_perfil),
+        )
+    else:
+        ruta = getattr(getattr(browser, "service", None), "path", None)
+    guardar_ruta_driver(ruta)
+    return browser
 
 
 def login_siu(browser: webdriver.Firefox, siu_user: str, siu_pass: str) -> None:
@@ -81,9 +358,87 @@ def login_siu(browser: webdriver.Firefox, siu_user: str, siu_pass: str) -> None:
         siu_user: Usuario SIU.
         siu_pass: Contraseña SIU.
     """
-    fill_textbox(browser, '//*[@id="ef_form_5000221_datosusuario"]', siu_user)
-    fill_textbox(browser, '//*[@id="ef_form_5000221_datosclave"]', siu_pass)
-    click_by_xpath(browser, '//*[@id="form_5000221_datos_ingresar"]')
+    with medir("login"):
+        fill_textbox(browser, '//*[@id="ef_form_5000221_datosusuario"]', siu_user)
+        fill_textbox(browser, '//*[@id="ef_form_5000221_datosclave"]', siu_pass)
+        click_by_xpath(browser, '//*[@id="form_5000221_datos_ingresar"]')
+
+
+class SesionExpirada(SinReintento):
+    """La sesión de Guaraní (o la autenticación del proxy) expiró en medio de la corrida."""
+
+
+# Lo que aparece en una página cuando la sesión expiró: el formulario de login al que
+# redirige Guaraní, o los mensajes de Toba y del proxy (en minúsculas)
+_ID_LOGIN = "ef_form_5000221_datosusuario"
+_MARCAS_SESION_EXPIRADA = (
+    "sesión ha expirado",
+    "sesion ha expirado",
+    "sesión expirada",
+    "sesion expirada",
+    "sesión ha finalizado",
+    "proxy authentication required",
+)
+
+_JS_SESION_EXPIRADA = """
+var texto = document.body ? document.body.textContent.toLowerCase() : '';
+return document.getElementById(arguments[0]) !== null ||
+    arguments[1].some(function (marca) { return texto.indexOf(marca) >= 0; });
+"""
+
+
+def sesion_expirada(pagina: Union[webdriver.Firefox, str]) -> bool:
+    """
+    Indica si la página actual es la de login o un aviso de sesión expirada.
+
+    Args:
+        pagina: Navegador (se consulta en un solo pedido) o HTML de la página.
+
+    Returns:
+        True si la sesión expiró y hay que volver a entrar.
+    """
+    if isinstance(pagina, str):
+        if _ID_LOGIN in pagina:
+            return True
+        texto = pagina.lower()
+        return any(marca in texto for marca in _MARCAS_SESION_EXPIRADA)
+    return bool(
+        pagina.execute_script(
+            _JS_SESION_EXPIRADA, _ID_LOGIN, list(_MARCAS_SESION_EXPIRADA)
+        )
+    )
+
+
+def recuperar_sesion(
+    browser: webdriver.Firefox, reingresar: Optional[Callable[[], None]]
+) -> bool:
+    """
+    Si la sesión expiró, vuelve a entrar con `reingresar` (login, menú y filtros).
+
+    Args:
+        browser: Instancia del navegador.
+        reingresar: Función sin argumentos que vuelve a entrar y deja el listado
+            filtrado (None si no se puede, por ejemplo en un replay).
+
+    Returns:
+        True si hubo que volver a entrar; el navegador queda en la primera página del listado.
+    """
+    if reingresar is None:
+        return False
+    try:
+        if not sesion_expirada(browser):
+            return False
+    except exceptions.WebDriverException:
+        return False
+    volver_a_entrar(reingresar)
+    return True
+
+
+def volver_a_entrar(reingresar: Callable[[], None]) -> None:
+    """Avisa que la sesión expiró y vuelve a entrar con `reingresar`."""
+    tqdm.write("La sesión expiró, volviendo a entrar")
+    with medir("relogin"):
+        reingresar()
 
 
 def write_in_xpath(
@@ -101,13 +456,12 @@ def write_in_xpath(
         xpath: XPath del elemento.
         text: Texto a ingresar.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     try:
         element = WebDriverWait(browser, timeout).until(
             EC.element_to_be_clickable((By.XPATH, xpath))
         )
-        time.sleep(residual_timeout)
         element.clear()
         element.send_keys(text)
     except Exception as e:
@@ -129,7 +483,7 @@ def select_option_by_value(
         selector: XPath del dropdown.
         option_value: Valor de la opción a seleccionar.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     dropdown = WebDriverWait(browser, timeout).until(
         EC.element_to_be_clickable((By.XPATH, selector))
@@ -137,7 +491,7 @@ def select_option_by_value(
     select = Select(dropdown)
     try:
         select.select_by_value(option_value)
-        time.sleep(residual_timeout)
+        esperar_respuesta(browser, residual_timeout)
     except Exception:
         raise ValueError(f"Option with value '{option_value}' not found.")
 
@@ -157,7 +511,7 @@ def select_option_by_text(
         selector: XPath del dropdown.
         option_text: Texto visible de la opción a seleccionar.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     dropdown = WebDriverWait(browser, timeout).until(
         EC.element_to_be_clickable((By.XPATH, selector))
@@ -165,7 +519,7 @@ def select_option_by_text(
     select = Select(dropdown)
     try:
         select.select_by_visible_text(option_text)
-        time.sleep(residual_timeout)
+        esperar_respuesta(browser, residual_timeout)
     except Exception:
         raise ValueError(f"Option with text '{option_text}' not found.")
 
@@ -201,7 +555,7 @@ def select_option_by_input(
     timeout: int = 10,
     residual_timeout: int = 1,
     input_text: Optional[str] = None,
-) -> None:
+) -> Tuple[str, str]:
     """
     Permite seleccionar una opción de un dropdown, mostrando las opciones disponibles para elegir
     o utilizando un valor de entrada directo.
@@ -211,8 +565,11 @@ def select_option_by_input(
         selector: XPath del dropdown.
         text: Si es True, se selecciona por texto visible; de lo contrario, por valor.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
         input_text: Texto de entrada para seleccionar directamente. Si es None, se muestra la lista de opciones.
+
+    Returns:
+        Tupla (valor, texto) de la opción que quedó seleccionada.
     """
     options = get_dropdown_options(browser, selector, timeout)
     if input_text is None:
@@ -278,240 +635,385 @@ def select_option_by_input(
         select_option_by_value(
             browser, selector, value_to_select, timeout, residual_timeout
         )
+    selected = Select(
+        WebDriverWait(browser, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, selector))
+        )
+    ).first_selected_option
+    return selected.get_attribute("value"), selected.text
 
 
-def filtrar_año(
+def filtrar(
     browser: webdriver.Firefox,
-    input_text: Optional[str] = None,
+    reporte: Reporte,
+    año: Optional[str] = None,
+    valor: Optional[str] = None,
     timeout: int = 10,
     residual_timeout: int = 1,
-) -> None:
+) -> Tuple[str, str]:
     """
-    Selecciona el año académico en el dropdown correspondiente.
+    Filtra el listado de un reporte por año y por su segundo filtro (llamado, periodo...).
 
     Args:
-        browser: Instancia del navegador.
-        input_text: Valor a seleccionar; si es None, se solicita al usuario.
+        browser: Instancia del navegador, parada en el filtro del reporte.
+        reporte: Reporte a filtrar (ver `reportes`).
+        año: Año a seleccionar; si es None, se solicita al usuario.
+        valor: Texto del segundo filtro; si es None, se solicita al usuario.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
+
+    Returns:
+        Tupla (valor del año seleccionado, texto del segundo filtro seleccionado).
     """
-    select_option_by_input(
+    año_sel, _ = _filtrar_año(browser, reporte, año, timeout, residual_timeout)
+    _, valor_sel = _filtrar_segundo(browser, reporte, valor, timeout, residual_timeout)
+    _ejecutar_filtro(browser, reporte, timeout, residual_timeout)
+    return año_sel, valor_sel
+
+
+def _filtrar_año(
+    browser: webdriver.Firefox,
+    reporte: Reporte,
+    input_text: Optional[str],
+    timeout: int,
+    residual_timeout: int,
+) -> Tuple[str, str]:
+    return select_option_by_input(
         browser,
-        '//*[@id="ef_ei_38000482_filtroanio_academico"]',
+        f'//*[@id="{reporte.filtro_año}"]',
         input_text=input_text,
         timeout=timeout,
         residual_timeout=residual_timeout,
     )
 
 
-def filtrar_llamado(
+def _filtrar_segundo(
     browser: webdriver.Firefox,
-    input_text: Optional[str] = None,
-    timeout: int = 10,
-    residual_timeout: int = 1,
-) -> None:
-    """
-    Selecciona el turno de examen en el dropdown correspondiente.
-
-    Args:
-        browser: Instancia del navegador.
-        input_text: Valor a seleccionar; si es None, se solicita al usuario.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
-    """
-    text_flag = True if input_text is not None else False
-    select_option_by_input(
+    reporte: Reporte,
+    input_text: Optional[str],
+    timeout: int,
+    residual_timeout: int,
+) -> Tuple[str, str]:
+    # Con un valor dado se busca por texto (como lo ve el usuario)
+    return select_option_by_input(
         browser,
-        '//*[@id="ef_ei_38000482_filtroturno_examen"]',
+        f'//*[@id="{reporte.filtro[1]}"]',
         input_text=input_text,
-        text=text_flag,
+        text=input_text is not None,
         timeout=timeout,
         residual_timeout=residual_timeout,
     )
 
 
-def ejecutar_filtro(
-    browser: webdriver.Firefox, timeout: int = 10, residual_timeout: int = 1
+def _ejecutar_filtro(
+    browser: webdriver.Firefox, reporte: Reporte, timeout: int, residual_timeout: int
 ) -> None:
-    """
-    Ejecuta el filtro haciendo clic en el botón correspondiente.
-
-    Args:
-        browser: Instancia del navegador.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
-    """
     click_by_xpath(
-        browser, '//*[@id="ei_38000482_filtro_filtrar"]', timeout, residual_timeout
+        browser, f'//*[@id="{reporte.boton_filtrar}"]', timeout, residual_timeout
     )
 
 
-def filtrar_año_com(
+def generar_acta(
     browser: webdriver.Firefox,
-    input_text: Optional[str] = None,
-    timeout: int = 10,
+    acta_obj: Any,
+    reporte: Reporte,
+    datos: Optional[Dict[str, Any]] = None,
+    timeout: int = 15,
     residual_timeout: int = 1,
-) -> None:
+    cache: Optional[Any] = None,
+    clave: Optional[str] = None,
+    sin_ampliar: Optional[Set[str]] = None,
+) -> Union[Tuple[pd.DataFrame, str], str]:
     """
-    Selecciona el año académico en el dropdown correspondiente.
+    Genera un acta a partir de un objeto acta, recopilando la información general y la de los alumnos a lo largo de las páginas.
+
+    Si el acta está en la caché, se arma desde ahí sin hacer click; si no, al terminar
+    se guardan sus páginas en la caché si corresponde (ver `cache.CacheActas.guarda`).
 
     Args:
         browser: Instancia del navegador.
-        input_text: Valor a seleccionar; si es None, se solicita al usuario.
+        acta_obj: Elemento que representa el acta a procesar.
+        reporte: Reporte al que pertenece el acta (ver `reportes`).
+        datos: Datos del acta tomados del listado (estado, instancia, tipo...), que
+            reemplazan a los de la página del acta.
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
+        cache: `cache.CacheActas` a consultar (opcional).
+        clave: Clave del acta en la caché (ver `cache.clave_acta`).
+        sin_ampliar: Cuadros que no se pueden ampliar (ver `Paginador`).
+
+    Returns:
+        Una tupla (DataFrame con la información consolidada, actividad), o (motivo,
+        actividad) si el acta está anulada.
+
+    Raises:
+        Exception: Si no se pudo leer el acta. El navegador vuelve al listado y quien lo
+            recorre reintenta el acta (ver `reintentos`).
     """
-    select_option_by_input(
-        browser,
-        '//*[@id="ef_ei_34000144_filtroanio_academico"]',
-        input_text=input_text,
-        timeout=timeout,
-        residual_timeout=residual_timeout,
+    if cache is not None and clave is not None:
+        htmls = cache.obtener(clave)
+        if htmls is not None:
+            with medir("cache"):
+                return acta_de_htmls(htmls, reporte, datos)
+
+    cancelar = f'//*[@id="{reporte.cancelar}"]'
+    with medir("abrir_acta"):
+        acta_obj.click()
+        WebDriverWait(browser, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, cancelar))
+        )
+
+    try:
+        htmls = [leer_html(browser)]
+        pagina = parse_pagina(htmls[0])
+        info = info_acta(pagina, reporte, datos)
+        if not (reporte.saltear_anuladas and info.get("Estado") == "Anulada"):
+            tabs = [alumnos_acta(pagina, reporte)]
+    except Exception:
+        # Volver al listado: quien recorre el listado reintenta el acta según la clase
+        # del error (ver `reintentos`)
+        for boton in browser.find_elements(By.XPATH, cancelar):
+            boton.click()
+            esperar_respuesta(browser, residual_timeout)
+        raise
+    if reporte.saltear_anuladas and info.get("Estado") == "Anulada":
+        browser.find_element(By.XPATH, cancelar).click()
+        esperar_respuesta(browser, residual_timeout)
+        return "Acta anulada", info.get("Actividad", "Act. no encontrada")
+    alumnos = Paginador(
+        browser, reporte.alumnos, timeout, residual_timeout, sin_ampliar
     )
+    n_pages = alumnos.total_paginas()
+    if n_pages > 1 and alumnos.ampliar():
+        # La primera página ahora trae más alumnos (o todos)
+        htmls[0] = leer_html(browser)
+        tabs = [alumnos_acta(parse_pagina(htmls[0]), reporte)]
+        n_pages = alumnos.total_paginas()
+
+    for pagina in range(2, n_pages + 1):
+        alumnos.ir_a(pagina)
+        WebDriverWait(browser, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, cancelar))
+        )
+        htmls.append(leer_html(browser))
+        tabs.append(alumnos_acta(parse_pagina(htmls[-1]), reporte))
+
+    tab = armar_acta(tabs, info)
+    if cache is not None and clave is not None and cache.guarda(info.get("Estado")):
+        cache.guardar(clave, htmls)
+    with medir("volver"):
+        browser.find_element(By.XPATH, cancelar).click()
+        esperar_respuesta(browser, residual_timeout)
+    return tab, info["Actividad"]
 
 
-def filtrar_periodo_com(
+def capturar_acta(
     browser: webdriver.Firefox,
-    input_text: Optional[str] = None,
-    timeout: int = 10,
+    acta_obj: Any,
+    reporte: Reporte,
+    timeout: int = 15,
     residual_timeout: int = 1,
-) -> None:
+    sin_ampliar: Optional[Set[str]] = None,
+) -> List[str]:
     """
-    Selecciona el turno de examen en el dropdown correspondiente.
+    Abre un acta, trae el HTML de cada una de sus páginas sin parsearlo y vuelve al listado.
+
+    Es la parte de navegación de `generar_acta`: el HTML se parsea después, en otro
+    proceso (ver `pipeline`), mientras el navegador sigue con la próxima acta.
 
     Args:
         browser: Instancia del navegador.
-        input_text: Valor a seleccionar; si es None, se solicita al usuario.
+        acta_obj: Elemento que representa el acta a procesar.
+        reporte: Reporte al que pertenece el acta (ver `reportes`).
         timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
+        sin_ampliar: Cuadros que no se pueden ampliar (ver `Paginador`).
+
+    Returns:
+        HTML de la página del acta y de cada página de alumnos, en orden.
     """
-    text_flag = True if input_text is not None else False
-    select_option_by_input(
-        browser,
-        '//*[@id="ef_ei_34000144_filtroperiodos_nombre"]',
-        input_text=input_text,
-        text=text_flag,
-        timeout=timeout,
-        residual_timeout=residual_timeout,
+    cancelar = f'//*[@id="{reporte.cancelar}"]'
+    with medir("abrir_acta"):
+        acta_obj.click()
+        WebDriverWait(browser, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, cancelar))
+        )
+    htmls = [leer_html(browser)]
+    alumnos = Paginador(
+        browser, reporte.alumnos, timeout, residual_timeout, sin_ampliar
     )
+    n_pages = alumnos.total_paginas()
+    if n_pages > 1 and alumnos.ampliar():
+        htmls[0] = leer_html(browser)
+        n_pages = alumnos.total_paginas()
+    for pagina in range(2, n_pages + 1):
+        alumnos.ir_a(pagina)
+        WebDriverWait(browser, timeout).until(
+            EC.element_to_be_clickable((By.XPATH, cancelar))
+        )
+        htmls.append(leer_html(browser))
+    with medir("volver"):
+        browser.find_element(By.XPATH, cancelar).click()
+        esperar_respuesta(browser, residual_timeout)
+    return htmls
 
 
-def ejecutar_filtro_com(
-    browser: webdriver.Firefox, timeout: int = 10, residual_timeout: int = 1
-) -> None:
+def leer_html(browser: webdriver.Firefox) -> str:
     """
-    Ejecuta el filtro haciendo clic en el botón correspondiente.
+    Trae el HTML de la página actual del navegador (`browser.page_source`).
 
     Args:
         browser: Instancia del navegador.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+
+    Returns:
+        HTML de la página.
     """
-    click_by_xpath(
-        browser, '//*[@id="ei_34000144_filtro_filtrar"]', timeout, residual_timeout
-    )
+    with medir("page_source"):
+        return browser.page_source
 
 
-def acta_generator(
-    browser: webdriver.Firefox,
-    acta_obj: Any,
-    timeout: int = 15,
-    residual_timeout: int = 1,
-) -> Union[Tuple[pd.DataFrame, str], str]:
+def parse_pagina(page: Union[str, BeautifulSoup]) -> Dict[str, Any]:
     """
-    Genera un acta a partir de un objeto acta, recopilando la información general y la de los alumnos a lo largo de las páginas.
+    Parsea una página una única vez y devuelve todas sus tablas.
+
+    Construye el árbol de BeautifulSoup y corre `pd.read_html` una sola vez, de modo
+    que `info_acta`, `alumnos_acta` y `get_instance` puedan leer el bloque de
+    encabezado, la tabla de alumnos y la de instancias sin volver a parsear el documento.
 
     Args:
-        browser: Instancia del navegador.
-        acta_obj: Elemento que representa el acta a procesar.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        page: HTML de la página (por ejemplo `browser.page_source`) o un BeautifulSoup ya construido.
 
     Returns:
-        Una tupla (DataFrame con la información consolidada, actividad) o un string de error.
+        Diccionario con el árbol parseado (`soup`), las tablas de la página (`tablas`)
+        y si la página indica "No hay datos cargados" (`sin_datos`).
     """
-    acta_obj.click()
-    WebDriverWait(browser, timeout).until(
-        EC.element_to_be_clickable((By.XPATH, '//*[@id="ci_38000483_cancelar"]'))
-    )
-    try:
-        soup = BeautifulSoup(browser.page_source, "html.parser")
-        info = general_info(soup, timeout, residual_timeout)
-        if info["Estado"] == "Anulada":
-            back = browser.find_element(By.XPATH, '//*[@id="ci_38000483_cancelar"]')
-            back.click()
-            time.sleep(residual_timeout)
-            try:
-                return "Acta anulada", info["Actividad"]
-            except:
-                return "Acta anulada", "Act. no encontrada"
-        tabs = [tab_alumnos(soup, timeout, residual_timeout)]
-    except Exception:
-        try:
-            time.sleep(timeout)
-            soup = BeautifulSoup(browser.page_source, "html.parser")
-            info = general_info(soup, timeout, residual_timeout)
-            tabs = [tab_alumnos(soup, timeout, residual_timeout)]
-        except Exception:
-            time.sleep(timeout)
-            info = general_info(soup, timeout, residual_timeout)
-
-            back = browser.find_element(By.XPATH, '//*[@id="ci_38000483_cancelar"]')
-            back.click()
-            time.sleep(residual_timeout)
-            try:
-                return "Error en acta", info["Actividad"]
-            except:
-                return "Error en acta", "Act. no encontrada"
-    try:
-        n_pages = int(
-            browser.find_element(
-                By.XPATH,
-                '//*[@id="cuerpo_js_cuadro_38000500_alumnos"]/tbody/tr[4]/td/div/strong[2]',
-            ).text
+    with medir("parse"):
+        soup = (
+            page
+            if isinstance(page, BeautifulSoup)
+            else BeautifulSoup(page, "html.parser")
         )
-    except exceptions.NoSuchElementException:
-        n_pages = 1
+        html = soup.prettify()
+        try:
+            tablas = pd.read_html(StringIO(html))
+        except ValueError:
+            tablas = []
+    return {
+        "soup": soup,
+        "tablas": tablas,
+        "sin_datos": "No hay datos cargados" in html,
+    }
+
+
+def total_paginas_html(
+    page: Union[str, BeautifulSoup, Dict[str, Any]], cuadro: str
+) -> int:
+    """
+    Lee la cantidad total de páginas de un cuadro Toba a partir del HTML.
 
-    for _ in range(1, n_pages):
-        next_page(browser, residual_timeout)
-        WebDriverWait(browser, timeout).until(
-            EC.element_to_be_clickable((By.XPATH, '//*[@id="ci_38000483_cancelar"]'))
-        )
-        soup = BeautifulSoup(browser.page_source, "html.parser")
-        tabs.append(tab_alumnos(soup, timeout, residual_timeout))
+    Equivalente a `Paginador.total_paginas`, pero sin navegador.
 
-    tab = pd.concat(tabs, ignore_index=True)
-    tab["Nº"] = tab.index + 1
-    old_cols = tab.columns.to_list()
-
-    for col, val in info.items():
-        tab[col] = val
-    old_cols.extend(info.keys())
-    tab = tab[old_cols]
-    back = browser.find_element(By.XPATH, '//*[@id="ci_38000483_cancelar"]')
-    back.click()
-    time.sleep(residual_timeout)
-    return tab, info["Actividad"]
+    Args:
+        page: HTML de la página, BeautifulSoup o página ya parseada con `parse_pagina`.
+        cuadro: Id del cuadro Toba, por ejemplo "cuadro_38000500_alumnos".
 
+    Returns:
+        Cantidad de páginas; 1 si el cuadro no tiene paginación.
+    """
+    if isinstance(page, str):
+        # Solo hace falta el cuadro: no armar el árbol entero ni leer las tablas
+        soup = BeautifulSoup(
+            page, "html.parser", parse_only=SoupStrainer(id=f"cuerpo_js_{cuadro}")
+        )
+    elif isinstance(page, BeautifulSoup):
+        soup = page
+    else:
+        soup = page["soup"]
+    cuerpo = soup.find(id=f"cuerpo_js_{cuadro}")
+    if cuerpo is None:
+        return 1
+    filas = cuerpo.find_all("tr", recursive=False)
+    if not filas and cuerpo.tbody is not None:
+        filas = cuerpo.tbody.find_all("tr", recursive=False)
+    try:
+        return int(filas[3].td.div.find_all("strong")[1].get_text(strip=True))
+    except (IndexError, AttributeError, ValueError):
+        return 1
 
-def general_info(
-    soup: BeautifulSoup, timeout: int = 15, residual_timeout: int = 1
-) -> Dict[str, Any]:
+
+def ampliacion_pagina(
+    page: Union[str, BeautifulSoup], cuadro: str
+) -> Optional[Dict[str, str]]:
     """
-    Extrae la información general del acta a partir del HTML.
+    Busca en la página una forma de que el cuadro muestre todas sus filas, o más por página.
+
+    Se reconocen un select de tamaño de página del cuadro (`<cuadro>__tamanio_pagina` o
+    similar; se elige "Todos" o la opción más grande) y un link o botón del cuadro tipo
+    "Ver todos" que dispara un evento Toba. Ver `Paginador.ampliar` y
+    `backend_http.SesionHTTP.ampliar_pagina`.
 
     Args:
-        soup: Objeto BeautifulSoup del HTML de la página.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        page: HTML de la página o un BeautifulSoup ya construido.
+        cuadro: Id del cuadro Toba, por ejemplo "cuadro_38000500_alumnos".
 
     Returns:
-        Diccionario con la información general extraída.
+        Con un select, {"campo": nombre, "valor": valor a elegir}; con un evento,
+        {"componente", "evento", "onclick"}. None si el cuadro no tiene ninguno.
     """
-    tab = pd.read_html(StringIO(soup.prettify()))[1]
+    soup = (
+        page
+        if isinstance(page, BeautifulSoup)
+        else BeautifulSoup(
+            page, "html.parser", parse_only=SoupStrainer(["select", "a", "button"])
+        )
+    )
+    for select in soup.find_all("select"):
+        nombre = select.get("name") or select.get("id") or ""
+        if cuadro not in nombre or not _RE_TAMAÑO_PAGINA.search(nombre):
+            continue
+        opciones = {
+            o.get("value", o.get_text(strip=True)): o.get_text(strip=True).lower()
+            for o in select.find_all("option")
+        }
+        elegida = select.find("option", selected=True)
+        actual = elegida.get("value") if elegida is not None else None
+        todos = [v for v, texto in opciones.items() if texto in _TEXTOS_VER_TODO]
+        numericas = [v for v in opciones if v.isdigit()]
+        if todos:
+            valor = todos[0]
+        elif numericas:
+            valor = max(numericas, key=int)
+        else:
+            continue
+        if valor != actual:
+            return {"campo": nombre, "valor": valor}
+    for control in soup.find_all(["a", "button"]):
+        onclick = control.get("onclick", "")
+        m = _RE_EVENTO_CONTROL.search(onclick)
+        if (
+            m is not None
+            and cuadro in m.group("componente")
+            and control.get_text(" ", strip=True).lower() in _TEXTOS_VER_TODO
+        ):
+            return {
+                "componente": m.group("componente"),
+                "evento": m.group("evento"),
+                "onclick": onclick,
+            }
+    return None
+
+
+def _as_pagina(page: Union[str, BeautifulSoup, Dict[str, Any]]) -> Dict[str, Any]:
+    """Devuelve la página ya parseada, parseándola solo si hace falta."""
+    if isinstance(page, dict):
+        return page
+    return parse_pagina(page)
+
+
+def _info_de_tabla(tab: pd.DataFrame, filas: slice) -> Dict[str, Any]:
+    """Arma el diccionario de información general a partir del bloque de encabezado."""
     info: Dict[str, Any] = {}
-    tab_info = tab.iloc[1:5]
+    tab_info = tab.iloc[filas]
     for row in tab_info.iterrows():
         info[row[1][0]] = row[1][1]
         info[row[1][2]] = row[1][3]
@@ -525,204 +1027,284 @@ def general_info(
     return info
 
 
-def get_instance(browser):
-    soup = BeautifulSoup(browser.page_source, "html.parser").prettify()
-    dfs = pd.read_html(StringIO(soup), header=0)
-    df = dfs[4]
-    instances = df["Instancia"].tolist()
-    types = df["Tipo"].tolist()
-    return instances, types
+def _alumnos_de_pagina(
+    pagina: Dict[str, Any], indices: Tuple[int, int]
+) -> pd.DataFrame:
+    """Extrae la tabla de alumnos probando los índices de tabla indicados en orden."""
+    if pagina["sin_datos"]:
+        return pd.DataFrame()
+    for idx in indices:
+        try:
+            tab = pagina["tablas"][idx].copy()
+            tab.columns = tab.iloc[0, :]
+            return tab.drop(0)
+        except Exception:
+            continue
+    raise SinTabla("No se pudo leer la tabla de alumnos")
 
 
-def get_statuses(browser):
-    col = browser.find_elements(By.XPATH, '//*[@class=" ei-cuadro-fila col-cen-s1"]')
-    res = []
-    for cell in col:
-        status = cell.get_attribute("innerHTML")
-        if "rojo.png" in status:
-            res.append("Acta Cerrada")
-        elif "verde.png" in status:
-            res.append("Acta Abierta")
-        elif "azul.png" in status:
-            res.append("Acta Anulada")
-        else:
-            raise ValueError(f"No se pudo determinar el estado del acta: {status}")
-    return res
+def armar_acta(tabs: List[pd.DataFrame], info: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Une las páginas de alumnos de un acta y les agrega la información general.
 
+    Args:
+        tabs: Tablas de alumnos de cada página del acta.
+        info: Información general del acta.
 
-def acta_generator_com(
-    browser: webdriver.Firefox,
-    acta_obj: Any,
-    acta_status: str,
-    acta_instance: str,
-    acta_type: str,
-    timeout: int = 15,
-    residual_timeout: int = 1,
-) -> Union[Tuple[pd.DataFrame, str], str]:
+    Returns:
+        DataFrame con una fila por alumno y las columnas de `info` al final. `info`
+        queda también en `attrs["info"]` (ver `acumulador.Acumulador`).
     """
-    Genera un acta a partir de un objeto acta, recopilando la información general y la de los alumnos a lo largo de las páginas.
+    tab = pd.concat(tabs, ignore_index=True)
+    tab["Nº"] = tab.index + 1
+    # Todas las columnas de info de una vez, en lugar de una asignación por columna
+    tab = pd.concat([tab, pd.DataFrame(info, index=tab.index)], axis=1)
+    tab.attrs["info"] = dict(info)
+    return tab
+
+
+def acta_de_htmls(
+    htmls: List[str], reporte: Reporte, datos: Optional[Dict[str, Any]] = None
+) -> Tuple[pd.DataFrame, str]:
+    """
+    Arma un acta a partir del HTML ya obtenido de sus páginas (por ejemplo, de la caché).
 
     Args:
-        browser: Instancia del navegador.
-        acta_obj: Elemento que representa el acta a procesar.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        htmls: HTML de la página del acta y de cada página de alumnos, en orden.
+        reporte: Reporte al que pertenece el acta (ver `reportes`).
+        datos: Datos del acta tomados del listado (ver `generar_acta`).
 
     Returns:
-        Una tupla (DataFrame con la información consolidada, actividad) o un string de error.
+        Tupla (DataFrame con la información consolidada, actividad).
     """
+    paginas = [parse_pagina(html) for html in htmls]
+    info = info_acta(paginas[0], reporte, datos)
+    tabs = [alumnos_acta(p, reporte) for p in paginas]
+    return armar_acta(tabs, info), info["Actividad"]
 
-    acta_obj.click()
-    WebDriverWait(browser, timeout).until(
-        EC.element_to_be_clickable((By.XPATH, '//*[@id="ci_34000146_cancelar"]'))
-    )
-    try:
-        soup = BeautifulSoup(browser.page_source, "html.parser")
-        info = general_info_com(soup, timeout, residual_timeout)
-        tabs = [tab_alumnos_com(soup, timeout, residual_timeout)]
-    except Exception:
-        try:
-            time.sleep(timeout)
-            soup = BeautifulSoup(browser.page_source, "html.parser")
-            info = general_info_com(soup, timeout, residual_timeout)
-            tabs = [tab_alumnos_com(soup, timeout, residual_timeout)]
-        except Exception:
-            time.sleep(timeout)
-            info = general_info_com(soup, timeout, residual_timeout)
-
-            back = browser.find_element(By.XPATH, '//*[@id="ci_34000146_cancelar"]')
-            back.click()
-            time.sleep(residual_timeout)
-            try:
-                return "Error en acta", info["Actividad"]
-            except:
-                return "Error en acta", "Act. no encontrada"
-    info["Estado"] = acta_status
-    info["Instancia"] = acta_instance
-    info["Tipo"] = acta_type
-    try:
-        n_pages = int(
-            browser.find_element(
-                By.XPATH,
-                '//*[@id="cuerpo_js_cuadro_34000148_cuadro_alumnos"]/tbody/tr[4]/td/div/strong[2]',
-            ).text
-        )
-    except exceptions.NoSuchElementException:
-        n_pages = 1
 
-    for _ in range(1, n_pages):
-        next_page(browser, residual_timeout)
-        # WebDriverWait(browser, timeout).until(
-        #     EC.element_to_be_clickable((By.XPATH, '//*[@id="ci_34000146_cancelar"]'))
-        # )
-        soup = BeautifulSoup(browser.page_source, "html.parser")
-        tabs.append(tab_alumnos_com(soup, timeout, residual_timeout))
+def datos_listado(
+    acta_status: str, acta_instance: str, acta_type: str
+) -> Dict[str, Any]:
+    """Datos de un acta de comisión que se toman del listado (ver `generar_acta`)."""
+    return {"Estado": acta_status, "Instancia": acta_instance, "Tipo": acta_type}
 
-    tab = pd.concat(tabs, ignore_index=True)
-    tab["Nº"] = tab.index + 1
-    old_cols = tab.columns.to_list()
-
-    for col, val in info.items():
-        tab[col] = val
-    old_cols.extend(info.keys())
-    tab = tab[old_cols]
-    back = browser.find_element(By.XPATH, '//*[@id="ci_34000146_cancelar"]')
-    back.click()
-    time.sleep(residual_timeout)
-    return tab, info["Actividad"]
 
+def _identidad_de_celdas(celdas: List[Tuple[str, List[str]]]) -> str:
+    """
+    Texto que identifica una fila a partir del texto e imágenes de sus celdas.
 
-def general_info_com(
-    soup: BeautifulSoup, timeout: int = 15, residual_timeout: int = 1
+    Se usan el texto y los íconos (que incluyen el estado del acta) porque, a diferencia
+    de los parámetros de los botones, no cambian de una sesión a otra.
+    """
+    partes = []
+    for texto, imagenes in celdas:
+        iconos = "".join(f"[{src.rsplit('/', 1)[-1]}]" for src in imagenes)
+        partes.append(" ".join(texto.split()) + iconos)
+    return "|".join(partes)
+
+
+def identidades_filas(page: Union[str, BeautifulSoup, Dict[str, Any]]) -> List[str]:
+    """
+    Identifica las filas de los botones `ei-boton-fila` de una página, como `filas_listado`.
+
+    Args:
+        page: HTML de la página, BeautifulSoup o página ya parseada con `parse_pagina`.
+
+    Returns:
+        Texto que identifica a cada fila, en el orden de los botones.
+    """
+    identidades = []
+    for boton in _as_pagina(page)["soup"].find_all(class_="ei-boton-fila"):
+        fila = boton.find_parent("tr")
+        celdas = fila.find_all(["td", "th"], recursive=False) if fila else []
+        identidades.append(
+            _identidad_de_celdas(
+                [
+                    (
+                        celda.get_text(),
+                        [img.get("src", "") for img in celda.find_all("img")],
+                    )
+                    for celda in celdas
+                ]
+            )
+        )
+    return identidades
+
+
+def info_acta(
+    soup: Union[BeautifulSoup, Dict[str, Any]],
+    reporte: Reporte,
+    datos: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Extrae la información general del acta a partir del HTML.
 
     Args:
-        soup: Objeto BeautifulSoup del HTML de la página.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        soup: Objeto BeautifulSoup del HTML de la página o página ya parseada con `parse_pagina`.
+        reporte: Reporte al que pertenece el acta (ver `reportes`).
+        datos: Datos del acta tomados del listado, que reemplazan a los de la página.
 
     Returns:
         Diccionario con la información general extraída.
     """
-    tab = pd.read_html(StringIO(soup.prettify()))[1]
-    info: Dict[str, Any] = {}
-    tab_info = tab.iloc[0:5]
-    for row in tab_info.iterrows():
-        info[row[1][0]] = row[1][1]
-        info[row[1][2]] = row[1][3]
-        info[row[1][4]] = row[1][5]
-    for i in range(10):
-        try:
-            info.pop(str(i))
-        except Exception:
-            pass
-    info.pop("Fecha", None)
+    tablas = _as_pagina(soup)["tablas"]
+    if len(tablas) < 2:
+        raise SinTabla("La página no tiene la tabla de información del acta")
+    info = _info_de_tabla(tablas[1], reporte.filas_info)
     info.pop(np.nan, None)
+    if datos is not None:
+        info.update(datos)
     return info
 
 
-def tab_alumnos(
-    soup: BeautifulSoup, timeout: int = 15, residual_timeout: int = 1
-) -> pd.DataFrame:
+def get_instance(
+    browser: Optional[webdriver.Firefox], pagina: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], List[str]]:
     """
-    Extrae la información de los alumnos de una sola página.
+    Lee las columnas Instancia y Tipo del listado de actas de una comisión.
 
     Args:
-        soup: Objeto BeautifulSoup del HTML de la página.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        browser: Instancia del navegador.
+        pagina: Página ya parseada con `parse_pagina`; si es None, se parsea `browser.page_source`.
 
     Returns:
-        DataFrame con la información de los alumnos.
+        Tupla (instancias, tipos) en el orden del listado.
     """
-    try:
-        if "No hay datos cargados" in soup.prettify():
-            return pd.DataFrame()
-        tab = pd.read_html(StringIO(soup.prettify()))[7]
-        tab.columns = tab.iloc[0, :]
-        tab = tab.drop(0)
-    except Exception:
-        time.sleep(timeout)
-        try:
-            tab = pd.read_html(StringIO(soup.prettify()))[6]
-            tab.columns = tab.iloc[0, :]
-            tab = tab.drop(0)
-        except Exception:
-            raise ValueError("No se pudo leer la tabla de alumnos")
-    return tab
+    if pagina is None:
+        pagina = parse_pagina(leer_html(browser))
+    if len(pagina["tablas"]) < 5:
+        raise SinTabla("La página no tiene la tabla de instancias del listado")
+    df = pagina["tablas"][4]
+    if "Instancia" not in df.columns:
+        df = df.drop(0).set_axis(df.iloc[0, :].tolist(), axis=1)
+    instances = df["Instancia"].tolist()
+    types = df["Tipo"].tolist()
+    return instances, types
 
 
-def tab_alumnos_com(
-    soup: BeautifulSoup, timeout: int = 15, residual_timeout: int = 1
+def _estado_de_celda(status: str) -> str:
+    """Traduce el ícono de la celda de estado del listado al estado del acta."""
+    if "rojo.png" in status:
+        return "Acta Cerrada"
+    elif "verde.png" in status:
+        return "Acta Abierta"
+    elif "azul.png" in status:
+        return "Acta Anulada"
+    raise ValueError(f"No se pudo determinar el estado del acta: {status}")
+
+
+def get_statuses(browser):
+    col = browser.find_elements(By.XPATH, '//*[@class=" ei-cuadro-fila col-cen-s1"]')
+    return [_estado_de_celda(cell.get_attribute("innerHTML")) for cell in col]
+
+
+def parse_estados(page: Union[str, BeautifulSoup, Dict[str, Any]]) -> List[str]:
+    """
+    Lee los estados de las actas del listado a partir del HTML, como `get_statuses`.
+
+    Args:
+        page: HTML de la página, BeautifulSoup o página ya parseada con `parse_pagina`.
+
+    Returns:
+        Lista con el estado de cada acta del listado.
+    """
+    celdas = _as_pagina(page)["soup"].find_all(
+        lambda tag: tag.get("class") == ["ei-cuadro-fila", "col-cen-s1"]
+    )
+    return [_estado_de_celda(celda.decode_contents()) for celda in celdas]
+
+
+# Botones de las filas del listado con las celdas de su fila (texto, imágenes y clase) y
+# los títulos de las columnas de su cuadro, todo en un solo pedido al navegador
+_JS_FILAS_LISTADO = """
+return Array.from(document.querySelectorAll('.ei-boton-fila')).map(function (boton) {
+    var fila = boton.closest('tr');
+    var tabla = fila ? fila.closest('table') : null;
+    var titulo = tabla ? tabla.querySelector('.ei-cuadro-col-tit') : null;
+    var encabezado = titulo ? titulo.closest('tr') : null;
+    return [
+        boton,
+        Array.from(fila ? fila.cells : []).map(function (celda) {
+            return [celda.textContent, Array.from(celda.querySelectorAll('img')).map(
+                function (img) { return img.getAttribute('src') || ''; }),
+                celda.className];
+        }),
+        Array.from(encabezado ? encabezado.cells : []).map(function (celda) {
+            return celda.textContent;
+        }),
+    ];
+});
+"""
+
+
+def _fila_listado(
+    boton: Any, celdas: List[Tuple[str, List[str], str]], encabezado: List[str]
+) -> Dict[str, Any]:
+    """Arma los datos de una fila del listado a partir de sus celdas (ver `filas_listado`)."""
+    columnas: Dict[str, str] = {}
+    if len(encabezado) == len(celdas):
+        for titulo, (texto, _, _) in zip(encabezado, celdas):
+            titulo = " ".join(titulo.split())
+            if titulo:
+                columnas[titulo] = " ".join(texto.split())
+
+    # La celda de estado es la del ícono, como en `get_statuses`
+    estado = None
+    for _, imagenes, clase in celdas:
+        if "col-cen-s1" in clase.split() and imagenes:
+            estado = _estado_de_celda(" ".join(imagenes))
+            break
+
+    return {
+        "boton": boton,
+        "identidad": _identidad_de_celdas([(t, i) for t, i, _ in celdas]),
+        "estado": estado,
+        "instancia": columnas.get("Instancia"),
+        "tipo": columnas.get("Tipo"),
+        "actividad": columnas.get("Actividad"),
+        "columnas": columnas,
+    }
+
+
+def filas_listado(browser: webdriver.Firefox) -> List[Dict[str, Any]]:
+    """
+    Lee todas las filas del listado actual en un solo pedido al navegador.
+
+    Reemplaza buscar los botones, leer cada celda de estado (`get_statuses`), parsear la
+    página entera para Instancia y Tipo (`get_instance`) e identificar cada fila, que
+    cuestan un pedido por fila o una copia de la página.
+
+    Args:
+        browser: Instancia del navegador.
+
+    Returns:
+        Una entrada por botón `ei-boton-fila`, en orden, con el botón (`boton`), la
+        identidad de la fila (`identidad`: el texto y los íconos de sus celdas, igual
+        entre sesiones y que `identidades_filas` sobre el HTML), el estado del acta
+        (`estado`, None si la fila no tiene ícono de estado), `instancia`, `tipo` y
+        `actividad` (None si el cuadro no tiene esa columna) y el texto de cada
+        columna por título (`columnas`).
+    """
+    with medir("filas_listado"):
+        filas = browser.execute_script(_JS_FILAS_LISTADO)
+    return [_fila_listado(*fila) for fila in filas]
+
+
+def alumnos_acta(
+    soup: Union[BeautifulSoup, Dict[str, Any]], reporte: Reporte
 ) -> pd.DataFrame:
     """
     Extrae la información de los alumnos de una sola página.
 
     Args:
-        soup: Objeto BeautifulSoup del HTML de la página.
-        timeout: Tiempo máximo de espera en segundos.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        soup: Objeto BeautifulSoup del HTML de la página o página ya parseada con `parse_pagina`.
+        reporte: Reporte al que pertenece el acta (ver `reportes`).
 
     Returns:
         DataFrame con la información de los alumnos.
     """
-    try:
-        if "No hay datos cargados" in soup.prettify():
-            return pd.DataFrame()
-        tab = pd.read_html(StringIO(soup.prettify()))[5]
-        tab.columns = tab.iloc[0, :]
-        tab = tab.drop(0)
-    except Exception:
-        time.sleep(timeout)
-        try:
-            tab = pd.read_html(StringIO(soup.prettify()))[4]
-            tab.columns = tab.iloc[0, :]
-            tab = tab.drop(0)
-        except Exception:
-            raise ValueError("No se pudo leer la tabla de alumnos")
-    return tab
+    return _alumnos_de_pagina(_as_pagina(soup), reporte.tablas_alumnos)
 
 
 def next_page(browser: webdriver.Firefox, residual_timeout: int = 1) -> None:
@@ -731,7 +1313,7 @@ def next_page(browser: webdriver.Firefox, residual_timeout: int = 1) -> None:
 
     Args:
         browser: Instancia del navegador.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     obj = browser.find_element(
         By.XPATH, '//*[@src="/toba_2.6/img/nucleo/paginacion/siguiente.gif?av=3.3.26"]'
@@ -760,7 +1342,7 @@ def next_page(browser: webdriver.Firefox, residual_timeout: int = 1) -> None:
         )
     except exceptions.TimeoutException:
         ...
-    time.sleep(residual_timeout)
+    esperar_respuesta(browser, residual_timeout)
 
 
 def prev_page(browser: webdriver.Firefox, residual_timeout: int = 1) -> None:
@@ -769,7 +1351,7 @@ def prev_page(browser: webdriver.Firefox, residual_timeout: int = 1) -> None:
 
     Args:
         browser: Instancia del navegador.
-        residual_timeout: Tiempo de espera adicional después de interactuar.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
     """
     obj = browser.find_element(
         By.XPATH, '//*[@src="/toba_2.6/img/nucleo/paginacion/anterior.gif?av=3.3.26"]'
@@ -795,4 +1377,330 @@ def prev_page(browser: webdriver.Firefox, residual_timeout: int = 1) -> None:
         )
     except exceptions.TimeoutException:
         ...
-    time.sleep(residual_timeout)
+    esperar_respuesta(browser, residual_timeout)
+
+
+class Paginador:
+    """
+    Paginador de un cuadro Toba que salta directamente a la página pedida.
+
+    En lugar de avanzar o retroceder página por página con `next_page`/`prev_page`,
+    usa el método `ir_a_pagina` del objeto JS del cuadro (o, si no está disponible,
+    el input `<cuadro>__pagina_actual`) para llegar a cualquier página con una sola
+    navegación. Recuerda en qué página quedó el navegador en `actual`.
+
+    Args:
+        browser: Instancia del navegador.
+        cuadro: Id del cuadro Toba, por ejemplo "cuadro_38000496_cuadro_actas".
+        timeout: Tiempo máximo de espera en segundos.
+        residual_timeout: Tiempo máximo de espera a que la página se estabilice después de interactuar.
+        sin_ampliar: Cuadros que ya se sabe que no se pueden ampliar (ver `ampliar`). Se
+            comparte entre los paginadores de una misma corrida y navegador, para no
+            volver a intentarlo en cada acta; por defecto, un conjunto propio.
+    """
+
+    def __init__(
+        self,
+        browser: webdriver.Firefox,
+        cuadro: str,
+        timeout: int = 10,
+        residual_timeout: int = 1,
+        sin_ampliar: Optional[Set[str]] = None,
+    ) -> None:
+        self.browser = browser
+        self.cuadro = cuadro
+        self.timeout = timeout
+        self.residual_timeout = residual_timeout
+        self.sin_ampliar = set() if sin_ampliar is None else sin_ampliar
+        self.actual: Optional[int] = None
+        # Fase con la que se miden los cambios de página
+        self.fase = (
+            "paginacion_alumnos" if "alumnos" in cuadro else "paginacion_listado"
+        )
+
+    def leer_pagina_actual(self) -> Optional[int]:
+        """
+        Lee la página en la que está el cuadro desde el input `__pagina_actual`.
+
+        Returns:
+            Número de página, o None si el cuadro no tiene paginación o no está en pantalla.
+        """
+        try:
+            value = self.browser.find_element(
+                By.ID, f"{self.cuadro}__pagina_actual"
+            ).get_property("value")
+            return int(value)
+        except (
+            exceptions.NoSuchElementException,
+            exceptions.StaleElementReferenceException,
+            TypeError,
+            ValueError,
+        ):
+            return None
+
+    def total_paginas(self) -> int:
+        """
+        Lee la cantidad total de páginas del cuadro.
+
+        Returns:
+            Cantidad de páginas; 1 si el cuadro no tiene paginación.
+        """
+        try:
+            return int(
+                self.browser.find_element(
+                    By.XPATH,
+                    f'//*[@id="cuerpo_js_{self.cuadro}"]/tbody/tr[4]/td/div/strong[2]',
+                ).text
+            )
+        except exceptions.NoSuchElementException:
+            return 1
+
+    def ir_a(self, pagina: int) -> None:
+        """
+        Lleva el cuadro a la página indicada, sin pasar por las intermedias.
+
+        Args:
+            pagina: Número de página (empezando en 1).
+        """
+        actual = self.leer_pagina_actual()
+        if actual is None and pagina == 1:
+            # Cuadro sin paginación: siempre estamos en la primera página
+            self.actual = 1
+            return
+        if actual == pagina:
+            self.actual = pagina
+            return
+        with medir(self.fase):
+            if not (self._saltar_js(pagina) and self._esperar(pagina)):
+                if not (self._saltar_input(pagina) and self._esperar(pagina)):
+                    self._recorrer(pagina)
+            self.actual = pagina
+            esperar_respuesta(self.browser, self.residual_timeout)
+
+    def ampliar(self) -> bool:
+        """
+        Intenta que el cuadro muestre todas sus filas (o más por página), para recorrer
+        menos páginas (ver `ampliacion_pagina`).
+
+        Si el cuadro no tiene cómo, o la cantidad de páginas no baja, se recuerda en
+        `sin_ampliar` y no se vuelve a intentar con ese cuadro.
+
+        Returns:
+            True si ahora el cuadro tiene menos páginas (y está en la primera).
+        """
+        antes = self.total_paginas()
+        if antes <= 1 or self.cuadro in self.sin_ampliar:
+            return False
+        control = ampliacion_pagina(leer_html(self.browser), self.cuadro)
+        if control is not None:
+            with medir(self.fase):
+                try:
+                    if "campo" in control:
+                        Select(
+                            self.browser.find_element(By.NAME, control["campo"])
+                        ).select_by_value(control["valor"])
+                        esperar_respuesta(self.browser, self.residual_timeout)
+                        if self.total_paginas() == antes:
+                            # El select no envía solo: enviarlo con el cambio de página
+                            self._saltar_js(1)
+                    else:
+                        self.browser.execute_script(control["onclick"])
+                    esperar_respuesta(self.browser, self.residual_timeout)
+                except exceptions.WebDriverException:
+                    pass
+            if self.total_paginas() < antes:
+                self.actual = self.leer_pagina_actual() or 1
+                return True
+        self.sin_ampliar.add(self.cuadro)
+        return False
+
+    def siguiente(self) -> None:
+        """Avanza a la página siguiente a la actual."""
+        actual = self.actual or self.leer_pagina_actual() or 1
+        self.ir_a(actual + 1)
+
+    def _saltar_js(self, pagina: int) -> bool:
+        """Pide la página a través del objeto JS del cuadro."""
+        try:
+            return bool(
+                self.browser.execute_script(
+                    """
+                    var cuadro = arguments[0], pagina = arguments[1];
+                    var candidatos = [window["js_" + cuadro], window[cuadro]];
+                    for (var i = 0; i < candidatos.length; i++) {
+                        var obj = candidatos[i];
+                        if (obj && typeof obj.ir_a_pagina === "function") {
+                            obj.ir_a_pagina(pagina);
+                            return true;
+                        }
+                    }
+                    return false;
+                    """,
+                    self.cuadro,
+                    pagina,
+                )
+            )
+        except exceptions.WebDriverException:
+            return False
+
+    def _saltar_input(self, pagina: int) -> bool:
+        """Escribe la página en el input `__pagina_actual` y la confirma con Enter."""
+        try:
+            box = self.browser.find_element(By.ID, f"{self.cuadro}__pagina_actual")
+            box.clear()
+            box.send_keys(str(pagina) + Keys.ENTER)
+            return True
+        except exceptions.WebDriverException:
+            return False
+
+    def _esperar(self, pagina: int) -> bool:
+        """Espera a que el cuadro muestre la página indicada."""
+        try:
+            WebDriverWait(self.browser, self.timeout).until(
+                lambda _: self.leer_pagina_actual() == pagina
+            )
+            return True
+        except exceptions.TimeoutException:
+            return False
+
+    def _recorrer(self, pagina: int) -> None:
+        """Último recurso: llega a la página avanzando o retrocediendo de a una."""
+        actual = self.leer_pagina_actual() or 1
+        while actual != pagina:
+            if actual < pagina:
+                next_page(self.browser, self.residual_timeout)
+            else:
+                prev_page(self.browser, self.residual_timeout)
+            nueva = self.leer_pagina_actual()
+            if nueva is None or nueva == actual:
+                raise ValueError(
+                    f"No se pudo llegar a la página {pagina} de {self.cuadro}"
+                )
+            actual = nueva
+
+
+# --- Nombres anteriores ---
+# Atajos por reporte de las funciones genéricas, que reciben el `Reporte`. Solo quedan
+# por compatibilidad con código que los importe; el motor no los usa.
+
+
+def filtrar_año(
+    browser: webdriver.Firefox,
+    input_text: Optional[str] = None,
+    timeout: int = 10,
+    residual_timeout: int = 1,
+) -> Tuple[str, str]:
+    """`_filtrar_año` del reporte de exámenes."""
+    return _filtrar_año(browser, EXAMENES, input_text, timeout, residual_timeout)
+
+
+def filtrar_llamado(
+    browser: webdriver.Firefox,
+    input_text: Optional[str] = None,
+    timeout: int = 10,
+    residual_timeout: int = 1,
+) -> Tuple[str, str]:
+    """`_filtrar_segundo` del reporte de exámenes."""
+    return _filtrar_segundo(browser, EXAMENES, input_text, timeout, residual_timeout)
+
+
+def ejecutar_filtro(
+    browser: webdriver.Firefox, timeout: int = 10, residual_timeout: int = 1
+) -> None:
+    """`_ejecutar_filtro` del reporte de exámenes."""
+    _ejecutar_filtro(browser, EXAMENES, timeout, residual_timeout)
+
+
+def filtrar_año_com(
+    browser: webdriver.Firefox,
+    input_text: Optional[str] = None,
+    timeout: int = 10,
+    residual_timeout: int = 1,
+) -> Tuple[str, str]:
+    """`_filtrar_año` del reporte de comisiones."""
+    return _filtrar_año(browser, COMISIONES, input_text, timeout, residual_timeout)
+
+
+def filtrar_periodo_com(
+    browser: webdriver.Firefox,
+    input_text: Optional[str] = None,
+    timeout: int = 10,
+    residual_timeout: int = 1,
+) -> Tuple[str, str]:
+    """`_filtrar_segundo` del reporte de comisiones."""
+    return _filtrar_segundo(browser, COMISIONES, input_text, timeout, residual_timeout)
+
+
+def ejecutar_filtro_com(
+    browser: webdriver.Firefox, timeout: int = 10, residual_timeout: int = 1
+) -> None:
+    """`_ejecutar_filtro` del reporte de comisiones."""
+    _ejecutar_filtro(browser, COMISIONES, timeout, residual_timeout)
+
+
+def acta_generator(
+    browser: webdriver.Firefox,
+    acta_obj: Any,
+    timeout: int = 15,
+    residual_timeout: int = 1,
+    cache: Optional[Any] = None,
+    clave: Optional[str] = None,
+) -> Union[Tuple[pd.DataFrame, str], str]:
+    """`generar_acta` del reporte de exámenes."""
+    return generar_acta(
+        browser, acta_obj, EXAMENES, None, timeout, residual_timeout, cache, clave
+    )
+
+
+def acta_generator_com(
+    browser: webdriver.Firefox,
+    acta_obj: Any,
+    acta_status: str,
+    acta_instance: str,
+    acta_type: str,
+    timeout: int = 15,
+    residual_timeout: int = 1,
+    cache: Optional[Any] = None,
+    clave: Optional[str] = None,
+) -> Union[Tuple[pd.DataFrame, str], str]:
+    """`generar_acta` del reporte de comisiones, con los datos del listado."""
+    datos = datos_listado(acta_status, acta_instance, acta_type)
+    return generar_acta(
+        browser, acta_obj, COMISIONES, datos, timeout, residual_timeout, cache, clave
+    )
+
+
+def general_info(
+    soup: Union[BeautifulSoup, Dict[str, Any]],
+    timeout: int = 15,
+    residual_timeout: int = 1,
+) -> Dict[str, Any]:
+    """`info_acta` del reporte de exámenes."""
+    return info_acta(soup, EXAMENES)
+
+
+def general_info_com(
+    soup: Union[BeautifulSoup, Dict[str, Any]],
+    timeout: int = 15,
+    residual_timeout: int = 1,
+) -> Dict[str, Any]:
+    """`info_acta` del reporte de comisiones."""
+    return info_acta(soup, COMISIONES)
+
+
+def tab_alumnos(
+    soup: Union[BeautifulSoup, Dict[str, Any]],
+    timeout: int = 15,
+    residual_timeout: int = 1,
+) -> pd.DataFrame:
+    """`alumnos_acta` del reporte de exámenes."""
+    return alumnos_acta(soup, EXAMENES)
+
+
+def tab_alumnos_com(
+    soup: Union[BeautifulSoup, Dict[str, Any]],
+    timeout: int = 15,
+    residual_timeout: int = 1,
+) -> pd.DataFrame:
+    """`alumnos_acta` del reporte de comisiones."""
+    return alumnos_acta(soup, COMISIONES)
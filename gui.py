@@ -1,25 +1,33 @@
 import os
-import time
 import threading
-import funcs as fx
-from examenes import main
-from selenium import webdriver
-from selenium.common import exceptions
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.firefox.options import Options
-from webdriver_manager.firefox import GeckoDriverManager
-from tqdm import tqdm
-from IPython.display import clear_output
-from bs4 import BeautifulSoup
-from io import StringIO
-import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from typing import Any, Dict, Optional
+
+# El scraper (selenium, pandas...) se importa recién al iniciar el scraping, así la
+# ventana aparece enseguida
+import progreso
+from opciones import PERFILES
+
+# Cada cuánto se actualiza el tablero (ms)
+INTERVALO_TABLERO = 500
+
+# Corrida en curso: su progreso y lo que deja el thread al terminar. El thread del
+# scraping nunca toca la interfaz; el tablero lo lee desde el thread de Tk.
+corrida: Dict[str, Any] = {
+    "progreso": None,
+    "thread": None,
+    "error": None,
+    "errores_mostrados": 0,
+}
+
+
+def _formato_tiempo(segundos: Optional[float]) -> str:
+    """Duración como h:mm:ss ("-" si no se sabe todavía)."""
+    if segundos is None:
+        return "-"
+    segundos = int(segundos)
+    return f"{segundos // 3600}:{segundos // 60 % 60:02d}:{segundos % 60:02d}"
 
 
 # --- Interfaz gráfica con Tkinter ---
@@ -28,6 +36,8 @@ def start_scraping():
     año = entry_año.get()
     llamado = entry_llamado.get()
     residual_timeout = entry_timeout.get()
+    perfil = var_perfil.get()
+    output_folder = entry_output.get() or os.getcwd()
 
     if not os.path.exists(credentials_file):
         messagebox.showerror("Error", "El archivo de credenciales no existe.")
@@ -45,20 +55,81 @@ def start_scraping():
         messagebox.showerror("Error", "El tiempo residual debe ser un número.")
         return
 
+    os.makedirs(output_folder, exist_ok=True)
     btn_start.config(state="disabled")
+    btn_cancel.config(state="normal")
     lbl_status.config(text="Scraping iniciado...")
+    lst_errores.delete(0, tk.END)
+
+    corrida["progreso"] = progreso.Progreso()
+    corrida["error"] = None
+    corrida["errores_mostrados"] = 0
+    progreso.activar(corrida["progreso"])
 
     def run_thread():
+        # Sin tocar la interfaz: el resultado queda en `corrida` para el tablero
         try:
-            main(credentials_file, año_val, llamado, timeout_val)
-            lbl_status.config(text="Scraping completado. Archivo examenes.csv creado.")
+            from examenes import main
+
+            main(
+                credentials_file,
+                año_val,
+                llamado or None,
+                timeout_val,
+                perfil=perfil,
+                output_folder=output_folder,
+                devolver=False,
+            )
         except Exception as e:
-            lbl_status.config(text=f"Error: {e}")
-        finally:
-            btn_start.config(state="normal")
+            corrida["error"] = e
+
+    corrida["thread"] = threading.Thread(target=run_thread, daemon=True)
+    corrida["thread"].start()
+    root.after(INTERVALO_TABLERO, update_dashboard)
+
+
+def cancel_scraping():
+    if corrida["progreso"] is not None:
+        corrida["progreso"].cancelar()
+        btn_cancel.config(state="disabled")
+        lbl_status.config(text="Cancelando: se termina el acta actual...")
+
+
+def update_dashboard():
+    # Corre en el thread de Tk y vuelve a programarse mientras dure la corrida
+    estado = corrida["progreso"].estado()
+    lbl_filtro.config(text=estado["filtro"] or "-")
+    lbl_paginas.config(text=f"{estado['paginas_hechas']} de {estado['paginas']}")
+    ultima = f" (última: {estado['ultima']})" if estado["ultima"] else ""
+    lbl_actas.config(text=f"{estado['actas']}{ultima}")
+    lbl_ritmo.config(text=f"{estado['actas_por_minuto']:.1f}")
+    lbl_tiempo.config(
+        text=f"{_formato_tiempo(estado['transcurrido'])} "
+        f"(faltan {_formato_tiempo(estado['eta'])})"
+    )
+    lbl_n_errores.config(text=f"Errores recientes ({estado['n_errores']} en total):")
+    if estado["n_errores"] != corrida["errores_mostrados"]:
+        corrida["errores_mostrados"] = estado["n_errores"]
+        lst_errores.delete(0, tk.END)
+        for mensaje in estado["errores"]:
+            lst_errores.insert(tk.END, mensaje)
+
+    if corrida["thread"].is_alive():
+        root.after(INTERVALO_TABLERO, update_dashboard)
+        return
 
-    t = threading.Thread(target=run_thread)
-    t.start()
+    progreso.activar(None)
+    btn_start.config(state="normal")
+    btn_cancel.config(state="disabled")
+    carpeta = entry_output.get() or os.getcwd()
+    if corrida["error"] is not None:
+        lbl_status.config(text=f"Error: {corrida['error']}")
+    elif estado["cancelado"]:
+        lbl_status.config(
+            text=f"Cancelado. Lo extraído hasta el acta actual quedó en {carpeta}."
+        )
+    else:
+        lbl_status.config(text=f"Scraping completado. Salida en {carpeta}.")
 
 
 def select_file():
@@ -68,45 +139,92 @@ def select_file():
         entry_credentials.insert(0, filename)
 
 
-# Crear ventana principal
-root = tk.Tk()
-root.title("Scraping de Actas")
-
-frame = tk.Frame(root, padx=10, pady=10)
-frame.pack()
-
-# Archivo de credenciales
-lbl_credentials = tk.Label(frame, text="Archivo de credenciales:")
-lbl_credentials.grid(row=0, column=0, sticky="e")
-entry_credentials = tk.Entry(frame, width=50)
-entry_credentials.grid(row=0, column=1)
-btn_browse = tk.Button(frame, text="Examinar", command=select_file)
-btn_browse.grid(row=0, column=2, padx=5)
-
-# Año
-lbl_año = tk.Label(frame, text="Año:")
-lbl_año.grid(row=1, column=0, sticky="e")
-entry_año = tk.Entry(frame)
-entry_año.grid(row=1, column=1)
-
-# Llamado
-lbl_llamado = tk.Label(frame, text="Llamado:")
-lbl_llamado.grid(row=2, column=0, sticky="e")
-entry_llamado = tk.Entry(frame)
-entry_llamado.grid(row=2, column=1)
-
-# Tiempo residual
-lbl_timeout = tk.Label(frame, text="Tiempo residual:")
-lbl_timeout.grid(row=3, column=0, sticky="e")
-entry_timeout = tk.Entry(frame)
-entry_timeout.grid(row=3, column=1)
-
-# Botón de inicio
-btn_start = tk.Button(frame, text="Iniciar Scraping", command=start_scraping)
-btn_start.grid(row=4, column=0, columnspan=3, pady=10)
-
-# Etiqueta de estado
-lbl_status = tk.Label(frame, text="Estado: Esperando...")
-lbl_status.grid(row=5, column=0, columnspan=3)
-
-root.mainloop()
+def select_folder():
+    folder = filedialog.askdirectory(title="Seleccionar carpeta de salida")
+    if folder:
+        entry_output.delete(0, tk.END)
+        entry_output.insert(0, folder)
+
+
+if __name__ == "__main__":
+    # Crear ventana principal
+    root = tk.Tk()
+    root.title("Scraping de Actas")
+
+    frame = tk.Frame(root, padx=10, pady=10)
+    frame.pack()
+
+    # Archivo de credenciales
+    lbl_credentials = tk.Label(frame, text="Archivo de credenciales:")
+    lbl_credentials.grid(row=0, column=0, sticky="e")
+    entry_credentials = tk.Entry(frame, width=50)
+    entry_credentials.grid(row=0, column=1)
+    btn_browse = tk.Button(frame, text="Examinar", command=select_file)
+    btn_browse.grid(row=0, column=2, padx=5)
+
+    # Año
+    lbl_año = tk.Label(frame, text="Año:")
+    lbl_año.grid(row=1, column=0, sticky="e")
+    entry_año = tk.Entry(frame)
+    entry_año.grid(row=1, column=1)
+
+    # Llamado
+    lbl_llamado = tk.Label(frame, text="Llamado:")
+    lbl_llamado.grid(row=2, column=0, sticky="e")
+    entry_llamado = tk.Entry(frame)
+    entry_llamado.grid(row=2, column=1)
+
+    # Tiempo residual
+    lbl_timeout = tk.Label(frame, text="Tiempo residual:")
+    lbl_timeout.grid(row=3, column=0, sticky="e")
+    entry_timeout = tk.Entry(frame)
+    entry_timeout.grid(row=3, column=1)
+
+    # Perfil del navegador
+    lbl_perfil = tk.Label(frame, text="Perfil del navegador:")
+    lbl_perfil.grid(row=4, column=0, sticky="e")
+    var_perfil = tk.StringVar(value="normal")
+    opt_perfil = tk.OptionMenu(frame, var_perfil, *PERFILES)
+    opt_perfil.grid(row=4, column=1, sticky="w")
+
+    # Carpeta de salida (ahí queda lo extraído aunque se cancele)
+    lbl_output = tk.Label(frame, text="Carpeta de salida:")
+    lbl_output.grid(row=5, column=0, sticky="e")
+    entry_output = tk.Entry(frame, width=50)
+    entry_output.insert(0, os.getcwd())
+    entry_output.grid(row=5, column=1)
+    btn_output = tk.Button(frame, text="Examinar", command=select_folder)
+    btn_output.grid(row=5, column=2, padx=5)
+
+    # Botones de inicio y cancelación
+    botones = tk.Frame(frame)
+    botones.grid(row=6, column=0, columnspan=3, pady=10)
+    btn_start = tk.Button(botones, text="Iniciar Scraping", command=start_scraping)
+    btn_start.pack(side="left", padx=5)
+    btn_cancel = tk.Button(
+        botones, text="Cancelar", command=cancel_scraping, state="disabled"
+    )
+    btn_cancel.pack(side="left", padx=5)
+
+    # Tablero de avance
+    tablero = tk.LabelFrame(frame, text="Avance", padx=5, pady=5)
+    tablero.grid(row=7, column=0, columnspan=3, sticky="we")
+    filas_tablero = []
+    for fila, texto in enumerate(
+        ("Filtro:", "Páginas:", "Actas:", "Actas por minuto:", "Tiempo:")
+    ):
+        tk.Label(tablero, text=texto).grid(row=fila, column=0, sticky="e")
+        valor = tk.Label(tablero, text="-", anchor="w")
+        valor.grid(row=fila, column=1, sticky="w")
+        filas_tablero.append(valor)
+    lbl_filtro, lbl_paginas, lbl_actas, lbl_ritmo, lbl_tiempo = filas_tablero
+    lbl_n_errores = tk.Label(tablero, text="Errores recientes:")
+    lbl_n_errores.grid(row=5, column=0, columnspan=2, sticky="w")
+    lst_errores = tk.Listbox(tablero, height=5, width=70)
+    lst_errores.grid(row=6, column=0, columnspan=2, sticky="we")
+
+    # Etiqueta de estado
+    lbl_status = tk.Label(frame, text="Estado: Esperando...")
+    lbl_status.grid(row=8, column=0, columnspan=3)
+
+    root.mainloop()
@@ -0,0 +1,177 @@
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Fases que se miden, en el orden en que se muestran
+FASES = (
+    "login",
+    "menu",
+    "filtro",
+    "paginacion_listado",
+    "filas_listado",
+    "abrir_comision",
+    "acta",
+    "cache",
+    "abrir_acta",
+    "page_source",
+    "parse",
+    "espera_parseo",
+    "paginacion_alumnos",
+    "volver",
+    "relogin",
+    "reintento",
+    "circuito",
+)
+
+
+def percentil(valores: List[float], p: float) -> float:
+    """
+    Percentil `p` de una lista ordenada (el valor más cercano por arriba).
+
+    Args:
+        valores: Valores ordenados de menor a mayor (al menos uno).
+        p: Percentil entre 0 y 100.
+
+    Returns:
+        Valor del percentil.
+    """
+    indice = max(0, min(len(valores) - 1, -(-len(valores) * p // 100) - 1))
+    return valores[int(indice)]
+
+
+class Metricas:
+    """
+    Tiempos por fase de una corrida.
+
+    Las funciones de scraping marcan sus fases con `medir`, que registra la duración en
+    las métricas activas (ver `activar`). Al final se resumen en p50/p95 por fase y se
+    exportan a JSON y CSV; opcionalmente cada medición se escribe al momento en un
+    archivo JSON lines para seguir la corrida en vivo.
+
+    Args:
+        vivo: Archivo JSON lines donde escribir cada medición apenas ocurre (opcional).
+    """
+
+    def __init__(self, vivo: Optional[str] = None):
+        self._tiempos: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._vivo = open(vivo, "a", encoding="utf-8") if vivo is not None else None
+
+    def registrar(self, fase: str, segundos: float) -> None:
+        """
+        Registra la duración de una fase.
+
+        Args:
+            fase: Nombre de la fase (ver `FASES`).
+            segundos: Duración en segundos.
+        """
+        with self._lock:
+            self._tiempos.setdefault(fase, []).append(segundos)
+            if self._vivo is not None:
+                registro = {
+                    "fase": fase,
+                    "t": round(time.perf_counter() - self._t0, 4),
+                    "duracion": round(segundos, 4),
+                    "thread": threading.current_thread().name,
+                }
+                self._vivo.write(json.dumps(registro) + "\n")
+                self._vivo.flush()
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resume los tiempos medidos.
+
+        Returns:
+            Diccionario fase -> {"n", "total", "media", "p50", "p95", "max"} (en segundos),
+            en el orden de `FASES` y después las demás.
+        """
+        with self._lock:
+            tiempos = {k: sorted(v) for k, v in self._tiempos.items()}
+        orden = [f for f in FASES if f in tiempos]
+        orden += sorted(f for f in tiempos if f not in FASES)
+        return {
+            fase: {
+                "n": len(tiempos[fase]),
+                "total": sum(tiempos[fase]),
+                "media": sum(tiempos[fase]) / len(tiempos[fase]),
+                "p50": percentil(tiempos[fase], 50),
+                "p95": percentil(tiempos[fase], 95),
+                "max": tiempos[fase][-1],
+            }
+            for fase in orden
+        }
+
+    def exportar(self, base: str) -> None:
+        """
+        Escribe el resumen en `<base>.json` y `<base>.csv`.
+
+        Args:
+            base: Ruta de los archivos, sin extensión.
+        """
+        resumen = self.resumen()
+        duracion = time.perf_counter() - self._t0
+        with open(f"{base}.json", "w", encoding="utf-8") as f:
+            json.dump({"duracion": duracion, "fases": resumen}, f, indent=2)
+        with open(f"{base}.csv", "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["fase", "n", "total", "media", "p50", "p95", "max"])
+            for fase, m in resumen.items():
+                writer.writerow(
+                    [fase, m["n"]]
+                    + [round(m[k], 4) for k in ("total", "media", "p50", "p95", "max")]
+                )
+
+    def cerrar(self) -> None:
+        """Cierra el archivo de mediciones en vivo."""
+        with self._lock:
+            if self._vivo is not None:
+                self._vivo.close()
+                self._vivo = None
+
+
+_activas: Optional[Metricas] = None
+
+
+def activar(metricas: Optional[Metricas]) -> None:
+    """
+    Define las métricas donde registran `medir` (None para dejar de medir).
+
+    Args:
+        metricas: Métricas de la corrida.
+    """
+    global _activas
+    _activas = metricas
+
+
+@contextmanager
+def medir(fase: str) -> Iterator[None]:
+    """
+    Mide la duración del bloque y la registra como `fase` en las métricas activas.
+
+    Si no hay métricas activas no hace nada, así las funciones se pueden usar sueltas.
+
+    Args:
+        fase: Nombre de la fase (ver `FASES`).
+    """
+    metricas = _activas
+    if metricas is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        metricas.registrar(fase, time.perf_counter() - t0)
+
+
+def imprimir(resumen: Dict[str, Dict[str, Any]]) -> None:
+    """Muestra un resumen de `Metricas.resumen` como tabla."""
+    print(f"{'fase':<26}{'n':>6}{'media':>10}{'p50':>10}{'p95':>10}")
+    for fase, m in resumen.items():
+        print(
+            f"{fase:<26}{m['n']:>6}{m['media']:>10.3f}{m['p50']:>10.3f}{m['p95']:>10.3f}"
+        )
@@ -0,0 +1,1283 @@
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+from tqdm import tqdm
+from selenium import webdriver
+from selenium.common import exceptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+import funcs as fx
+from acumulador import Acumulador
+from workers import (
+    PaginasFallidas,
+    ResultadoPaginas,
+    correr_workers,
+    unir_resultados,
+)
+from backend_http import Accion, SesionHTTP, capturar_acta_http, generar_acta_http
+from checkpoint import Checkpoint, filtro_guardado, registrar_resultado
+from salida import SalidaNormalizada, SalidaParticionada, carpetas_particion
+import replay as rp
+from cache import MAX_MB, CacheActas, clave_acta
+from metricas import Metricas, activar, imprimir, medir
+import reintentos as rt
+from reportes import Reporte
+from pipeline import Pipeline, al_final, pool_de_parseo
+from sincronizacion import Instantanea
+import progreso
+from progreso import Cancelado
+
+URL = "https://guarani3-gerencial.guarani.cespi.unlp.edu.ar/guarani/3.11/aplicacion.php"
+
+# Botones de las filas de un cuadro (actas o comisiones)
+_BOTONES_FILA = '//*[@class="ei-boton-fila"]'
+
+
+def abrir_sesion(
+    reporte: Reporte,
+    siu_user: str,
+    siu_pass: str,
+    año: Optional[str] = None,
+    valor: Optional[str] = None,
+    perfil: str = "normal",
+    ampliar: bool = False,
+    carpeta_perfil: Optional[str] = None,
+) -> Tuple[webdriver.Firefox, str, str]:
+    """
+    Abre un navegador, hace el login en SIU y deja el listado del reporte filtrado.
+
+    Args:
+        reporte: Reporte a abrir (ver `reportes`).
+        siu_user: Usuario SIU.
+        siu_pass: Contraseña SIU.
+        año: Año a filtrar (opcional; si es None se pregunta al usuario).
+        valor: Segundo filtro del reporte (opcional; si es None se pregunta al usuario).
+        perfil: Perfil del navegador (ver `fx.PERFILES`).
+        ampliar: Si es True, se pide que el listado muestre todas las filas (ver `entrar`).
+        carpeta_perfil: Carpeta de un perfil de Firefox persistente (opcional, ver
+            `fx.opciones_navegador`).
+
+    Returns:
+        Tupla (navegador, valor del año seleccionado, texto del segundo filtro seleccionado).
+    """
+    browser = fx.abrir_navegador(perfil, carpeta_perfil)
+    año_sel, valor_sel = entrar(
+        browser, reporte, siu_user, siu_pass, año, valor, ampliar
+    )
+    return browser, año_sel, valor_sel
+
+
+def entrar(
+    browser: webdriver.Firefox,
+    reporte: Reporte,
+    siu_user: str,
+    siu_pass: str,
+    año: Optional[str] = None,
+    valor: Optional[str] = None,
+    ampliar: bool = False,
+) -> Tuple[str, str]:
+    """
+    Hace el login en SIU con un navegador ya abierto y deja el listado del reporte filtrado.
+
+    Sirve también para volver a entrar cuando la sesión expira: se cierran las ventanas
+    que abrió el login anterior y se repite todo desde la página de login.
+
+    Args:
+        browser: Instancia del navegador.
+        reporte: Reporte a abrir (ver `reportes`).
+        siu_user: Usuario SIU.
+        siu_pass: Contraseña SIU.
+        año: Año a filtrar (opcional; si es None se pregunta al usuario).
+        valor: Segundo filtro del reporte (opcional; si es None se pregunta al usuario).
+        ampliar: Si es True, después de filtrar se pide que el listado muestre todas
+            las filas, o más por página (ver `fx.Paginador.ampliar`). Cambia qué actas
+            caen en cada página, así que tiene que ser igual en todas las sesiones de la
+            corrida (y en las que la reanuden).
+
+    Returns:
+        Tupla (valor del año seleccionado, texto del segundo filtro seleccionado).
+    """
+    for handle in browser.window_handles[1:]:
+        browser.switch_to.window(handle)
+        browser.close()
+    browser.switch_to.window(browser.window_handles[0])
+    browser.get(URL)
+
+    # Realizar login
+    fx.login_siu(browser, siu_user, siu_pass)
+    browser.switch_to.window(browser.window_handles[1])
+    return abrir_reporte(browser, reporte, año, valor, ampliar)
+
+
+def abrir_reporte(
+    browser: webdriver.Firefox,
+    reporte: Reporte,
+    año: Optional[str] = None,
+    valor: Optional[str] = None,
+    ampliar: bool = False,
+) -> Tuple[str, str]:
+    """
+    Abre el reporte desde el menú y lo filtra, con la sesión ya iniciada.
+
+    Sirve para pasar a otro filtro sin volver a hacer el login (ver `correr_lote`).
+
+    Args:
+        browser: Instancia del navegador, en cualquier página de Guaraní.
+        reporte: Reporte a abrir (ver `reportes`).
+        año: Año a filtrar (opcional; si es None se pregunta al usuario).
+        valor: Segundo filtro del reporte (opcional; si es None se pregunta al usuario).
+        ampliar: Si es True, se pide que el listado muestre todas las filas (ver `entrar`).
+
+    Returns:
+        Tupla (valor del año seleccionado, texto del segundo filtro seleccionado).
+    """
+    with medir("menu"):
+        fx.click_by_xpath(browser, '//*[@id="menu_img"]')
+        fx.write_in_xpath(browser, '//*[@id="buscar_text"]', "Imprimir acta")
+        fx.click_by_xpath(browser, f'//*[@id="{reporte.menu}"]')
+
+    with medir("filtro"):
+        seleccion = fx.filtrar(browser, reporte, año, valor)
+    if ampliar:
+        fx.Paginador(browser, reporte.listado).ampliar()
+    return seleccion
+
+
+def _error(mensaje: str) -> None:
+    """Informa un error en la consola y en el progreso de la corrida (ver `progreso`)."""
+    tqdm.write(mensaje)
+    progreso.error(mensaje)
+
+
+def leer_actas(browser: webdriver.Firefox, reporte: Reporte) -> Dict[str, List[Any]]:
+    """
+    Lee los botones y los datos de las actas del listado abierto.
+
+    Args:
+        browser: Instancia del navegador, parada en un listado de actas.
+        reporte: Reporte del listado (ver `reportes`).
+
+    Returns:
+        Diccionario con las listas `botones`, `identidades`, `estados`, `instancias`,
+        `tipos` y `actividades`, en el orden del listado.
+    """
+    # Botones, estados, instancias y tipos en un solo pedido
+    filas = fx.filas_listado(browser)
+    actas = {
+        "botones": [f["boton"] for f in filas],
+        "identidades": [f["identidad"] for f in filas],
+        "estados": [f["estado"] for f in filas],
+        "instancias": [f["instancia"] for f in filas],
+        "tipos": [f["tipo"] for f in filas],
+        "actividades": [f["actividad"] for f in filas],
+    }
+    if reporte.por_comision:
+        # Estos datos del listado van al acta: si no se pudieron leer, buscarlos aparte
+        if None in actas["estados"]:
+            actas["estados"] = fx.get_statuses(browser)
+        if None in actas["instancias"] or None in actas["tipos"]:
+            # El cuadro no tiene los títulos esperados
+            actas["instancias"], actas["tipos"] = fx.get_instance(browser)
+    return actas
+
+
+def leer_actas_html(pagina: Any, reporte: Reporte) -> Dict[str, List[Any]]:
+    """
+    Lee los datos de las actas de un listado ya descargado, como `leer_actas`.
+
+    Args:
+        pagina: HTML del listado o página ya parseada con `fx.parse_pagina`.
+        reporte: Reporte del listado (ver `reportes`).
+
+    Returns:
+        Diccionario con las listas `identidades` y, si el reporte es por comisión,
+        `estados`, `instancias` y `tipos`.
+    """
+    actas = {"identidades": fx.identidades_filas(pagina)}
+    if reporte.por_comision:
+        actas["estados"] = fx.parse_estados(pagina)
+        actas["instancias"], actas["tipos"] = fx.get_instance(None, pagina)
+    return actas
+
+
+def _clave(
+    reporte: Reporte,
+    fila_comision: Optional[str],
+    actas: Dict[str, List[Any]],
+    j: int,
+    cache: Optional[CacheActas] = None,
+) -> Optional[str]:
+    """
+    Clave en la caché del acta j del listado (ver `cache.clave_acta`).
+
+    Si la caché es una `Instantanea`, la clave es la huella del acta con todos sus
+    datos del listado, que queda anotada en la foto de la corrida.
+    """
+    if isinstance(cache, Instantanea):
+
+        def dato(nombre: str) -> Any:
+            valores = actas.get(nombre)
+            return valores[j] if valores is not None and j < len(valores) else None
+
+        return cache.huella(
+            reporte.nombre,
+            fila_comision,
+            actas["identidades"][j],
+            dato("actividades"),
+            dato("estados"),
+            dato("instancias"),
+            dato("tipos"),
+        )
+    if reporte.por_comision:
+        return clave_acta(
+            reporte.nombre,
+            fila_comision,
+            actas["identidades"][j],
+            actas["estados"][j],
+        )
+    return clave_acta(reporte.nombre, actas["identidades"][j])
+
+
+def _identidad(
+    fila_comision: Optional[str], actas: Dict[str, List[Any]], j: int
+) -> Optional[str]:
+    """
+    Identidad del acta j del listado en el checkpoint (ver `checkpoint.Identidad`).
+
+    Lleva también la fila de la comisión, porque la misma fila de acta puede repetirse
+    en otra comisión.
+    """
+    identidades = actas.get("identidades") or []
+    if j >= len(identidades) or not identidades[j]:
+        return None
+    if fila_comision is None:
+        return identidades[j]
+    return f"{fila_comision}\n{identidades[j]}"
+
+
+def _datos(
+    reporte: Reporte, actas: Dict[str, List[Any]], j: int
+) -> Optional[Dict[str, Any]]:
+    """Datos del acta j que se toman del listado (ver `fx.generar_acta`)."""
+    if not reporte.por_comision:
+        return None
+    return fx.datos_listado(
+        actas["estados"][j], actas["instancias"][j], actas["tipos"][j]
+    )
+
+
+def _al_parsear(
+    i: int,
+    c: Optional[int],
+    j: int,
+    dfs: Acumulador,
+    pbar: Any,
+    checkpoint: Optional[Checkpoint],
+    cache: Optional[CacheActas],
+    clave: Optional[str],
+    htmls: List[str],
+    identidad: Optional[str] = None,
+) -> Callable[[Any, str], None]:
+    """Función que registra el acta j cuando vuelve del pipeline (ver `Pipeline.enviar`)."""
+
+    def registrar(df: Any, act: str) -> None:
+        if (
+            cache is not None
+            and clave is not None
+            and not isinstance(df, str)
+            and cache.guarda(df.attrs["info"].get("Estado"))
+        ):
+            cache.guardar(clave, htmls)
+        pbar.set_postfix_str(f"{act}")
+        registrar_resultado(df, act, dfs, checkpoint, i, c, j, identidad)
+
+    return registrar
+
+
+def scrapear_paginas(
+    browser: webdriver.Firefox,
+    reporte: Reporte,
+    paginas: List[int],
+    residual_timeout: int = 1,
+    position: int = 0,
+    checkpoint: Optional[Checkpoint] = None,
+    cache: Optional[CacheActas] = None,
+    reingresar: Optional[Callable[[], None]] = None,
+    parseo: Optional[Executor] = None,
+) -> ResultadoPaginas:
+    """
+    Recorre las páginas indicadas del listado del reporte y extrae cada acta.
+
+    Si el reporte es por comisión, abre cada comisión del listado y recorre sus actas.
+
+    Args:
+        browser: Instancia del navegador, parada en el listado ya filtrado.
+        reporte: Reporte a recorrer (ver `reportes`).
+        paginas: Páginas del listado a recorrer.
+        residual_timeout: Tiempo de espera residual entre interacciones.
+        position: Posición de las barras de progreso (para varios workers).
+        checkpoint: Checkpoint donde registrar las actas terminadas y consultar las ya hechas.
+        cache: Caché de actas cerradas (o `Instantanea` de la corrida anterior) a
+            consultar antes de abrir cada acta.
+        reingresar: Función que vuelve a entrar si la sesión expira (ver `entrar`);
+            después se sigue desde la misma página, comisión y acta.
+        parseo: Pool de procesos donde parsear las actas mientras se navega (ver
+            `pipeline`); sin pool se parsea cada acta antes de pasar a la siguiente.
+
+    Returns:
+        Diccionario página -> filas de las actas de esa página (`Acumulador`).
+    """
+    resultados: ResultadoPaginas = {}
+    # Con pool, las actas se parsean en otros procesos mientras se sigue navegando
+    pipeline = Pipeline(parseo) if parseo is not None else None
+    # Cuadros que no se pudieron ampliar en esta corrida (ver `fx.Paginador.ampliar`)
+    sin_ampliar: Set[str] = set()
+    paginador = fx.Paginador(
+        browser,
+        reporte.listado,
+        residual_timeout=residual_timeout,
+        sin_ampliar=sin_ampliar,
+    )
+    pags = paginador.total_paginas()
+    cancelar = f'//*[@id="{reporte.cancelar}"]'
+    cancelar_comision = f'//*[@id="{reporte.cancelar_comision}"]'
+
+    def abrir_comision(c: int) -> str:
+        # Abre la comisión c de la página actual y devuelve la identidad de su fila
+        comisiones = fx.filas_listado(browser)
+        with medir("abrir_comision"):
+            comisiones[c]["boton"].click()
+            WebDriverWait(browser, 10).until(
+                EC.element_to_be_clickable((By.XPATH, _BOTONES_FILA))
+            )
+        return comisiones[c]["identidad"]
+
+    def volver_al_listado(i: int) -> None:
+        # Deja el navegador en la página i del listado, volviendo a entrar si hace falta
+        if not fx.recuperar_sesion(browser, reingresar):
+            fx.esperar_respuesta(browser, residual_timeout)
+            for xpath in (cancelar, cancelar_comision):
+                for back in browser.find_elements(By.XPATH, xpath):
+                    back.click()
+                    fx.esperar_respuesta(browser, residual_timeout)
+        paginador.ir_a(i)
+
+    def volver_a_las_actas(i: int, c: Optional[int]) -> None:
+        # Deja el navegador en el listado de actas (de la comisión c) de la página i
+        if c is None:
+            volver_al_listado(i)
+            return
+        if not fx.recuperar_sesion(browser, reingresar):
+            fx.esperar_respuesta(browser, residual_timeout)
+            for back in browser.find_elements(By.XPATH, cancelar):
+                back.click()
+                fx.esperar_respuesta(browser, residual_timeout)
+        if not browser.find_elements(By.XPATH, cancelar_comision):
+            paginador.ir_a(i)
+            abrir_comision(c)
+
+    def abrir_acta(
+        j: int, actas: Dict[str, List[Any]], fila_comision: Optional[str]
+    ) -> Tuple[Any, str]:
+        # Volver de un acta recarga el listado: los datos siguen valiendo, pero hay
+        # que buscar de nuevo los botones (y releer todo si cambió la cantidad)
+        botones = browser.find_elements(By.XPATH, _BOTONES_FILA)
+        if len(botones) == len(actas["botones"]):
+            actas["botones"] = botones
+        else:
+            actas.update(leer_actas(browser, reporte))
+        clave = (
+            _clave(reporte, fila_comision, actas, j, cache)
+            if cache is not None
+            else None
+        )
+        with medir("acta"):
+            return fx.generar_acta(
+                browser,
+                actas["botones"][j],
+                reporte,
+                _datos(reporte, actas, j),
+                cache=cache,
+                clave=clave,
+                sin_ampliar=sin_ampliar,
+            )
+
+    def capturar_acta(
+        j: int, actas: Dict[str, List[Any]], fila_comision: Optional[str]
+    ) -> Tuple[List[str], Optional[str]]:
+        # Como abrir_acta, pero solo junta el HTML; devuelve también la clave con la
+        # que guardarlo en la caché (None si vino de la caché)
+        botones = browser.find_elements(By.XPATH, _BOTONES_FILA)
+        if len(botones) == len(actas["botones"]):
+            actas["botones"] = botones
+        else:
+            actas.update(leer_actas(browser, reporte))
+        clave = (
+            _clave(reporte, fila_comision, actas, j, cache)
+            if cache is not None
+            else None
+        )
+        if clave is not None:
+            with medir("cache"):
+                htmls = cache.obtener(clave)
+            if htmls is not None:
+                return htmls, None
+        with medir("acta"):
+            htmls = fx.capturar_acta(
+                browser, actas["botones"][j], reporte, sin_ampliar=sin_ampliar
+            )
+            return htmls, clave
+
+    def recorrer_actas(
+        i: int,
+        c: Optional[int],
+        fila_comision: Optional[str],
+        actas: Dict[str, List[Any]],
+        dfs: Acumulador,
+        pbar: Any,
+        indices: Any,
+    ) -> None:
+        # Extrae las actas del listado abierto (el de la página i o el de la comisión c)
+        for j in indices:
+            # Si se pidió cancelar, terminar después del acta anterior
+            progreso.revisar()
+            identidad = _identidad(fila_comision, actas, j)
+            if checkpoint is not None and checkpoint.hecho(i, c, j, identidad):
+                continue
+            if c is None:
+                if pags > 1 and paginador.leer_pagina_actual() is None:
+                    # No estamos en el listado: volver desde el acta
+                    volver_al_listado(i)
+                # Asegurarse que estamos en la página correcta
+                paginador.ir_a(i)
+            leer = capturar_acta if pipeline is not None else abrir_acta
+            try:
+                # Los errores se reintentan según su clase (ver `reintentos`)
+                resultado = rt.reintentar(
+                    lambda: leer(j, actas, fila_comision),
+                    lambda: volver_a_las_actas(i, c),
+                )
+            except Exception:
+                _error(f"Error en acta {j + 1} de la página {i}")
+                if checkpoint is not None:
+                    checkpoint.fallo(i, c)
+                continue
+            if pipeline is not None:
+                htmls, clave = resultado
+                registrar = _al_parsear(
+                    i, c, j, dfs, pbar, checkpoint, cache, clave, htmls, identidad
+                )
+                pipeline.enviar(htmls, reporte, _datos(reporte, actas, j), registrar)
+                continue
+            df, act = resultado
+            pbar.set_postfix_str(f"{act}")
+            registrar_resultado(df, act, dfs, checkpoint, i, c, j, identidad)
+
+    def volver_de_la_comision() -> None:
+        browser.find_element(By.XPATH, cancelar_comision).click()
+
+    # Iterar sobre las páginas del listado
+    try:
+        for i in tqdm(paginas, desc="Páginas", position=position, leave=True):
+            dfs = resultados.setdefault(i, Acumulador())
+            paginador.ir_a(i)
+
+            if not reporte.por_comision:
+                actas = leer_actas(browser, reporte)
+                filas = actas["identidades"]
+            else:
+                filas = [fila["identidad"] for fila in fx.filas_listado(browser)]
+            if checkpoint is not None and checkpoint.hecho(i, identidad=filas):
+                # La página ya se hizo, y sus filas son las mismas
+                al_final(pipeline, progreso.pagina)
+                continue
+
+            if not reporte.por_comision:
+                pbar = tqdm(
+                    range(len(actas["botones"])),
+                    desc="Actas",
+                    leave=False,
+                    position=position + 1,
+                )
+                recorrer_actas(i, None, None, actas, dfs, pbar, pbar)
+                if checkpoint is not None:
+                    al_final(
+                        pipeline, lambda i=i, f=filas: checkpoint.terminar_pagina(i, f)
+                    )
+                al_final(pipeline, progreso.pagina)
+                continue
+
+            pbar = tqdm(
+                range(len(filas)),
+                desc="Comisiones",
+                leave=False,
+                position=position + 1,
+            )
+            for c in pbar:
+                progreso.revisar()
+                if checkpoint is not None and checkpoint.hecho(
+                    i, c, identidad=filas[c]
+                ):
+                    continue
+                if pags > 1 and paginador.leer_pagina_actual() is None:
+                    # No estamos en el listado: volver desde la comisión
+                    volver_al_listado(i)
+                # Asegurarse que estamos en la página correcta
+                paginador.ir_a(i)
+
+                try:
+                    fila_comision = rt.reintentar(
+                        lambda: abrir_comision(c), lambda: volver_al_listado(i)
+                    )
+                    # Los datos de las actas se leen una vez por comisión
+                    actas = leer_actas(browser, reporte)
+                except Exception:
+                    _error(f"Error en comisión {c + 1} de la página {i}")
+                    if checkpoint is not None:
+                        checkpoint.fallo(i, c)
+                    continue
+
+                indices = range(len(actas["botones"]))
+                recorrer_actas(i, c, fila_comision, actas, dfs, pbar, indices)
+                try:
+                    with medir("volver"):
+                        rt.reintentar(
+                            volver_de_la_comision,
+                            lambda: fx.esperar_respuesta(browser, residual_timeout),
+                        )
+                except exceptions.NoSuchElementException:
+                    if not fx.recuperar_sesion(browser, reingresar):
+                        raise Exception("No se pudo volver a la lista de actas")
+                if checkpoint is not None:
+                    al_final(
+                        pipeline,
+                        lambda i=i, c=c, f=filas[c]: checkpoint.terminar_comision(
+                            i, c, f
+                        ),
+                    )
+            if checkpoint is not None:
+                al_final(
+                    pipeline, lambda i=i, f=filas: checkpoint.terminar_pagina(i, f)
+                )
+            al_final(pipeline, progreso.pagina)
+    except Cancelado:
+        # Se pidió cancelar: lo ya terminado queda registrado (y las actas que
+        # estaban en el pipeline se entregan abajo)
+        pass
+    if pipeline is not None:
+        pipeline.vaciar()
+    return resultados
+
+
+def scrapear_paginas_http(
+    sesion: SesionHTTP,
+    reporte: Reporte,
+    paginas: List[int],
+    position: int = 0,
+    checkpoint: Optional[Checkpoint] = None,
+    cache: Optional[CacheActas] = None,
+    reingresar: Optional[Callable[[], None]] = None,
+    parseo: Optional[Executor] = None,
+) -> ResultadoPaginas:
+    """
+    Recorre las páginas indicadas del listado del reporte con la sesión HTTP, sin navegador.
+
+    Args:
+        sesion: Sesión HTTP parada en el listado ya filtrado.
+        reporte: Reporte a recorrer (ver `reportes`).
+        paginas: Páginas del listado a recorrer.
+        position: Posición de las barras de progreso (para varios workers).
+        checkpoint: Checkpoint donde registrar las actas terminadas y consultar las ya hechas.
+        cache: Caché de actas cerradas (o `Instantanea` de la corrida anterior) a
+            consultar antes de abrir cada acta.
+        reingresar: Función que vuelve a entrar si la sesión expira y la retoma en
+            `sesion` (ver `SesionHTTP.renovar`); después se sigue desde la misma página,
+            comisión y acta.
+        parseo: Pool de procesos donde parsear las actas mientras se navega (ver
+            `pipeline`).
+
+    Returns:
+        Diccionario página -> filas de las actas de esa página (`Acumulador`).
+    """
+    cuadro = reporte.listado
+    resultados: ResultadoPaginas = {}
+    pipeline = Pipeline(parseo) if parseo is not None else None
+    # Acciones de las filas del listado de actas abierto
+    acciones: List[Accion] = []
+
+    def ir_a(i: int) -> None:
+        # Lleva el listado a la página i, volviendo a entrar si la sesión expiró
+        try:
+            if sesion.pagina_actual(cuadro) not in (None, i):
+                with medir("paginacion_listado"):
+                    sesion.ir_a_pagina(cuadro, i)
+        except fx.SesionExpirada:
+            if reingresar is None:
+                raise
+            fx.volver_a_entrar(reingresar)
+            if sesion.pagina_actual(cuadro) not in (None, i):
+                with medir("paginacion_listado"):
+                    sesion.ir_a_pagina(cuadro, i)
+
+    def abrir_comision(i: int, c: int) -> str:
+        # Abre la comisión c de la página i, volviendo a entrar si la sesión expiró
+        ir_a(i)
+        try:
+            with medir("abrir_comision"):
+                return sesion.abrir_fila(sesion.acciones_fila()[c])
+        except fx.SesionExpirada:
+            if reingresar is None:
+                raise
+            fx.volver_a_entrar(reingresar)
+            ir_a(i)
+            with medir("abrir_comision"):
+                return sesion.abrir_fila(sesion.acciones_fila()[c])
+
+    def volver_a_las_actas(i: int, c: Optional[int]) -> None:
+        # Deja la sesión en el listado de actas (de la comisión c) de la página i
+        nonlocal acciones
+        if reporte.alumnos in sesion.html:
+            sesion.evento(reporte.ci, "cancelar")
+        if c is None:
+            ir_a(i)
+        elif reporte.cancelar_comision not in sesion.html:
+            # Se volvió al listado (por ejemplo, al volver a entrar)
+            abrir_comision(i, c)
+        acciones = sesion.acciones_fila()
+
+    def abrir_acta(
+        j: int, actas: Dict[str, List[Any]], clave: Optional[str]
+    ) -> Tuple[Any, str]:
+        with medir("acta"):
+            return generar_acta_http(
+                sesion, acciones[j], reporte, _datos(reporte, actas, j), cache, clave
+            )
+
+    def capturar_acta(
+        j: int, actas: Dict[str, List[Any]], clave: Optional[str]
+    ) -> Tuple[List[str], Optional[str]]:
+        # Como abrir_acta, pero solo junta el HTML (ver el de `scrapear_paginas`)
+        if clave is not None:
+            with medir("cache"):
+                htmls = cache.obtener(clave)
+            if htmls is not None:
+                return htmls, None
+        with medir("acta"):
+            return capturar_acta_http(sesion, acciones[j], reporte), clave
+
+    def recorrer_actas(
+        i: int,
+        c: Optional[int],
+        fila_comision: Optional[str],
+        actas: Dict[str, List[Any]],
+        dfs: Acumulador,
+        pbar: Any,
+        indices: Any,
+    ) -> None:
+        # Extrae las actas del listado abierto (el de la página i o el de la comisión c)
+        leer = capturar_acta if pipeline is not None else abrir_acta
+        for j in indices:
+            # Si se pidió cancelar, terminar después del acta anterior
+            progreso.revisar()
+            identidad = _identidad(fila_comision, actas, j)
+            if checkpoint is not None and checkpoint.hecho(i, c, j, identidad):
+                continue
+            if c is None:
+                # Asegurarse que estamos en la página correcta
+                ir_a(i)
+            clave = (
+                _clave(reporte, fila_comision, actas, j, cache)
+                if cache is not None
+                else None
+            )
+            try:
+                try:
+                    # Los errores se reintentan según su clase (ver `reintentos`)
+                    resultado = rt.reintentar(
+                        lambda: leer(j, actas, clave),
+                        lambda: volver_a_las_actas(i, c),
+                    )
+                except fx.SesionExpirada:
+                    if reingresar is None:
+                        raise
+                    # Volver a entrar, al mismo listado, y reintentar la misma acta
+                    fx.volver_a_entrar(reingresar)
+                    volver_a_las_actas(i, c)
+                    resultado = rt.reintentar(
+                        lambda: leer(j, actas, clave),
+                        lambda: volver_a_las_actas(i, c),
+                    )
+            except Exception as e:
+                _error(f"Error en acta {j + 1} de la página {i}: {e}")
+                if checkpoint is not None:
+                    checkpoint.fallo(i, c)
+                continue
+            if pipeline is not None:
+                htmls, clave_nueva = resultado
+                registrar = _al_parsear(
+                    i,
+                    c,
+                    j,
+                    dfs,
+                    pbar,
+                    checkpoint,
+                    cache,
+                    clave_nueva,
+                    htmls,
+                    identidad,
+                )
+                pipeline.enviar(htmls, reporte, _datos(reporte, actas, j), registrar)
+                continue
+            df, act = resultado
+            pbar.set_postfix_str(f"{act}")
+            registrar_resultado(df, act, dfs, checkpoint, i, c, j, identidad)
+
+    try:
+        for i in tqdm(paginas, desc="Páginas", position=position, leave=True):
+            dfs = resultados.setdefault(i, Acumulador())
+            ir_a(i)
+            acciones = sesion.acciones_fila()
+
+            if not reporte.por_comision:
+                actas = leer_actas_html(sesion.html, reporte)
+                filas = actas["identidades"]
+            else:
+                filas = fx.identidades_filas(sesion.html)
+            if checkpoint is not None and checkpoint.hecho(i, identidad=filas):
+                # La página ya se hizo, y sus filas son las mismas
+                al_final(pipeline, progreso.pagina)
+                continue
+
+            if not reporte.por_comision:
+                pbar = tqdm(
+                    range(len(acciones)),
+                    desc="Actas",
+                    leave=False,
+                    position=position + 1,
+                )
+                recorrer_actas(i, None, None, actas, dfs, pbar, pbar)
+                if checkpoint is not None:
+                    al_final(
+                        pipeline, lambda i=i, f=filas: checkpoint.terminar_pagina(i, f)
+                    )
+                al_final(pipeline, progreso.pagina)
+                continue
+
+            pbar = tqdm(
+                range(len(acciones)),
+                desc="Comisiones",
+                leave=False,
+                position=position + 1,
+            )
+            for c in pbar:
+                progreso.revisar()
+                if checkpoint is not None and checkpoint.hecho(
+                    i, c, identidad=filas[c]
+                ):
+                    continue
+                # Asegurarse que estamos en la página correcta y abrir la comisión
+                try:
+                    pagina = fx.parse_pagina(
+                        rt.reintentar(lambda: abrir_comision(i, c))
+                    )
+                except Exception as e:
+                    _error(f"Error en comisión {c + 1} de la página {i}: {e}")
+                    if checkpoint is not None:
+                        checkpoint.fallo(i, c)
+                    continue
+                try:
+                    actas = leer_actas_html(pagina, reporte)
+                    acciones = sesion.acciones_fila()
+                except Exception as e:
+                    _error(f"Error en comisión {c + 1} de la página {i}: {e}")
+                    if checkpoint is not None:
+                        checkpoint.fallo(i, c)
+                    acciones = []
+
+                indices = range(len(acciones))
+                recorrer_actas(i, c, filas[c], actas, dfs, pbar, indices)
+                try:
+                    with medir("volver"):
+                        sesion.evento(reporte.ci, "cancelar_preseleccion")
+                except fx.SesionExpirada:
+                    # Al volver a entrar ya se queda en el listado
+                    if reingresar is None:
+                        raise
+                    fx.volver_a_entrar(reingresar)
+                if checkpoint is not None:
+                    al_final(
+                        pipeline,
+                        lambda i=i, c=c, f=filas[c]: checkpoint.terminar_comision(
+                            i, c, f
+                        ),
+                    )
+            if checkpoint is not None:
+                al_final(
+                    pipeline, lambda i=i, f=filas: checkpoint.terminar_pagina(i, f)
+                )
+            al_final(pipeline, progreso.pagina)
+    except Cancelado:
+        # Se pidió cancelar: lo ya terminado queda registrado (y las actas que
+        # estaban en el pipeline se entregan abajo)
+        pass
+    if pipeline is not None:
+        pipeline.vaciar()
+    return resultados
+
+
+def correr(
+    reporte: Reporte,
+    siu_credentials: Optional[str],
+    año: Optional[int] = None,
+    valor: Optional[str] = None,
+    residual_timeout: int = 1,
+    page_start: int = 0,
+    page_end: int = 0,
+    output_folder: Optional[str] = None,
+    output_filename: str = "output.xlsx",
+    workers: int = 1,
+    perfil: str = "normal",
+    backend: str = "selenium",
+    proxy: Optional[str] = None,
+    reanudar: bool = False,
+    formato: str = "csv",
+    excel: bool = True,
+    replay: Optional[str] = None,
+    grabar: Optional[str] = None,
+    cache: Optional[str] = None,
+    cache_mb: float = MAX_MB,
+    metricas_vivo: bool = False,
+    normalizado: bool = False,
+    procesos: int = 0,
+    carpeta_perfil: Optional[str] = None,
+    sincronizar: bool = False,
+    devolver: bool = True,
+) -> Optional[pd.DataFrame]:
+    """
+    Corre el scraping completo de un reporte (ver `examenes.main` y `comisiones.main`).
+
+    Args:
+        reporte: Reporte a extraer (ver `reportes`).
+        siu_credentials: Ruta al archivo con usuario y contraseña de SIU (None con replay).
+        año: Año a filtrar (opcional).
+        valor: Segundo filtro del reporte, por ejemplo el llamado o el periodo (opcional).
+        residual_timeout: Tiempo de espera residual entre interacciones.
+        page_start: Página inicial (0 para empezar desde la primera).
+        page_end: Página final (0 para llegar hasta la última).
+        output_folder: Carpeta de salida (opcional). Las filas se escriben en
+            `<output_filename sin extensión>/año=.../<filtro>=.../` y el avance en
+            `<output_filename sin extensión>.checkpoint.jsonl`.
+        output_filename: Nombre del Excel.
+        workers: Cantidad de navegadores en paralelo, cada uno con su propio login. Las
+            páginas de un worker que falla se reintentan una vez con un navegador nuevo;
+            si vuelven a fallar, se lanza `workers.PaginasFallidas`.
+        perfil: Perfil del navegador (ver `fx.PERFILES`).
+        backend: "selenium" para recorrer con el navegador o "http" para hacer solo el
+            login con el navegador y recorrer con pedidos HTTP.
+        proxy: URL del proxy para el backend HTTP (opcional).
+        reanudar: Si es True, continúa desde el checkpoint existente salteando lo ya hecho.
+        formato: Formato de las partes de la salida ("csv" o "parquet").
+        excel: Si es True, arma el Excel con todas las filas al terminar.
+        replay: URL de un servidor de replay (ver replay.py) contra el que correr sin
+            login ni filtros (opcional).
+        grabar: Carpeta donde grabar las páginas recorridas con el backend HTTP (opcional).
+        cache: Carpeta de la caché de actas cerradas (opcional).
+        cache_mb: Tamaño máximo de la caché en MB.
+        metricas_vivo: Si es True, escribe cada medición de tiempos en
+            `<output_filename sin extensión>.metricas.jsonl` (requiere carpeta de salida).
+        normalizado: Si es True, escribe una tabla de actas y otra de alumnos (ver
+            `salida.SalidaNormalizada`).
+        procesos: Cantidad de procesos donde parsear las actas mientras los navegadores
+            siguen con las próximas (ver `pipeline`); con 0 se parsea cada acta en el
+            mismo thread que navega.
+        carpeta_perfil: Carpeta donde guardar perfiles de Firefox persistentes, uno por
+            worker (ver `fx.carpeta_perfil_worker`), para que el navegador arranque
+            precalentado en las próximas corridas (opcional).
+        sincronizar: Si es True, solo se abren las actas nuevas o cuya fila del listado
+            cambió desde la corrida anterior; las demás se rearman desde la foto que
+            dejó esa corrida en `<output_filename sin extensión>.instantanea/` (ver
+            `sincronizacion.Instantanea`). Requiere carpeta de salida y reemplaza a
+            `cache`.
+        devolver: Si es False y hay carpeta de salida, no se leen las filas escritas
+            para devolverlas (así la memoria no depende del tamaño del resultado).
+
+    Returns:
+        DataFrame con la información consolidada de las actas (con carpeta de salida,
+        todas las de la partición, leídas de la salida), o None si `devolver` es False
+        y se escribió en la carpeta de salida.
+    """
+    return correr_lote(
+        reporte,
+        siu_credentials,
+        [(año, valor)],
+        residual_timeout,
+        page_start,
+        page_end,
+        output_folder,
+        output_filename,
+        workers,
+        perfil,
+        backend,
+        proxy,
+        reanudar,
+        formato,
+        excel,
+        replay,
+        grabar,
+        cache,
+        cache_mb,
+        metricas_vivo,
+        normalizado,
+        procesos,
+        carpeta_perfil,
+        sincronizar,
+        devolver,
+    )[0]
+
+
+def objetivos_lote(
+    años: Optional[str], valores: Optional[str]
+) -> List[Tuple[Optional[int], Optional[str]]]:
+    """
+    Arma la lista de filtros de un lote a partir de lo que se pasa por línea de comandos.
+
+    Args:
+        años: Años separados por coma, o rangos (por ejemplo "2019-2021,2023").
+        valores: Valores del segundo filtro separados por ";" (por ejemplo
+            "Julio;Diciembre"), porque los nombres pueden tener comas.
+
+    Returns:
+        Todas las combinaciones (año, valor), año por año. Si no se pasan años (o
+        valores) queda None, y se pregunta al usuario como en una corrida común.
+    """
+    lista_años: List[Optional[int]] = []
+    for parte in (años or "").split(","):
+        parte = parte.strip()
+        if "-" in parte:
+            desde, hasta = (int(x) for x in parte.split("-", 1))
+            lista_años.extend(range(desde, hasta + 1))
+        elif parte:
+            lista_años.append(int(parte))
+    lista_valores = [v.strip() for v in (valores or "").split(";") if v.strip()]
+    return [(a, v) for a in lista_años or [None] for v in lista_valores or [None]]
+
+
+def correr_lote(
+    reporte: Reporte,
+    siu_credentials: Optional[str],
+    objetivos: List[Tuple[Optional[int], Optional[str]]],
+    residual_timeout: int = 1,
+    page_start: int = 0,
+    page_end: int = 0,
+    output_folder: Optional[str] = None,
+    output_filename: str = "output.xlsx",
+    workers: int = 1,
+    perfil: str = "normal",
+    backend: str = "selenium",
+    proxy: Optional[str] = None,
+    reanudar: bool = False,
+    formato: str = "csv",
+    excel: bool = True,
+    replay: Optional[str] = None,
+    grabar: Optional[str] = None,
+    cache: Optional[str] = None,
+    cache_mb: float = MAX_MB,
+    metricas_vivo: bool = False,
+    normalizado: bool = False,
+    procesos: int = 0,
+    carpeta_perfil: Optional[str] = None,
+    sincronizar: bool = False,
+    devolver: bool = True,
+) -> List[Optional[pd.DataFrame]]:
+    """
+    Corre el scraping de un reporte para varios filtros con un solo login.
+
+    Los navegadores (y el pool de parseo) se abren una vez: para cada (año, valor) se
+    vuelve a abrir el reporte desde el menú y se filtra (ver `abrir_reporte`). Cada
+    filtro se escribe en su propia partición de la salida (`año=.../<filtro>=.../`),
+    con su propio checkpoint `<output_filename sin extensión>.año=....<filtro>=....checkpoint.jsonl`
+    y su propio Excel con el mismo nombre. Con un solo filtro los nombres son los de
+    siempre (ver `correr`).
+
+    Si un filtro falla (incluso si quedaron páginas sin procesar, ver `correr`), se
+    informa, se cierran los navegadores y se sigue con el próximo desde un login nuevo;
+    lo que quedó a medias se retoma con `reanudar`.
+
+    Args:
+        reporte: Reporte a extraer (ver `reportes`).
+        siu_credentials: Ruta al archivo con usuario y contraseña de SIU (None con replay).
+        objetivos: Filtros (año, valor) a recorrer, en orden (ver `objetivos_lote`).
+        Los demás, como en `correr`. Con más de un filtro hace falta carpeta de salida,
+        y no se puede usar replay ni grabar.
+
+    Returns:
+        Para cada filtro, el DataFrame con sus actas (ver `correr`), o None si falló o si
+        `devolver` es False y se escribió en la carpeta de salida.
+    """
+    if grabar is not None and backend != "http":
+        raise ValueError("Solo se puede grabar con el backend http")
+    lote = len(objetivos) > 1
+    if lote and (replay is not None or grabar is not None):
+        raise ValueError("El replay y la grabación son de un solo filtro")
+    if lote and output_folder is None:
+        raise ValueError("Para correr varios filtros hace falta una carpeta de salida")
+    if sincronizar and output_folder is None:
+        raise ValueError("Para sincronizar hace falta una carpeta de salida")
+
+    base = None
+    if output_folder is not None:
+        base = os.path.join(output_folder, os.path.splitext(output_filename)[0])
+    # Los tiempos por fase se miden desde el login
+    metricas = Metricas(base + ".metricas.jsonl" if base and metricas_vivo else None)
+    activar(metricas)
+    # Presupuesto de reintentos y circuito nuevos para cada corrida
+    rt.activar(rt.Reintentos())
+    nombre_filtro = reporte.filtro[0]
+
+    if replay is None:
+        # Leer credenciales de SIU
+        siu_user, siu_pass = fx.leer_credenciales(siu_credentials)
+
+    # Navegadores abiertos por número de worker, que pasan de un filtro al siguiente, y
+    # el filtro en el que quedó cada uno
+    sesiones: Dict[int, webdriver.Firefox] = {}
+    filtrados: Dict[int, Tuple[str, str, bool]] = {}
+    cache_actas = CacheActas(cache, cache_mb) if cache is not None else None
+    # Un solo pool de parseo para todos los workers y filtros
+    parseo = pool_de_parseo(procesos) if procesos > 0 else None
+    resultados_lote: List[Optional[pd.DataFrame]] = []
+
+    def cerrar_sesiones() -> None:
+        for b in sesiones.values():
+            try:
+                b.quit()
+            except Exception:
+                pass
+        sesiones.clear()
+        filtrados.clear()
+
+    def correr_filtro(
+        año: Optional[int], valor: Optional[str]
+    ) -> Optional[pd.DataFrame]:
+        # Corre un filtro del lote con los navegadores de `sesiones`
+        if replay is not None:
+            # La grabación arranca en el listado ya filtrado
+            filtro_grabado = rp.filtro_grabado(replay)
+            año_sel = filtro_grabado.get("año")
+            valor_sel = filtro_grabado.get(nombre_filtro)
+        elif 0 not in sesiones:
+            print("Se va a abrir un navegador. Ingresar las credenciales del proxy")
+            print("", end="\r")
+            fx.clear_output()
+            sesiones[0], año_sel, valor_sel = abrir_sesion(
+                reporte,
+                siu_user,
+                siu_pass,
+                str(año) if año is not None else None,
+                valor,
+                perfil,
+                carpeta_perfil=fx.carpeta_perfil_worker(carpeta_perfil, 0),
+            )
+        else:
+            año_sel, valor_sel = abrir_reporte(
+                sesiones[0], reporte, str(año) if año is not None else None, valor
+            )
+        filtro = {"año": año_sel, nombre_filtro: valor_sel}
+        destino = base
+        if base is not None and lote:
+            destino = ".".join([base, *carpetas_particion(filtro)])
+
+        # Con un solo worker conviene el listado en la menor cantidad de páginas; con
+        # varios no, porque se reparten las páginas
+        ampliar = workers <= 1
+        if reanudar and destino is not None:
+            anterior = filtro_guardado(destino + ".checkpoint.jsonl")
+            if anterior is not None:
+                # Reanudar con el listado como estaba, para que las páginas sean las mismas
+                ampliar = bool(anterior.get("listado_ampliado"))
+        ampliado = False
+        if replay is None:
+            ampliado = ampliar and fx.Paginador(sesiones[0], reporte.listado).ampliar()
+            filtrados[0] = (año_sel, valor_sel, ampliado)
+
+            def abrir(k: int) -> webdriver.Firefox:
+                # El resto de los workers repite el login y el filtro ya resuelto
+                b = abrir_sesion(
+                    reporte,
+                    siu_user,
+                    siu_pass,
+                    año_sel,
+                    valor_sel,
+                    perfil,
+                    ampliado,
+                    fx.carpeta_perfil_worker(carpeta_perfil, k),
+                )[0]
+                filtrados[k] = (año_sel, valor_sel, ampliado)
+                return b
+
+            def reentrar(b: webdriver.Firefox) -> None:
+                # Si la sesión expira, repetir el login y el filtro en el mismo navegador
+                entrar(b, reporte, siu_user, siu_pass, año_sel, valor_sel, ampliado)
+
+        else:
+
+            def abrir(k: int) -> webdriver.Firefox:
+                return rp.abrir_navegador(
+                    replay, perfil, fx.carpeta_perfil_worker(carpeta_perfil, k)
+                )
+
+            # El replay no tiene login al que volver
+            reentrar = None
+            if 0 not in sesiones:
+                sesiones[0] = abrir(0)
+        pags = fx.Paginador(sesiones[0], reporte.listado).total_paginas()
+        paginas = list(range(page_start or 1, (page_end or pags) + 1))
+
+        checkpoint = None
+        reanudado = False
+        if destino is not None:
+            # Las filas van a la salida a medida que llegan; el checkpoint registra el avance
+            if normalizado:
+                salida = SalidaNormalizada(base, filtro, formato)
+            else:
+                salida = SalidaParticionada(base, filtro, formato)
+            registro = filtro
+            if ampliado:
+                # Las páginas del listado ampliado son otras: no mezclarlas al reanudar
+                registro = {**filtro, "listado_ampliado": True}
+            # Al reanudar, lo ya hecho no pasa por la instantánea de esta corrida
+            reanudado = reanudar and os.path.exists(destino + ".checkpoint.jsonl")
+            checkpoint = Checkpoint(
+                destino + ".checkpoint.jsonl", registro, reanudar, salida
+            )
+            # Las páginas ya hechas se saltean al llegar a ellas, si sus filas siguen
+            # siendo las mismas (ver `Checkpoint.hecho`)
+        progreso.agregar_paginas(len(paginas), f"{año_sel} - {valor_sel}")
+
+        cache_filtro: Optional[CacheActas] = cache_actas
+        instantanea = None
+        if sincronizar:
+            # Cada filtro tiene su foto del listado, que reemplaza a la caché
+            instantanea = Instantanea(destino + ".instantanea", cache_mb)
+            cache_filtro = instantanea
+
+        grabador = None
+        if grabar is not None:
+            grabador = rp.Grabador(grabar, filtro)
+
+        def procesar(
+            b: webdriver.Firefox, shard: List[int], k: int
+        ) -> ResultadoPaginas:
+            if replay is None and filtrados.get(k) != (año_sel, valor_sel, ampliado):
+                # El navegador quedó en el filtro anterior del lote
+                abrir_reporte(b, reporte, año_sel, valor_sel, ampliado)
+                filtrados[k] = (año_sel, valor_sel, ampliado)
+            if backend == "http":
+                sesion = SesionHTTP.desde_navegador(b, proxy, grabador=grabador)
+
+                def reingresar_http() -> None:
+                    reentrar(b)
+                    sesion.renovar(b)
+
+                try:
+                    return scrapear_paginas_http(
+                        sesion,
+                        reporte,
+                        shard,
+                        2 * k,
+                        checkpoint,
+                        cache_filtro,
+                        reingresar_http if reentrar is not None else None,
+                        parseo,
+                    )
+                finally:
+                    sesion.cerrar()
+            return scrapear_paginas(
+                b,
+                reporte,
+                shard,
+                residual_timeout,
+                2 * k,
+                checkpoint,
+                cache_filtro,
+                (lambda: reentrar(b)) if reentrar is not None else None,
+                parseo,
+            )
+
+        try:
+            if workers <= 1:
+                resultados = procesar(sesiones[0], paginas, 0)
+            else:
+                try:
+                    resultados = correr_workers(
+                        abrir, procesar, paginas, workers, sesiones=sesiones
+                    )
+                except PaginasFallidas as e:
+                    if progreso.cancelado():
+                        raise
+                    # Reintentar una vez las páginas de los workers que fallaron (con
+                    # navegadores nuevos); si vuelven a fallar, el filtro queda fallido
+                    tqdm.write(f"Reintentando las páginas {e.paginas}")
+                    resultados = e.resultados
+                    resultados.update(
+                        correr_workers(
+                            abrir, procesar, e.paginas, workers, sesiones=sesiones
+                        )
+                    )
+        finally:
+            if checkpoint is not None:
+                checkpoint.cerrar()
+            if grabador is not None:
+                grabador.cerrar()
+            if instantanea is not None:
+                # Solo se olvidan las actas que ya no están si se recorrió todo el listado
+                completa = not reanudado and all(
+                    checkpoint.hecho(p) for p in range(1, pags + 1)
+                )
+                cambios = instantanea.cerrar(completa)
+                tqdm.write(
+                    f"Sincronización: {cambios['nuevas']} actas nuevas o cambiadas, "
+                    f"{cambios['sin_cambios']} sin cambios, "
+                    f"{cambios['eliminadas']} que ya no están"
+                )
+        if checkpoint is None:
+            return unir_resultados(resultados)
+        # La salida tiene también las actas de corridas anteriores
+        if excel:
+            if lote:
+                nombre = os.path.basename(destino) + ".xlsx"
+            else:
+                nombre = output_filename
+            salida.a_excel(os.path.join(output_folder, nombre))
+        return salida.a_dataframe() if devolver else None
+
+    try:
+        for año, valor in objetivos:
+            if progreso.cancelado():
+                tqdm.write(
+                    "Corrida cancelada: quedan sin recorrer los filtros siguientes"
+                )
+                break
+            try:
+                resultados_lote.append(correr_filtro(año, valor))
+            except Exception as e:
+                if not lote:
+                    raise
+                _error(f"Error en {nombre_filtro} {valor} de {año}: {e}")
+                resultados_lote.append(None)
+                # Empezar el próximo filtro con navegadores nuevos
+                cerrar_sesiones()
+    finally:
+        cerrar_sesiones()
+        if parseo is not None:
+            parseo.shutdown()
+        activar(None)
+        metricas.cerrar()
+        if base is not None:
+            metricas.exportar(base + ".metricas")
+        imprimir(metricas.resumen())
+    return resultados_lote
@@ -0,0 +1,24 @@
+from typing import Tuple
+
+# Opciones que muestran la línea de comandos y la GUI antes de empezar a scrapear. Están
+# acá y no en `funcs` o `salida` para que armar los argumentos (o abrir la ventana) no
+# cargue selenium ni pandas; esos módulos las re-exportan.
+
+# Perfiles de navegador disponibles para correr el scraper (ver `funcs.opciones_navegador`)
+PERFILES: Tuple[str, ...] = ("normal", "liviano", "scraping")
+
+# Formatos de la salida particionada (ver `salida.SalidaParticionada`)
+FORMATOS: Tuple[str, ...] = ("csv", "parquet")
+
+# Módulos pesados que los puntos de entrada no deberían importar al arrancar (ver
+# `replay.medir_arranque`)
+PESADOS: Tuple[str, ...] = (
+    "selenium",
+    "pandas",
+    "numpy",
+    "bs4",
+    "IPython",
+    "tqdm",
+    "requests",
+    "webdriver_manager",
+)
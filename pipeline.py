@@ -0,0 +1,149 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import funcs as fx
+from metricas import medir
+from reportes import Reporte
+
+# Lo que recibe quien registra un acta: (DataFrame o string de error, actividad)
+Resultado = Tuple[Any, str]
+
+
+def parsear_acta(
+    htmls: List[str], reporte: Reporte, datos: Optional[Dict[str, Any]] = None
+) -> Resultado:
+    """
+    Arma un acta a partir del HTML de sus páginas, como `fx.generar_acta` pero sin navegar.
+
+    Es la parte de CPU del acta (BeautifulSoup y `pd.read_html`), pensada para correr en
+    otro proceso mientras el navegador sigue con la próxima.
+
+    Args:
+        htmls: HTML de la página del acta y de cada página de alumnos, en orden.
+        reporte: Reporte al que pertenece el acta (ver `reportes`).
+        datos: Datos del acta tomados del listado (ver `fx.generar_acta`).
+
+    Returns:
+        Una tupla (DataFrame con la información consolidada, actividad) o (string de error, actividad).
+    """
+    info: Dict[str, Any] = {}
+    try:
+        paginas = [fx.parse_pagina(html) for html in htmls]
+        info = fx.info_acta(paginas[0], reporte, datos)
+        if reporte.saltear_anuladas and info.get("Estado") == "Anulada":
+            return "Acta anulada", info.get("Actividad", "Act. no encontrada")
+        tabs = [fx.alumnos_acta(pagina, reporte) for pagina in paginas]
+    except Exception:
+        return "Error en acta", info.get("Actividad", "Act. no encontrada")
+    return fx.armar_acta(tabs, info), info["Actividad"]
+
+
+def pool_de_parseo(procesos: int) -> ProcessPoolExecutor:
+    """
+    Crea el pool de procesos donde se parsean las actas.
+
+    Los procesos se crean con "spawn" (como en Windows también en Linux), para no copiar
+    los threads de los navegadores ni las métricas abiertas del proceso principal.
+
+    Args:
+        procesos: Cantidad de procesos.
+
+    Returns:
+        Pool a pasarle a `Pipeline`; se comparte entre todos los workers de la corrida.
+    """
+    return ProcessPoolExecutor(
+        max_workers=procesos, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+class Pipeline:
+    """
+    Parsea las actas en un pool de procesos mientras la navegación sigue, y entrega los
+    resultados en el orden en que se enviaron.
+
+    Quien navega solo junta el HTML de cada acta y lo envía con `enviar`; cuando el acta
+    está lista (y todas las anteriores también) se llama a su `al_terminar` en el thread
+    que navega, así el checkpoint y la salida ven las actas en el mismo orden que sin
+    pipeline. `despues` encola una función para cuando terminen todas las actas enviadas
+    hasta ese momento (por ejemplo, marcar la página terminada en el checkpoint).
+
+    Para no juntar en memoria el HTML de medio listado, si hay más de `pendientes` actas
+    sin entregar se espera a la más vieja antes de seguir navegando.
+
+    Args:
+        pool: Pool de procesos (ver `pool_de_parseo`).
+        pendientes: Máximo de actas enviadas sin entregar (por defecto, 2 por proceso).
+    """
+
+    def __init__(self, pool: Executor, pendientes: Optional[int] = None):
+        self.pool = pool
+        if pendientes is None:
+            pendientes = 2 * getattr(pool, "_max_workers", 1)
+        self.pendientes = pendientes
+        self._cola: Deque[Tuple[Optional[Future], Callable[..., None]]] = deque()
+
+    def enviar(
+        self,
+        htmls: List[str],
+        reporte: Reporte,
+        datos: Optional[Dict[str, Any]],
+        al_terminar: Callable[[Any, str], None],
+    ) -> None:
+        """
+        Envía un acta a parsear.
+
+        Args:
+            htmls: HTML de la página del acta y de cada página de alumnos, en orden.
+            reporte: Reporte al que pertenece el acta (ver `reportes`).
+            datos: Datos del acta tomados del listado (ver `fx.generar_acta`).
+            al_terminar: Función que recibe (DataFrame o string de error, actividad).
+        """
+        future = self.pool.submit(parsear_acta, htmls, reporte, datos)
+        self._cola.append((future, al_terminar))
+        self._entregar()
+
+    def despues(self, funcion: Callable[[], None]) -> None:
+        """
+        Llama a `funcion` cuando se hayan entregado todas las actas enviadas hasta ahora.
+
+        Args:
+            funcion: Función sin argumentos.
+        """
+        self._cola.append((None, funcion))
+        self._entregar()
+
+    def vaciar(self) -> None:
+        """Espera y entrega todas las actas pendientes."""
+        self._entregar(todo=True)
+
+    def _entregar(self, todo: bool = False) -> None:
+        while self._cola:
+            future, funcion = self._cola[0]
+            if future is None:
+                self._cola.popleft()
+                funcion()
+                continue
+            enviadas = sum(1 for f, _ in self._cola if f is not None)
+            if not (todo or future.done() or enviadas > self.pendientes):
+                return
+            self._cola.popleft()
+            try:
+                if future.done():
+                    df, act = future.result()
+                else:
+                    with medir("espera_parseo"):
+                        df, act = future.result()
+            except Exception:
+                # El proceso murió o el acta no se pudo enviar
+                df, act = "Error en acta", "Act. no encontrada"
+            funcion(df, act)
+
+
+def al_final(pipeline: Optional[Pipeline], funcion: Callable[[], None]) -> None:
+    """Llama a `funcion` ya, o después de las actas pendientes si hay pipeline."""
+    if pipeline is None:
+        funcion()
+    else:
+        pipeline.despues(funcion)
@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+# Errores recientes que se conservan para mostrar
+MAX_ERRORES = 10
+
+
+class Cancelado(Exception):
+    """Se pidió cancelar la corrida (ver `Progreso.cancelar`)."""
+
+
+class Progreso:
+    """
+    Avance de una corrida, para seguirlo desde otro thread (por ejemplo, la GUI).
+
+    El scraping informa lo que termina con las funciones de este módulo (`acta`,
+    `pagina`, `error`...), que lo registran en el progreso activo (ver `activar`), como
+    `metricas.medir`. Quien muestra el avance lee `estado` desde su propio thread cuando
+    quiere: todo pasa por un lock y nadie toca la interfaz desde el thread que scrapea.
+
+    `cancelar` pide que la corrida termine: el scraping lo revisa antes de cada acta
+    (ver `revisar`) y termina después de la actual, dejando registrado lo ya hecho.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cancelar = threading.Event()
+        self._t0 = time.monotonic()
+        self._paginas = 0
+        self._paginas_hechas = 0
+        self._actas = 0
+        self._filtro: Optional[str] = None
+        self._ultima: Optional[str] = None
+        self._errores: Deque[str] = deque(maxlen=MAX_ERRORES)
+        self._n_errores = 0
+
+    def agregar_paginas(self, paginas: int, filtro: Optional[str] = None) -> None:
+        """
+        Suma las páginas de un filtro a las que hay que recorrer.
+
+        Args:
+            paginas: Páginas del listado a recorrer.
+            filtro: Descripción del filtro que se empieza a recorrer (opcional).
+        """
+        with self._lock:
+            self._paginas += paginas
+            if filtro is not None:
+                self._filtro = filtro
+
+    def acta(self, actividad: str) -> None:
+        """Registra un acta terminada."""
+        with self._lock:
+            self._actas += 1
+            self._ultima = actividad
+
+    def pagina(self) -> None:
+        """Registra una página del listado terminada."""
+        with self._lock:
+            self._paginas_hechas += 1
+
+    def error(self, mensaje: str) -> None:
+        """Registra un error (se conservan los últimos `MAX_ERRORES`)."""
+        with self._lock:
+            self._n_errores += 1
+            self._errores.append(mensaje)
+
+    def cancelar(self) -> None:
+        """Pide que la corrida termine después del acta actual."""
+        self._cancelar.set()
+
+    @property
+    def cancelado(self) -> bool:
+        """Indica si se pidió cancelar."""
+        return self._cancelar.is_set()
+
+    def estado(self) -> Dict[str, Any]:
+        """
+        Foto del avance.
+
+        Returns:
+            Diccionario con `paginas`, `paginas_hechas`, `actas`, `actas_por_minuto`,
+            `eta` (segundos que faltan según el ritmo de las páginas, o None),
+            `transcurrido`, `filtro`, `ultima` (actividad del último acta), `errores`
+            (los últimos), `n_errores` y `cancelado`.
+        """
+        with self._lock:
+            transcurrido = time.monotonic() - self._t0
+            eta = None
+            if self._paginas_hechas:
+                restantes = max(0, self._paginas - self._paginas_hechas)
+                eta = transcurrido / self._paginas_hechas * restantes
+            return {
+                "paginas": self._paginas,
+                "paginas_hechas": self._paginas_hechas,
+                "actas": self._actas,
+                "actas_por_minuto": (
+                    60 * self._actas / transcurrido if transcurrido else 0.0
+                ),
+                "eta": eta,
+                "transcurrido": transcurrido,
+                "filtro": self._filtro,
+                "ultima": self._ultima,
+                "errores": list(self._errores),
+                "n_errores": self._n_errores,
+                "cancelado": self.cancelado,
+            }
+
+
+_activo: Optional[Progreso] = None
+
+
+def activar(progreso: Optional[Progreso]) -> None:
+    """
+    Define el progreso donde se registra el avance (None para no registrarlo).
+
+    Args:
+        progreso: Progreso de la corrida.
+    """
+    global _activo
+    _activo = progreso
+
+
+def agregar_paginas(paginas: int, filtro: Optional[str] = None) -> None:
+    """Suma páginas al progreso activo (ver `Progreso.agregar_paginas`)."""
+    if _activo is not None:
+        _activo.agregar_paginas(paginas, filtro)
+
+
+def acta(actividad: str) -> None:
+    """Registra un acta terminada en el progreso activo."""
+    if _activo is not None:
+        _activo.acta(actividad)
+
+
+def pagina() -> None:
+    """Registra una página terminada en el progreso activo."""
+    if _activo is not None:
+        _activo.pagina()
+
+
+def error(mensaje: str) -> None:
+    """Registra un error en el progreso activo."""
+    if _activo is not None:
+        _activo.error(mensaje)
+
+
+def cancelado() -> bool:
+    """Indica si se pidió cancelar la corrida activa."""
+    return _activo is not None and _activo.cancelado
+
+
+def revisar() -> None:
+    """
+    Corta la corrida si se pidió cancelar.
+
+    Raises:
+        Cancelado: Si se pidió cancelar.
+    """
+    if cancelado():
+        raise Cancelado()
@@ -0,0 +1,268 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import requests
+from selenium.common import exceptions
+from tqdm import tqdm
+
+from metricas import medir
+
+T = TypeVar("T")
+
+# Clases de errores
+ELEMENTO_VIEJO = "elemento_viejo"
+TIMEOUT = "timeout"
+SIN_TABLA = "sin_tabla"
+SERVIDOR = "servidor"
+OTRO = "otro"
+NO_REINTENTAR = "no_reintentar"
+
+
+class SinReintento(Exception):
+    """Error que no se arregla esperando y volviendo a intentar (por ejemplo, sesión expirada)."""
+
+
+class SinTabla(ValueError):
+    """La página no tiene la tabla que se esperaba (por ejemplo, si no terminó de cargar)."""
+
+
+class Backoff:
+    """
+    Cuántas veces reintentar una clase de error y cuánto esperar antes de cada intento.
+
+    La espera crece exponencialmente (`base`, `2*base`, `4*base`... hasta `maximo`) y se
+    sortea entre 0 y ese valor ("full jitter"), para que varios workers que fallan a la
+    vez no vuelvan a pegarle al servidor todos juntos.
+
+    Args:
+        intentos: Cantidad máxima de reintentos.
+        base: Espera del primer reintento, en segundos.
+        maximo: Espera máxima, en segundos.
+    """
+
+    def __init__(self, intentos: int, base: float, maximo: float):
+        self.intentos = intentos
+        self.base = base
+        self.maximo = maximo
+
+    def espera(self, intento: int) -> float:
+        """
+        Tiempo a esperar antes de un reintento.
+
+        Args:
+            intento: Número de reintento, desde 0.
+
+        Returns:
+            Segundos a esperar.
+        """
+        return random.uniform(0, min(self.maximo, self.base * 2**intento))
+
+
+# Política por defecto de cada clase de error
+POLITICAS: Dict[str, Backoff] = {
+    ELEMENTO_VIEJO: Backoff(intentos=3, base=0.1, maximo=1),
+    TIMEOUT: Backoff(intentos=3, base=1, maximo=15),
+    SIN_TABLA: Backoff(intentos=2, base=0.5, maximo=5),
+    SERVIDOR: Backoff(intentos=4, base=2, maximo=60),
+    OTRO: Backoff(intentos=1, base=1, maximo=5),
+}
+
+
+def clasificar(error: BaseException) -> str:
+    """
+    Clasifica un error según cómo conviene reintentarlo.
+
+    Args:
+        error: Excepción a clasificar.
+
+    Returns:
+        Clase del error: `ELEMENTO_VIEJO` (el DOM cambió debajo de un elemento),
+        `TIMEOUT`, `SIN_TABLA` (falta un elemento o tabla de la página, ver `SinTabla`),
+        `SERVIDOR` (error 5xx, conexión caída o página de error del navegador),
+        `NO_REINTENTAR` u `OTRO` (cualquier otro error, incluidos los del código).
+    """
+    if isinstance(error, SinReintento):
+        return NO_REINTENTAR
+    if isinstance(error, exceptions.StaleElementReferenceException):
+        return ELEMENTO_VIEJO
+    if isinstance(error, (exceptions.TimeoutException, requests.Timeout)):
+        return TIMEOUT
+    if isinstance(error, requests.HTTPError):
+        status = getattr(error.response, "status_code", None)
+        if status is not None and (status >= 500 or status == 429):
+            return SERVIDOR
+        return NO_REINTENTAR
+    if isinstance(error, requests.ConnectionError):
+        return SERVIDOR
+    if isinstance(error, (exceptions.NoSuchElementException, SinTabla)):
+        return SIN_TABLA
+    if isinstance(error, ValueError) and str(error).startswith("No tables found"):
+        # `pd.read_html` sin ninguna tabla
+        return SIN_TABLA
+    if isinstance(error, exceptions.WebDriverException) and (
+        "neterror" in str(error) or "Reached error page" in str(error)
+    ):
+        return SERVIDOR
+    return OTRO
+
+
+class Circuito:
+    """
+    Corta el circuito cuando el servidor está claramente caído.
+
+    Después de `umbral` errores de servidor seguidos (de cualquier worker), todos los
+    intentos esperan `pausa` segundos antes de seguir. Si el primer intento después de la
+    pausa vuelve a fallar, la pausa siguiente es el doble (hasta `pausa_maxima`); con el
+    primer éxito todo vuelve a la normalidad.
+
+    Args:
+        umbral: Errores de servidor seguidos para cortar el circuito.
+        pausa: Pausa inicial en segundos.
+        pausa_maxima: Pausa máxima en segundos.
+    """
+
+    def __init__(self, umbral: int = 5, pausa: float = 30, pausa_maxima: float = 600):
+        self.umbral = umbral
+        self.pausa = pausa
+        self.pausa_maxima = pausa_maxima
+        self._lock = threading.Lock()
+        self._fallas = 0
+        self._pausa_actual = pausa
+        self._hasta = 0.0
+
+    def esperar(self) -> None:
+        """Si el circuito está cortado, espera a que termine la pausa."""
+        with self._lock:
+            resto = self._hasta - time.monotonic()
+        if resto > 0:
+            with medir("circuito"):
+                time.sleep(resto)
+
+    def falla(self) -> None:
+        """Registra un error de servidor; corta el circuito si se llegó al umbral."""
+        with self._lock:
+            self._fallas += 1
+            if self._fallas < self.umbral or self._hasta > time.monotonic():
+                return
+            self._hasta = time.monotonic() + self._pausa_actual
+            tqdm.write(
+                f"El servidor no responde, pausando {self._pausa_actual:.0f} segundos"
+            )
+            self._pausa_actual = min(self.pausa_maxima, 2 * self._pausa_actual)
+
+    def exito(self) -> None:
+        """Registra un intento exitoso: el circuito vuelve a la normalidad."""
+        with self._lock:
+            self._fallas = 0
+            self._pausa_actual = self.pausa
+
+
+class Reintentos:
+    """
+    Política de reintentos de una corrida.
+
+    Cada error se clasifica (ver `clasificar`) y se reintenta según el `Backoff` de su
+    clase. Además hay un presupuesto de reintentos para toda la corrida: cada reintento
+    gasta una ficha y cada éxito devuelve `recarga` fichas, así un sitio que falla en
+    todas las actas no multiplica la duración de la corrida. Los errores de servidor
+    alimentan un `Circuito` compartido.
+
+    Args:
+        politicas: Backoff por clase de error (por defecto `POLITICAS`).
+        presupuesto: Fichas de reintento (máximo acumulable).
+        recarga: Fichas que devuelve cada éxito.
+        circuito: Circuito compartido (por defecto uno nuevo).
+    """
+
+    def __init__(
+        self,
+        politicas: Optional[Dict[str, Backoff]] = None,
+        presupuesto: float = 50,
+        recarga: float = 0.2,
+        circuito: Optional[Circuito] = None,
+    ):
+        self.politicas = POLITICAS if politicas is None else politicas
+        self.presupuesto = presupuesto
+        self.recarga = recarga
+        self.circuito = Circuito() if circuito is None else circuito
+        self._lock = threading.Lock()
+        self._fichas = presupuesto
+
+    def _gastar(self) -> bool:
+        with self._lock:
+            if self._fichas < 1:
+                return False
+            self._fichas -= 1
+            return True
+
+    def _recargar(self) -> None:
+        with self._lock:
+            self._fichas = min(self.presupuesto, self._fichas + self.recarga)
+
+    def reintentar(
+        self, funcion: Callable[[], T], al_fallar: Optional[Callable[[], Any]] = None
+    ) -> T:
+        """
+        Llama a `funcion` y la reintenta mientras falle con errores reintentables.
+
+        Args:
+            funcion: Función a llamar, sin argumentos.
+            al_fallar: Función que deja todo listo para el próximo intento (por ejemplo,
+                volver al listado); se llama después de la espera, antes de `funcion`.
+
+        Returns:
+            Lo que devuelva `funcion`.
+
+        Raises:
+            Exception: El último error, si no es reintentable, se agotaron los intentos de
+                su clase o se agotó el presupuesto.
+        """
+        intentos: Dict[str, int] = {}
+        recuperar = False
+        while True:
+            self.circuito.esperar()
+            try:
+                if recuperar and al_fallar is not None:
+                    # Si falla, cuenta como un intento más y se vuelve a llamar
+                    al_fallar()
+                recuperar = False
+                resultado = funcion()
+            except Exception as e:
+                clase = clasificar(e)
+                if clase == SERVIDOR:
+                    self.circuito.falla()
+                politica = self.politicas.get(clase)
+                n = intentos.get(clase, 0)
+                if politica is None or n >= politica.intentos or not self._gastar():
+                    raise
+                intentos[clase] = n + 1
+                with medir("reintento"):
+                    time.sleep(politica.espera(n))
+                recuperar = True
+                continue
+            self.circuito.exito()
+            self._recargar()
+            return resultado
+
+
+_activos = Reintentos()
+
+
+def activar(reintentos: Reintentos) -> None:
+    """
+    Define la política que usa `reintentar`.
+
+    Args:
+        reintentos: Política de la corrida.
+    """
+    global _activos
+    _activos = reintentos
+
+
+def reintentar(
+    funcion: Callable[[], T], al_fallar: Optional[Callable[[], Any]] = None
+) -> T:
+    """Llama a `funcion` con la política activa (ver `Reintentos.reintentar`)."""
+    return _activos.reintentar(funcion, al_fallar)
@@ -0,0 +1,714 @@
+import argparse
+import hashlib
+import importlib
+import json
+import mimetypes
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from email.parser import BytesParser
+from email.policy import default as politica_email
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urljoin, urlsplit
+
+from metricas import imprimir, percentil
+from opciones import PESADOS
+
+COOKIE = "REPLAYSESSID"
+
+# Ruta del servidor de replay que devuelve el filtro de la grabación
+RUTA_FILTRO = "/_replay/filtro"
+
+# Puntos de entrada cuyo arranque mide `medir_arranque`
+ENTRADAS = ("examenes", "comisiones", "gui")
+
+# Segundos que puede tardar en importarse un punto de entrada (ver `medir_arranque`)
+LIMITE_ARRANQUE = 0.5
+
+
+def _sha(texto: str) -> str:
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def _ruta(url: str) -> str:
+    """Ruta y query de una URL, que es como se identifican las páginas y recursos."""
+    partes = urlsplit(url)
+    return partes.path + (f"?{partes.query}" if partes.query else "")
+
+
+def _origen(url: str) -> str:
+    partes = urlsplit(url)
+    return f"{partes.scheme}://{partes.netloc}"
+
+
+def diferencias(desde: str, campos: Dict[str, str]) -> Dict[str, str]:
+    """
+    Campos de un post que difieren de los que ya tenía el formulario de la página.
+
+    Es lo que identifica a un evento Toba (el componente, el evento y sus parámetros),
+    tanto si el post lo arma `SesionHTTP` como si lo arma el navegador con JavaScript.
+
+    Args:
+        desde: HTML de la página desde la que se envió el formulario.
+        campos: Campos enviados (o solo los modificados).
+
+    Returns:
+        Campos que cambiaron respecto al formulario original.
+    """
+    from backend_http import leer_formulario
+
+    try:
+        _, originales, _ = leer_formulario(desde, "")
+    except ValueError:
+        originales = {}
+    return {k: v for k, v in campos.items() if originales.get(k) != v}
+
+
+def fase(cambios: Dict[str, str]) -> str:
+    """
+    Nombre de la fase de un paso según el evento disparado.
+
+    Args:
+        cambios: Campos modificados del post (ver `diferencias`).
+
+    Returns:
+        Nombre de la fase, por ejemplo "seleccion", "cambiar_pagina alumnos" o "cancelar".
+    """
+    for campo, valor in cambios.items():
+        if "__" in campo or not valor:
+            continue
+        if valor == "cambiar_pagina":
+            return f"{valor} {'alumnos' if 'alumnos' in campo else 'listado'}"
+        return valor
+    return "otro"
+
+
+class Grabador:
+    """
+    Graba las páginas recorridas por `SesionHTTP` para reproducirlas con `ServidorReplay`.
+
+    La grabación es una carpeta con:
+        - `paginas/<sha1>.html`: cada página distinta, una sola vez.
+        - `recursos/`: scripts, estilos e imágenes de las páginas (para el navegador).
+        - `grabacion.jsonl`: la página de inicio y cada paso (página de origen, campos
+          modificados del post, página de respuesta).
+
+    El login, el menú y los filtros se hacen con el navegador y no se graban: la
+    grabación arranca en el listado filtrado, que es donde se pasa a `SesionHTTP`.
+
+    Args:
+        carpeta: Carpeta donde guardar la grabación.
+        filtro: Filtro de la corrida grabada (año, llamado/periodo).
+        recursos: Si es True, también se descargan los recursos de cada página.
+    """
+
+    def __init__(self, carpeta: str, filtro: Dict[str, Any], recursos: bool = True):
+        self.carpeta = carpeta
+        self.recursos = recursos
+        os.makedirs(os.path.join(carpeta, "paginas"), exist_ok=True)
+        os.makedirs(os.path.join(carpeta, "recursos"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._paginas = set(
+            os.path.splitext(n)[0] for n in os.listdir(os.path.join(carpeta, "paginas"))
+        )
+        self._recursos = set()
+        self._file = open(
+            os.path.join(carpeta, "grabacion.jsonl"), "a", encoding="utf-8"
+        )
+        self._escribir({"tipo": "filtro", "filtro": filtro})
+
+    def _escribir(self, registro: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def _guardar_pagina(self, sesion: Any) -> str:
+        sha = _sha(sesion.html)
+        with self._lock:
+            nueva = sha not in self._paginas
+            self._paginas.add(sha)
+        if nueva:
+            path = os.path.join(self.carpeta, "paginas", f"{sha}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(sesion.html)
+            if self.recursos:
+                self._guardar_recursos(sesion)
+        return sha
+
+    def _guardar_recursos(self, sesion: Any) -> None:
+        """Descarga los recursos del mismo sitio que referencia la página actual."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(sesion.html, "html.parser")
+        urls = [tag.get("src") for tag in soup.find_all(["script", "img"])]
+        urls += [tag.get("href") for tag in soup.find_all("link")]
+        for url in filter(None, urls):
+            url = urljoin(sesion.url, url)
+            ruta = _ruta(url)
+            if _origen(url) != _origen(sesion.url):
+                continue
+            with self._lock:
+                if ruta in self._recursos:
+                    continue
+                self._recursos.add(ruta)
+            try:
+                respuesta = sesion.session.get(url, timeout=sesion.timeout)
+                respuesta.raise_for_status()
+            except Exception:
+                continue
+            archivo = _sha(ruta)
+            with open(os.path.join(self.carpeta, "recursos", archivo), "wb") as f:
+                f.write(respuesta.content)
+            self._escribir(
+                {
+                    "tipo": "recurso",
+                    "ruta": ruta,
+                    "archivo": archivo,
+                    "content_type": respuesta.headers.get("Content-Type"),
+                }
+            )
+
+    def inicio(self, sesion: Any) -> None:
+        """Graba la página en la que arranca una sesión HTTP."""
+        sha = self._guardar_pagina(sesion)
+        self._escribir(
+            {
+                "tipo": "inicio",
+                "ruta": _ruta(sesion.url),
+                "origen": _origen(sesion.url),
+                "pagina": sha,
+            }
+        )
+
+    def paso(self, sesion: Any, desde: str, cambios: Dict[str, str]) -> None:
+        """
+        Graba un post de la sesión y la página a la que llevó.
+
+        Args:
+            sesion: Sesión HTTP, ya parada en la página de respuesta.
+            desde: HTML de la página desde la que se envió el post.
+            cambios: Campos modificados del post.
+        """
+        hacia = self._guardar_pagina(sesion)
+        self._escribir(
+            {
+                "tipo": "paso",
+                "desde": _sha(desde),
+                "cambios": diferencias(desde, cambios),
+                "hacia": hacia,
+            }
+        )
+
+    def cerrar(self) -> None:
+        """Cierra el archivo de la grabación."""
+        with self._lock:
+            self._file.close()
+
+
+class ServidorReplay(ThreadingHTTPServer):
+    """
+    Servidor HTTP local que reproduce una grabación hecha con `Grabador`.
+
+    Cada sesión (identificada por una cookie) arranca en la página de inicio con un GET,
+    y cada post se resuelve buscando el paso grabado desde la página actual con los mismos
+    campos modificados. Como las páginas son las grabadas, mantienen los ids de Toba
+    (`cuadro_38000496_cuadro_actas`, `ci_34000146_cancelar`, ...) y funcionan tanto con
+    `SesionHTTP` como con el navegador.
+
+    También mide, para cada fase, el tiempo que tarda el cliente desde que hace un pedido
+    hasta que hace el siguiente (respuesta del servidor y procesamiento del scraper).
+
+    Args:
+        carpeta: Carpeta de la grabación.
+        host: Dirección donde escuchar.
+        puerto: Puerto donde escuchar (0 para elegir uno libre).
+        latencia: Demora en segundos a agregar a cada respuesta, para simular la del servidor real.
+    """
+
+    def __init__(
+        self,
+        carpeta: str,
+        host: str = "127.0.0.1",
+        puerto: int = 0,
+        latencia: float = 0.0,
+    ):
+        self.carpeta = carpeta
+        self.latencia = latencia
+        self.filtro: Dict[str, Any] = {}
+        self.inicio: Optional[Dict[str, Any]] = None
+        self.recursos: Dict[str, Dict[str, Any]] = {}
+        self.pasos: Dict[str, List[Tuple[Dict[str, str], str]]] = {}
+        self._cargar()
+        self._sesiones: Dict[str, Dict[str, Any]] = {}
+        self._tiempos: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        super().__init__((host, puerto), _Handler)
+
+    def _cargar(self) -> None:
+        with open(
+            os.path.join(self.carpeta, "grabacion.jsonl"), "r", encoding="utf-8"
+        ) as f:
+            for linea in f:
+                registro = json.loads(linea)
+                if registro["tipo"] == "filtro":
+                    self.filtro = registro["filtro"]
+                elif registro["tipo"] == "inicio" and self.inicio is None:
+                    self.inicio = registro
+                elif registro["tipo"] == "recurso":
+                    self.recursos[registro["ruta"]] = registro
+                elif registro["tipo"] == "paso":
+                    self.pasos.setdefault(registro["desde"], []).append(
+                        (registro["cambios"], registro["hacia"])
+                    )
+        if self.inicio is None:
+            raise ValueError(f"La grabación {self.carpeta} no tiene página de inicio")
+
+    @property
+    def url(self) -> str:
+        """URL de la página de inicio en este servidor."""
+        host, puerto = self.server_address[:2]
+        return f"http://{host}:{puerto}{self.inicio['ruta']}"
+
+    def pagina(self, sha: str) -> str:
+        """HTML grabado, con las URLs absolutas del sitio original pasadas a este servidor."""
+        path = os.path.join(self.carpeta, "paginas", f"{sha}.html")
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().replace(self.inicio["origen"], "")
+
+    def siguiente(self, desde: str, campos: Dict[str, str]) -> Optional[str]:
+        """
+        Busca la página a la que lleva un post desde la página `desde`.
+
+        Se usa el paso grabado con exactamente los mismos campos modificados; si no hay,
+        el que tenga más campos en común sin contradecir ninguno (el navegador puede
+        completar campos extra), primero desde la misma página y después desde cualquiera.
+
+        Args:
+            desde: Hash de la página actual.
+            campos: Campos enviados en el post.
+
+        Returns:
+            Hash de la página de respuesta, o None si el paso no está grabado.
+        """
+        cambios = diferencias(self.pagina(desde), campos)
+        candidatos = [self.pasos.get(desde, [])]
+        candidatos.append([p for lista in self.pasos.values() for p in lista])
+        for pasos in candidatos:
+            for grabados, hacia in pasos:
+                if grabados == cambios:
+                    return hacia
+            compatibles = [
+                (len(grabados), hacia)
+                for grabados, hacia in pasos
+                if grabados and all(cambios.get(k) == v for k, v in grabados.items())
+            ]
+            if compatibles:
+                return max(compatibles, key=lambda c: c[0])[1]
+        return None
+
+    def sesion(self, sid: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+        """Devuelve (id, estado) de la sesión, creando una nueva si no existe."""
+        with self._lock:
+            if sid not in self._sesiones:
+                sid = uuid.uuid4().hex
+                self._sesiones[sid] = {"pagina": self.inicio["pagina"], "ultimo": None}
+            return sid, self._sesiones[sid]
+
+    def medir(self, estado: Dict[str, Any], nombre: str) -> None:
+        """Cierra el tiempo de la fase anterior de la sesión y empieza el de `nombre`."""
+        ahora = time.perf_counter()
+        with self._lock:
+            if estado["ultimo"] is not None:
+                anterior, t0 = estado["ultimo"]
+                self._tiempos.setdefault(anterior, []).append(ahora - t0)
+            estado["ultimo"] = (nombre, ahora)
+
+    def metricas(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resume los tiempos medidos por fase.
+
+        Returns:
+            Diccionario fase -> {"n", "media", "p50", "p95"} (tiempos en segundos).
+        """
+        with self._lock:
+            tiempos = {k: sorted(v) for k, v in self._tiempos.items()}
+        return {
+            nombre: {
+                "n": len(valores),
+                "media": sum(valores) / len(valores),
+                "p50": percentil(valores, 50),
+                "p95": percentil(valores, 95),
+            }
+            for nombre, valores in tiempos.items()
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: ServidorReplay
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _cookie(self) -> Optional[str]:
+        for parte in (self.headers.get("Cookie") or "").split(";"):
+            nombre, _, valor = parte.strip().partition("=")
+            if nombre == COOKIE:
+                return valor
+        return None
+
+    def _responder(
+        self,
+        cuerpo: bytes,
+        content_type: str = "text/html; charset=utf-8",
+        estado: int = 200,
+        sid: Optional[str] = None,
+    ) -> None:
+        if self.server.latencia:
+            time.sleep(self.server.latencia)
+        self.send_response(estado)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(cuerpo)))
+        if sid is not None:
+            self.send_header("Set-Cookie", f"{COOKIE}={sid}; Path=/")
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def do_GET(self) -> None:
+        if self.path == RUTA_FILTRO:
+            cuerpo = json.dumps(self.server.filtro, ensure_ascii=False).encode("utf-8")
+            return self._responder(cuerpo, "application/json; charset=utf-8")
+        recurso = self.server.recursos.get(self.path) or self.server.recursos.get(
+            urlsplit(self.path).path
+        )
+        if recurso is not None:
+            path = os.path.join(self.server.carpeta, "recursos", recurso["archivo"])
+            with open(path, "rb") as f:
+                cuerpo = f.read()
+            tipo = recurso.get("content_type") or (
+                mimetypes.guess_type(recurso["ruta"])[0] or "application/octet-stream"
+            )
+            return self._responder(cuerpo, tipo)
+        # Cualquier otra ruta empieza una sesión nueva en la página de inicio
+        sid, estado = self.server.sesion(None)
+        self.server.medir(estado, "inicio")
+        estado["pagina"] = self.server.inicio["pagina"]
+        cuerpo = self.server.pagina(estado["pagina"]).encode("utf-8")
+        self._responder(cuerpo, sid=sid)
+
+    def do_POST(self) -> None:
+        largo = int(self.headers.get("Content-Length") or 0)
+        campos = _leer_post(
+            self.headers.get("Content-Type", ""), self.rfile.read(largo)
+        )
+        sid, estado = self.server.sesion(self._cookie())
+        hacia = self.server.siguiente(estado["pagina"], campos)
+        if hacia is None:
+            cuerpo = "<html><body>Paso no grabado</body></html>".encode("utf-8")
+            return self._responder(cuerpo, estado=404, sid=sid)
+        self.server.medir(
+            estado, fase(diferencias(self.server.pagina(estado["pagina"]), campos))
+        )
+        estado["pagina"] = hacia
+        self._responder(self.server.pagina(hacia).encode("utf-8"), sid=sid)
+
+
+def _leer_post(content_type: str, cuerpo: bytes) -> Dict[str, str]:
+    """Decodifica los campos de un post urlencoded o multipart."""
+    if content_type.lower().startswith("multipart/"):
+        mensaje = BytesParser(policy=politica_email).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + cuerpo
+        )
+        campos = {}
+        for parte in mensaje.iter_parts():
+            nombre = parte.get_param("name", header="content-disposition")
+            if nombre is not None:
+                campos[nombre] = parte.get_content()
+        return campos
+    return dict(parse_qsl(cuerpo.decode("utf-8"), keep_blank_values=True))
+
+
+def servir(
+    carpeta: str, host: str = "127.0.0.1", puerto: int = 0, latencia: float = 0.0
+) -> ServidorReplay:
+    """
+    Levanta un servidor de replay en un thread aparte.
+
+    Args:
+        carpeta: Carpeta de la grabación.
+        host: Dirección donde escuchar.
+        puerto: Puerto donde escuchar (0 para elegir uno libre).
+        latencia: Demora en segundos a agregar a cada respuesta.
+
+    Returns:
+        El servidor, ya escuchando (ver `ServidorReplay.url`).
+    """
+    servidor = ServidorReplay(carpeta, host, puerto, latencia)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
+
+
+def filtro_grabado(url: str) -> Dict[str, Any]:
+    """
+    Pide a un servidor de replay el filtro de la corrida grabada.
+
+    Args:
+        url: URL del servidor de replay.
+
+    Returns:
+        Filtro (año, llamado/periodo) con el que se hizo la grabación.
+    """
+    import requests
+
+    respuesta = requests.get(urljoin(url, RUTA_FILTRO), timeout=30)
+    respuesta.raise_for_status()
+    return respuesta.json()
+
+
+def abrir_navegador(
+    url: str, perfil: str = "normal", carpeta_perfil: Optional[str] = None
+) -> Any:
+    """
+    Abre un navegador parado en la página de inicio de un servidor de replay.
+
+    Reemplaza al login, el menú y los filtros, que no forman parte de la grabación.
+
+    Args:
+        url: URL del servidor de replay.
+        perfil: Perfil del navegador (ver `fx.PERFILES`).
+        carpeta_perfil: Carpeta de un perfil persistente (ver `fx.opciones_navegador`).
+
+    Returns:
+        Instancia del navegador.
+    """
+    import funcs as fx
+
+    browser = fx.abrir_navegador(perfil, carpeta_perfil)
+    browser.get(url)
+    return browser
+
+
+def benchmark(
+    carpeta: str,
+    script: str = "examenes",
+    backend: str = "http",
+    workers: int = 1,
+    perfil: str = "scraping",
+    latencia: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Corre el `main` de un scraper contra una grabación y mide su rendimiento.
+
+    Args:
+        carpeta: Carpeta de la grabación.
+        script: "examenes" o "comisiones".
+        backend: Backend del scraper ("selenium" o "http").
+        workers: Cantidad de workers.
+        perfil: Perfil del navegador.
+        latencia: Demora en segundos a agregar a cada respuesta del servidor.
+
+    Returns:
+        Diccionario con la duración, la cantidad de actas, actas por minuto, los tiempos
+        por fase medidos desde el servidor (ver `ServidorReplay.metricas`) y los medidos
+        por el scraper (ver `metricas.Metricas.resumen`).
+    """
+    modulo = importlib.import_module(script)
+    servidor = servir(carpeta, latencia=latencia)
+    try:
+        with tempfile.TemporaryDirectory() as salida:
+            t0 = time.perf_counter()
+            modulo.main(
+                None,
+                residual_timeout=1,
+                workers=workers,
+                perfil=perfil,
+                backend=backend,
+                output_folder=salida,
+                excel=False,
+                replay=servidor.url,
+                devolver=False,
+            )
+            duracion = time.perf_counter() - t0
+            actas = 0
+            with open(
+                os.path.join(salida, "output.checkpoint.jsonl"), "r", encoding="utf-8"
+            ) as f:
+                actas = sum(json.loads(linea)["tipo"] == "acta" for linea in f)
+            with open(
+                os.path.join(salida, "output.metricas.json"), "r", encoding="utf-8"
+            ) as f:
+                fases_scraper = json.load(f)["fases"]
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+    return {
+        "script": script,
+        "backend": backend,
+        "workers": workers,
+        "duracion": duracion,
+        "actas": actas,
+        "actas_por_minuto": 60 * actas / duracion if duracion else 0.0,
+        "fases": servidor.metricas(),
+        "fases_scraper": fases_scraper,
+    }
+
+
+def imprimir_benchmark(resultado: Dict[str, Any]) -> None:
+    """Muestra el resultado de `benchmark` como tabla."""
+    print(
+        f"{resultado['script']} ({resultado['backend']}, {resultado['workers']} workers): "
+        f"{resultado['actas']} actas en {resultado['duracion']:.1f} s, "
+        f"{resultado['actas_por_minuto']:.1f} actas/min"
+    )
+    print("\nCiclo por pedido, medido en el servidor:")
+    imprimir(dict(sorted(resultado["fases"].items())))
+    print("\nFases medidas por el scraper:")
+    imprimir(resultado["fases_scraper"])
+
+
+def medir_arranque(
+    modulos: Tuple[str, ...] = ENTRADAS, repeticiones: int = 5
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Mide cuánto tarda en importarse cada punto de entrada, antes de empezar a scrapear.
+
+    Cada import se corre en un intérprete nuevo (así no hay nada cargado de antes) y se
+    toma la mediana de `repeticiones` corridas. También se anotan los módulos de
+    `opciones.PESADOS` que quedaron importados: ninguno debería cargarse hasta que
+    empieza el scraping.
+
+    Args:
+        modulos: Módulos a importar.
+        repeticiones: Corridas por módulo.
+
+    Returns:
+        Diccionario módulo -> {"segundos": mediana, "pesados": módulos pesados importados}.
+    """
+    carpeta = os.path.dirname(os.path.abspath(__file__))
+    resultado: Dict[str, Dict[str, Any]] = {}
+    for modulo in modulos:
+        codigo = (
+            "import json, sys, time\n"
+            "t0 = time.perf_counter()\n"
+            f"import {modulo}\n"
+            "t = time.perf_counter() - t0\n"
+            f"pesados = [m for m in {PESADOS!r} if m in sys.modules]\n"
+            "print(json.dumps({'segundos': t, 'pesados': pesados}))\n"
+        )
+        corridas = []
+        for _ in range(repeticiones):
+            salida = subprocess.run(
+                [sys.executable, "-c", codigo],
+                cwd=carpeta,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            corridas.append(json.loads(salida.strip().splitlines()[-1]))
+        tiempos = sorted(c["segundos"] for c in corridas)
+        resultado[modulo] = {
+            "segundos": percentil(tiempos, 50),
+            "pesados": corridas[-1]["pesados"],
+        }
+    return resultado
+
+
+def imprimir_arranque(
+    resultado: Dict[str, Dict[str, Any]], limite: float = LIMITE_ARRANQUE
+) -> bool:
+    """
+    Muestra el resultado de `medir_arranque` como tabla.
+
+    Args:
+        resultado: Resultado de `medir_arranque`.
+        limite: Segundos que puede tardar cada import.
+
+    Returns:
+        True si todos los módulos arrancan dentro del límite y sin módulos pesados.
+    """
+    ok = True
+    print(f"{'módulo':<16}{'segundos':>10}  pesados")
+    for modulo, m in resultado.items():
+        print(f"{modulo:<16}{m['segundos']:>10.3f}  {', '.join(m['pesados']) or '-'}")
+        ok = ok and m["segundos"] <= limite and not m["pesados"]
+    if not ok:
+        print(
+            f"Arranque fuera del límite ({limite} s) o con módulos pesados importados"
+        )
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Servidor de replay de una grabación de Guaraní y benchmark de los scrapers."
+    )
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_servir = sub.add_parser("servir", help="Levantar el servidor de replay.")
+    p_servir.add_argument("grabacion", help="Carpeta de la grabación.")
+    p_servir.add_argument("--puerto", type=int, help="Puerto.", default=8000)
+    p_servir.add_argument(
+        "--latencia", type=float, help="Demora por respuesta (s).", default=0.0
+    )
+
+    p_bench = sub.add_parser("benchmark", help="Medir un scraper contra la grabación.")
+    p_bench.add_argument("grabacion", help="Carpeta de la grabación.")
+    p_bench.add_argument(
+        "--script", choices=("examenes", "comisiones"), default="examenes"
+    )
+    p_bench.add_argument("--backend", choices=("selenium", "http"), default="http")
+    p_bench.add_argument("--workers", type=int, default=1)
+    p_bench.add_argument("--perfil", type=str, default="scraping")
+    p_bench.add_argument(
+        "--latencia", type=float, help="Demora por respuesta (s).", default=0.0
+    )
+    p_bench.add_argument(
+        "--json", type=str, help="Archivo donde guardar el resultado.", default=None
+    )
+
+    p_arranque = sub.add_parser(
+        "arranque",
+        help="Medir cuánto tardan en arrancar los scripts (sale con error si alguno se pasa del límite).",
+    )
+    p_arranque.add_argument(
+        "--repeticiones", type=int, help="Corridas por script.", default=5
+    )
+    p_arranque.add_argument(
+        "--limite",
+        type=float,
+        help="Segundos que puede tardar cada import.",
+        default=LIMITE_ARRANQUE,
+    )
+
+    args = parser.parse_args()
+    if args.comando == "arranque":
+        if not imprimir_arranque(
+            medir_arranque(repeticiones=args.repeticiones), args.limite
+        ):
+            sys.exit(1)
+    elif args.comando == "servir":
+        servidor = ServidorReplay(
+            args.grabacion, puerto=args.puerto, latencia=args.latencia
+        )
+        print(f"Sirviendo {args.grabacion} en {servidor.url}")
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    else:
+        resultado = benchmark(
+            args.grabacion,
+            args.script,
+            args.backend,
+            args.workers,
+            args.perfil,
+            args.latencia,
+        )
+        imprimir_benchmark(resultado)
+        if args.json is not None:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(resultado, f, ensure_ascii=False, indent=2)
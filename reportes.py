@@ -0,0 +1,94 @@
+from typing import Tuple
+
+
+class Reporte:
+    """
+    Descripción declarativa de un reporte de Guaraní: qué ids de Toba tiene cada parte.
+
+    El motor de scraping (ver `motor`) y las funciones de `funcs` y `backend_http`
+    trabajan sobre un `Reporte`, así examenes y comisiones (y cualquier otro reporte
+    con la misma forma) comparten todo el recorrido y solo difieren en estos datos.
+
+    Args:
+        nombre: Nombre del reporte; también es el prefijo de las claves de la caché.
+        menu: Id de la entrada del menú que abre el reporte.
+        filtro_año: Id del dropdown del año académico.
+        filtro: Nombre del segundo filtro ("llamado", "periodo"...) e id de su dropdown.
+        boton_filtrar: Id del botón que ejecuta el filtro.
+        listado: Id del cuadro del listado principal (actas o comisiones).
+        ci: Id del componente de la página del acta (botones `<ci>_cancelar`, etc.).
+        alumnos: Id del cuadro de alumnos del acta.
+        tablas_alumnos: Índices de la tabla de alumnos en la página del acta, en el
+            orden en que se prueban.
+        filas_info: Filas del bloque de información general del acta.
+        por_comision: Si el listado es de comisiones, cada una con su listado de actas;
+            el estado, la instancia y el tipo de cada acta se toman de ese listado.
+        saltear_anuladas: Si las actas anuladas se saltean sin leer sus alumnos.
+    """
+
+    def __init__(
+        self,
+        nombre: str,
+        menu: str,
+        filtro_año: str,
+        filtro: Tuple[str, str],
+        boton_filtrar: str,
+        listado: str,
+        ci: str,
+        alumnos: str,
+        tablas_alumnos: Tuple[int, ...],
+        filas_info: slice,
+        por_comision: bool = False,
+        saltear_anuladas: bool = False,
+    ):
+        self.nombre = nombre
+        self.menu = menu
+        self.filtro_año = filtro_año
+        self.filtro = filtro
+        self.boton_filtrar = boton_filtrar
+        self.listado = listado
+        self.ci = ci
+        self.alumnos = alumnos
+        self.tablas_alumnos = tablas_alumnos
+        self.filas_info = filas_info
+        self.por_comision = por_comision
+        self.saltear_anuladas = saltear_anuladas
+
+    @property
+    def cancelar(self) -> str:
+        """Id del botón que vuelve de un acta."""
+        return f"{self.ci}_cancelar"
+
+    @property
+    def cancelar_comision(self) -> str:
+        """Id del botón que vuelve de una comisión al listado."""
+        return f"{self.ci}_cancelar_preseleccion"
+
+
+EXAMENES = Reporte(
+    nombre="examen",
+    menu="elemento_buscar_menu_38000085",
+    filtro_año="ef_ei_38000482_filtroanio_academico",
+    filtro=("llamado", "ef_ei_38000482_filtroturno_examen"),
+    boton_filtrar="ei_38000482_filtro_filtrar",
+    listado="cuadro_38000496_cuadro_actas",
+    ci="ci_38000483",
+    alumnos="cuadro_38000500_alumnos",
+    tablas_alumnos=(7, 6),
+    filas_info=slice(1, 5),
+    saltear_anuladas=True,
+)
+
+COMISIONES = Reporte(
+    nombre="comision",
+    menu="elemento_buscar_menu_34000021",
+    filtro_año="ef_ei_34000144_filtroanio_academico",
+    filtro=("periodo", "ef_ei_34000144_filtroperiodos_nombre"),
+    boton_filtrar="ei_34000144_filtro_filtrar",
+    listado="cuadro_34000135_cuadro_comision",
+    ci="ci_34000146",
+    alumnos="cuadro_34000148_cuadro_alumnos",
+    tablas_alumnos=(5, 4),
+    filas_info=slice(0, 5),
+    por_comision=True,
+)
@@ -0,0 +1,614 @@
+import argparse
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from acumulador import Acumulador
+from opciones import FORMATOS
+
+# Filas que se juntan en memoria antes de escribir una parte Parquet
+FILAS_POR_PARTE = 50_000
+
+# Filas por bloque al leer las partes (para armar el Excel)
+FILAS_POR_BLOQUE = 10_000
+
+# Filas de datos por hoja de Excel (el límite es 1048576 contando el encabezado)
+FILAS_POR_HOJA = 1_048_575
+
+# Ubicación de un acta en la salida: {"parte": nombre del archivo, "fin": bytes escritos}
+Ubicacion = Dict[str, Any]
+
+# Tablas de la salida normalizada y la columna que las relaciona
+TABLA_ACTAS = "actas"
+TABLA_ALUMNOS = "alumnos"
+CLAVE_ACTA = "acta_id"
+
+_RE_PARTE = re.compile(r"^part-(\d+)\.(csv|parquet)$")
+
+
+class SalidaParticionada:
+    """
+    Escribe las filas de cada acta a medida que llegan, en archivos particionados por filtro.
+
+    Las filas quedan en `<carpeta>/<clave>=<valor>/.../part-NNNNN.<formato>`, por ejemplo
+    `output/año=2024/llamado=Julio/part-00000.csv`. Así nunca hace falta tener todo el
+    resultado en memoria ni reescribirlo entero: el Excel se arma una sola vez al final
+    (o cuando se pida) leyendo las partes por bloques.
+
+    En CSV cada acta se agrega a la parte actual y se fuerza a disco enseguida; cuando
+    cambian las columnas se empieza una parte nueva. En Parquet las filas se juntan por
+    columnas (ver `acumulador.Acumulador`) hasta `filas_por_parte` y se escribe una parte
+    por vez, con la información general de las actas como columnas de diccionario.
+
+    Args:
+        carpeta: Carpeta base de la salida.
+        particion: Valores del filtro que definen la partición, en orden (año, llamado...).
+        formato: "csv" o "parquet" (Parquet requiere pyarrow).
+        filas_por_parte: Filas por parte en Parquet.
+    """
+
+    def __init__(
+        self,
+        carpeta: str,
+        particion: Dict[str, Any],
+        formato: str = "csv",
+        filas_por_parte: int = FILAS_POR_PARTE,
+    ):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato {formato} inválido, debe ser uno de {FORMATOS}")
+        if formato == "parquet":
+            _importar_pyarrow()
+        self.formato = formato
+        self.filas_por_parte = filas_por_parte
+        self.directorio = os.path.join(carpeta, *carpetas_particion(particion))
+        os.makedirs(self.directorio, exist_ok=True)
+        self._lock = threading.Lock()
+        self._siguiente = _siguiente_parte(self.directorio)
+
+        # Parte CSV abierta
+        self._file = None
+        self._parte: Optional[str] = None
+        self._columnas: Optional[List[str]] = None
+
+        # Filas Parquet pendientes y funciones a llamar cuando se escriban
+        self._buffer = Acumulador()
+        self._pendientes: List[Tuple[Callable, Optional[pd.DataFrame]]] = []
+
+    def reanudar(self, ubicaciones: Iterable[Ubicacion]) -> None:
+        """
+        Deja en la partición solo lo que está registrado en `ubicaciones`.
+
+        Se borran las partes que no aparecen y las partes CSV se truncan hasta lo último
+        registrado, para no duplicar filas de actas que se escribieron pero no llegaron
+        al checkpoint. Con una lista vacía se empieza de cero.
+
+        Args:
+            ubicaciones: Ubicaciones de las actas ya registradas.
+        """
+        fines: Dict[str, int] = {}
+        for ubicacion in ubicaciones:
+            if "parte" not in ubicacion:
+                raise ValueError("El checkpoint es de una salida normalizada")
+            parte = ubicacion["parte"]
+            fines[parte] = max(fines.get(parte, 0), ubicacion.get("fin") or 0)
+        with self._lock:
+            self._cerrar_csv()
+            for nombre in os.listdir(self.directorio):
+                path = os.path.join(self.directorio, nombre)
+                if nombre not in fines:
+                    if _RE_PARTE.match(nombre) or nombre.endswith(".tmp"):
+                        os.remove(path)
+                elif nombre.endswith(".csv"):
+                    with open(path, "r+b") as f:
+                        f.truncate(fines[nombre])
+            self._siguiente = _siguiente_parte(self.directorio)
+
+    def escribir(
+        self, df: pd.DataFrame, al_guardar: Optional[Callable[[Ubicacion], None]] = None
+    ) -> None:
+        """
+        Agrega las filas de un acta.
+
+        Args:
+            df: Filas del acta.
+            al_guardar: Función a llamar con la ubicación de las filas una vez que quedan
+                en disco (enseguida en CSV; al escribir la parte en Parquet).
+        """
+        with self._lock:
+            if self.formato == "csv":
+                ubicacion = self._escribir_csv(df)
+                if al_guardar is not None:
+                    al_guardar(ubicacion)
+            else:
+                self._buffer.agregar(df)
+                self._pendientes.append((al_guardar, df))
+                if len(self._buffer) >= self.filas_por_parte:
+                    self._escribir_parquet()
+
+    def cuando_se_guarde(self, funcion: Callable[[], None]) -> None:
+        """
+        Llama a `funcion` cuando todo lo escrito hasta ahora esté en disco.
+
+        Sirve para registrar en el checkpoint cosas que dependen de actas anteriores
+        (por ejemplo, una página terminada) sin adelantarse a sus filas.
+
+        Args:
+            funcion: Función sin argumentos.
+        """
+        with self._lock:
+            if self._pendientes:
+                self._pendientes.append((funcion, None))
+            else:
+                funcion()
+
+    def _nueva_parte(self) -> str:
+        nombre = f"part-{self._siguiente:05d}.{self.formato}"
+        self._siguiente += 1
+        return nombre
+
+    def _escribir_csv(self, df: pd.DataFrame) -> Ubicacion:
+        columnas = list(df.columns)
+        if self._columnas is not None and set(columnas) == set(self._columnas):
+            df = df[self._columnas]
+        elif self._file is None or columnas != self._columnas:
+            self._cerrar_csv()
+            self._parte = self._nueva_parte()
+            self._columnas = columnas
+            self._file = open(
+                os.path.join(self.directorio, self._parte),
+                "w",
+                encoding="utf-8",
+                newline="",
+            )
+            df.iloc[:0].to_csv(self._file, index=False)
+        df.to_csv(self._file, header=False, index=False)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"parte": self._parte, "fin": self._file.tell()}
+
+    def _cerrar_csv(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._parte = None
+        self._columnas = None
+
+    def _escribir_parquet(self) -> None:
+        if not self._pendientes:
+            return
+        if any(df is not None for _, df in self._pendientes):
+            parte = self._nueva_parte()
+            path = os.path.join(self.directorio, parte)
+            _importar_pyarrow().write_table(self._buffer.a_arrow(), path + ".tmp")
+            os.replace(path + ".tmp", path)
+            ubicacion = {"parte": parte, "fin": None}
+        pendientes, self._pendientes = self._pendientes, []
+        self._buffer = Acumulador()
+        for funcion, df in pendientes:
+            if funcion is None:
+                continue
+            if df is None:
+                funcion()
+            else:
+                funcion(ubicacion)
+
+    def vaciar(self) -> None:
+        """Escribe ya las filas Parquet pendientes, aunque no completen una parte."""
+        with self._lock:
+            self._escribir_parquet()
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente y cierra la parte abierta."""
+        with self._lock:
+            self._cerrar_csv()
+            self._escribir_parquet()
+
+    def a_excel(self, path: str) -> int:
+        """
+        Arma el Excel con todas las filas de la partición (ver `escribir_excel`).
+
+        Args:
+            path: Ruta del Excel.
+
+        Returns:
+            Cantidad de filas escritas.
+        """
+        self.cerrar()
+        return escribir_excel(self.directorio, path)
+
+    def a_dataframe(self) -> pd.DataFrame:
+        """Lee todas las filas de la partición en un único DataFrame (ver `leer_todo`)."""
+        self.cerrar()
+        return leer_todo(self.directorio)
+
+
+class SalidaNormalizada:
+    """
+    Como `SalidaParticionada`, pero sin repetir la información general del acta en cada alumno.
+
+    Cada acta se escribe como una fila de la tabla `actas` (con las columnas de su
+    `info`, ver `funcs.armar_acta`) y sus alumnos en la tabla `alumnos`, que la referencia
+    por `acta_id`. Cada tabla se particiona igual que la salida común:
+    `<carpeta>/actas/año=.../llamado=.../` y `<carpeta>/alumnos/año=.../llamado=.../`.
+    `leer_plano` las une y devuelve las filas como en la salida común (es lo que se usa
+    para armar el Excel).
+
+    Los `acta_id` son correlativos dentro de cada partición.
+
+    Args:
+        carpeta: Carpeta base de la salida.
+        particion: Valores del filtro que definen la partición, en orden (año, llamado...).
+        formato: "csv" o "parquet" (Parquet requiere pyarrow).
+        filas_por_parte: Filas de alumnos por parte en Parquet.
+    """
+
+    def __init__(
+        self,
+        carpeta: str,
+        particion: Dict[str, Any],
+        formato: str = "csv",
+        filas_por_parte: int = FILAS_POR_PARTE,
+    ):
+        self.formato = formato
+        self.actas = SalidaParticionada(
+            os.path.join(carpeta, TABLA_ACTAS), particion, formato, filas_por_parte
+        )
+        self.alumnos = SalidaParticionada(
+            os.path.join(carpeta, TABLA_ALUMNOS), particion, formato, filas_por_parte
+        )
+        self._lock = threading.Lock()
+        self._siguiente_acta = 0
+
+    def reanudar(self, ubicaciones: Iterable[Ubicacion]) -> None:
+        """
+        Deja en las dos tablas solo las actas registradas (ver `SalidaParticionada.reanudar`).
+
+        Args:
+            ubicaciones: Ubicaciones de las actas ya registradas.
+        """
+        ubicaciones = list(ubicaciones)
+        if any(CLAVE_ACTA not in u for u in ubicaciones):
+            raise ValueError("El checkpoint es de una salida sin normalizar")
+        with self._lock:
+            self.actas.reanudar(u[TABLA_ACTAS] for u in ubicaciones)
+            self.alumnos.reanudar(u[TABLA_ALUMNOS] for u in ubicaciones)
+            self._siguiente_acta = 1 + max(
+                (u[CLAVE_ACTA] for u in ubicaciones), default=-1
+            )
+
+    def escribir(
+        self, df: pd.DataFrame, al_guardar: Optional[Callable[[Ubicacion], None]] = None
+    ) -> None:
+        """
+        Agrega un acta, separando su información general de las filas de alumnos.
+
+        Args:
+            df: Filas del acta, con la información general en `df.attrs["info"]`.
+            al_guardar: Función a llamar con la ubicación del acta en las dos tablas una
+                vez que quedan en disco.
+        """
+        info = df.attrs.get("info", {})
+        with self._lock:
+            acta = self._siguiente_acta
+            self._siguiente_acta += 1
+            fila = pd.DataFrame([{CLAVE_ACTA: acta, **info}])
+            alumnos = df.drop(columns=[c for c in info if c in df.columns])
+            alumnos.insert(0, CLAVE_ACTA, acta)
+
+            ubicacion: Ubicacion = {CLAVE_ACTA: acta}
+
+            def guardada(tabla: str, ubicacion_tabla: Ubicacion) -> None:
+                ubicacion[tabla] = ubicacion_tabla
+                if TABLA_ACTAS in ubicacion and TABLA_ALUMNOS in ubicacion:
+                    if al_guardar is not None:
+                        al_guardar(ubicacion)
+
+            def alumnos_guardados(ubicacion_tabla: Ubicacion) -> None:
+                # La fila del acta va junto con sus alumnos, aunque no complete una parte
+                self.actas.vaciar()
+                guardada(TABLA_ALUMNOS, ubicacion_tabla)
+
+            self.actas.escribir(fila, lambda u: guardada(TABLA_ACTAS, u))
+            self.alumnos.escribir(alumnos, alumnos_guardados)
+
+    def cuando_se_guarde(self, funcion: Callable[[], None]) -> None:
+        """
+        Llama a `funcion` cuando todo lo escrito hasta ahora esté en disco.
+
+        Args:
+            funcion: Función sin argumentos.
+        """
+        self.alumnos.cuando_se_guarde(lambda: self.actas.cuando_se_guarde(funcion))
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente de las dos tablas."""
+        self.alumnos.cerrar()
+        self.actas.cerrar()
+
+    def a_excel(self, path: str) -> int:
+        """
+        Arma el Excel con las filas de la partición unidas como en la salida común.
+
+        Args:
+            path: Ruta del Excel.
+
+        Returns:
+            Cantidad de filas escritas.
+        """
+        self.cerrar()
+        return _escribir_excel(
+            _columnas_planas(self.actas.directorio, self.alumnos.directorio),
+            _leer_plano(self.actas.directorio, self.alumnos.directorio),
+            path,
+        )
+
+    def a_dataframe(self) -> pd.DataFrame:
+        """Lee las filas de la partición unidas como en la salida común, en un único DataFrame."""
+        self.cerrar()
+        bloques = list(_leer_plano(self.actas.directorio, self.alumnos.directorio))
+        if not bloques:
+            return pd.DataFrame()
+        return pd.concat(bloques, ignore_index=True)
+
+
+# Salida donde escriben los scrapers
+Salida = Union[SalidaParticionada, SalidaNormalizada]
+
+
+def carpetas_particion(particion: Dict[str, Any]) -> List[str]:
+    """
+    Nombres de las carpetas de una partición, en orden.
+
+    Args:
+        particion: Valores del filtro que definen la partición (año, llamado...).
+
+    Returns:
+        Lista de `<clave>=<valor>`, con los valores limpios para usar como nombre de carpeta.
+    """
+    return [f"{k}={_limpiar(v)}" for k, v in particion.items()]
+
+
+def _limpiar(valor: Any) -> str:
+    """Convierte un valor del filtro en un nombre de carpeta válido."""
+    return re.sub(r'[\\/:*?"<>|=]+', "_", str(valor)).strip() or "_"
+
+
+def _importar_pyarrow():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "El formato parquet requiere pyarrow (pip install pyarrow)"
+        ) from None
+    return pq
+
+
+def _siguiente_parte(directorio: str) -> int:
+    numeros = [
+        int(m.group(1)) for m in map(_RE_PARTE.match, os.listdir(directorio)) if m
+    ]
+    return max(numeros, default=-1) + 1
+
+
+def partes(directorio: str) -> List[str]:
+    """
+    Lista las partes de una salida, incluyendo las de todas las subparticiones.
+
+    Args:
+        directorio: Carpeta de la salida o de una partición.
+
+    Returns:
+        Rutas de las partes, ordenadas por partición y número de parte.
+    """
+    encontradas = []
+    for raiz, carpetas, archivos in os.walk(directorio):
+        carpetas.sort()
+        for nombre in sorted(archivos):
+            if _RE_PARTE.match(nombre):
+                encontradas.append(os.path.join(raiz, nombre))
+    return encontradas
+
+
+def _columnas_de(path: str) -> List[str]:
+    if path.endswith(".csv"):
+        return list(pd.read_csv(path, nrows=0).columns)
+    return _importar_pyarrow().read_schema(path).names
+
+
+def columnas(directorio: str) -> List[str]:
+    """
+    Une las columnas de todas las partes, en el orden en que aparecen.
+
+    Args:
+        directorio: Carpeta de la salida o de una partición.
+
+    Returns:
+        Lista de columnas.
+    """
+    vistas: Dict[str, None] = {}
+    for path in partes(directorio):
+        vistas.update(dict.fromkeys(_columnas_de(path)))
+    return list(vistas)
+
+
+def leer(
+    directorio: str, filas_por_bloque: int = FILAS_POR_BLOQUE
+) -> Iterator[pd.DataFrame]:
+    """
+    Lee las filas de una salida por bloques, todos con las mismas columnas.
+
+    Args:
+        directorio: Carpeta de la salida o de una partición.
+        filas_por_bloque: Filas de cada bloque.
+
+    Yields:
+        DataFrames con a lo sumo `filas_por_bloque` filas.
+    """
+    todas = columnas(directorio)
+    for path in partes(directorio):
+        if path.endswith(".csv"):
+            bloques = pd.read_csv(path, chunksize=filas_por_bloque)
+        else:
+            archivo = _importar_pyarrow().ParquetFile(path)
+            bloques = (
+                lote.to_pandas()
+                for lote in archivo.iter_batches(batch_size=filas_por_bloque)
+            )
+        for bloque in bloques:
+            yield bloque.reindex(columns=todas)
+
+
+def leer_todo(directorio: str) -> pd.DataFrame:
+    """
+    Lee una salida completa en un único DataFrame.
+
+    Args:
+        directorio: Carpeta de la salida o de una partición.
+
+    Returns:
+        DataFrame con todas las filas (vacío si no hay partes).
+    """
+    bloques = list(leer(directorio))
+    if not bloques:
+        return pd.DataFrame()
+    return pd.concat(bloques, ignore_index=True)
+
+
+def es_normalizada(directorio: str) -> bool:
+    """Indica si `directorio` es la carpeta de una salida normalizada (ver `SalidaNormalizada`)."""
+    return os.path.isdir(os.path.join(directorio, TABLA_ACTAS)) and os.path.isdir(
+        os.path.join(directorio, TABLA_ALUMNOS)
+    )
+
+
+def leer_normalizado(directorio: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Lee las dos tablas de una salida normalizada.
+
+    Los `acta_id` son correlativos dentro de cada partición, así que para unir tablas
+    de varias particiones conviene usar `leer_plano`.
+
+    Args:
+        directorio: Carpeta de la salida normalizada.
+
+    Returns:
+        Tupla (actas, alumnos).
+    """
+    return (
+        leer_todo(os.path.join(directorio, TABLA_ACTAS)),
+        leer_todo(os.path.join(directorio, TABLA_ALUMNOS)),
+    )
+
+
+def _particiones(directorio: str) -> List[str]:
+    """Carpetas con partes dentro de `directorio`, relativas a él y en orden."""
+    vistas: Dict[str, None] = {}
+    for path in partes(directorio):
+        vistas[os.path.relpath(os.path.dirname(path), directorio)] = None
+    return list(vistas)
+
+
+def _columnas_planas(dir_actas: str, dir_alumnos: str) -> List[str]:
+    return [c for c in columnas(dir_alumnos) if c != CLAVE_ACTA] + [
+        c for c in columnas(dir_actas) if c != CLAVE_ACTA
+    ]
+
+
+def _leer_plano(
+    dir_actas: str, dir_alumnos: str, filas_por_bloque: int = FILAS_POR_BLOQUE
+) -> Iterator[pd.DataFrame]:
+    todas = _columnas_planas(dir_actas, dir_alumnos)
+    for particion in _particiones(dir_alumnos):
+        actas = leer_todo(os.path.join(dir_actas, particion))
+        if actas.empty:
+            continue
+        actas = actas.set_index(CLAVE_ACTA)
+        for bloque in leer(os.path.join(dir_alumnos, particion), filas_por_bloque):
+            yield bloque.join(actas, on=CLAVE_ACTA).reindex(columns=todas)
+
+
+def leer_plano(
+    directorio: str, filas_por_bloque: int = FILAS_POR_BLOQUE
+) -> Iterator[pd.DataFrame]:
+    """
+    Lee una salida normalizada con las filas como en la salida común: un alumno por fila
+    con la información general de su acta al final.
+
+    Args:
+        directorio: Carpeta de la salida normalizada.
+        filas_por_bloque: Filas de alumnos de cada bloque.
+
+    Yields:
+        DataFrames con a lo sumo `filas_por_bloque` filas, todos con las mismas columnas.
+    """
+    yield from _leer_plano(
+        os.path.join(directorio, TABLA_ACTAS),
+        os.path.join(directorio, TABLA_ALUMNOS),
+        filas_por_bloque,
+    )
+
+
+def escribir_excel(directorio: str, path: str) -> int:
+    """
+    Arma un Excel con todas las filas de una salida, con memoria acotada.
+
+    Las filas se leen por bloques y se escriben con openpyxl en modo `write_only`, así
+    el uso de memoria no depende del tamaño del resultado. Si hay más filas de las que
+    entran en una hoja, se siguen en hojas nuevas. Una salida normalizada se escribe
+    unida, como la común (ver `leer_plano`).
+
+    Args:
+        directorio: Carpeta de la salida o de una partición.
+        path: Ruta del Excel.
+
+    Returns:
+        Cantidad de filas escritas.
+    """
+    if es_normalizada(directorio):
+        dir_actas = os.path.join(directorio, TABLA_ACTAS)
+        dir_alumnos = os.path.join(directorio, TABLA_ALUMNOS)
+        return _escribir_excel(
+            _columnas_planas(dir_actas, dir_alumnos),
+            _leer_plano(dir_actas, dir_alumnos),
+            path,
+        )
+    return _escribir_excel(columnas(directorio), leer(directorio), path)
+
+
+def _escribir_excel(
+    encabezado: List[str], bloques: Iterable[pd.DataFrame], path: str
+) -> int:
+    from openpyxl import Workbook
+
+    libro = Workbook(write_only=True)
+    hoja = None
+    filas = 0
+    for bloque in bloques:
+        bloque = bloque.astype(object).where(bloque.notna(), None)
+        for fila in bloque.itertuples(index=False, name=None):
+            if filas % FILAS_POR_HOJA == 0:
+                hoja = libro.create_sheet(f"Sheet{filas // FILAS_POR_HOJA + 1}")
+                hoja.append(encabezado)
+            hoja.append(fila)
+            filas += 1
+    if hoja is None:
+        libro.create_sheet("Sheet1").append(encabezado)
+    libro.save(path)
+    return filas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Arma el Excel a partir de una salida particionada."
+    )
+    parser.add_argument(
+        "carpeta",
+        help="Carpeta de la salida (o de una de sus particiones, o de una salida normalizada).",
+    )
+    parser.add_argument("excel", help="Ruta del Excel a generar.")
+    args = parser.parse_args()
+    n = escribir_excel(args.carpeta, args.excel)
+    print(f"{n} filas escritas en {args.excel}")
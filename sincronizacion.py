@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from cache import MAX_MB, CacheActas
+
+# Archivo con la foto del listado, dentro de la carpeta de la instantánea
+ARCHIVO_FOTO = "instantanea.json"
+
+
+def huella_acta(*partes: Any) -> Optional[str]:
+    """
+    Arma la huella de un acta a partir de sus datos en el listado.
+
+    A diferencia de `cache.clave_acta`, las partes pueden faltar (None): no todos los
+    listados tienen estado, instancia o tipo.
+
+    Args:
+        *partes: Reporte, fila de la comisión, fila del acta, actividad, estado,
+            instancia y tipo (ver `Instantanea.huella`).
+
+    Returns:
+        Huella (hash) del acta, o None si no se pudo identificar la fila del acta.
+    """
+    if len(partes) < 3 or not partes[2]:
+        return None
+    texto = json.dumps(
+        [None if p is None else str(p) for p in partes], ensure_ascii=False
+    )
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+class Instantanea(CacheActas):
+    """
+    Foto del listado de la corrida anterior, para abrir solo las actas que cambiaron.
+
+    Cada acta se identifica por su huella: la fila del listado (y la de su comisión),
+    la actividad, el estado (como en `funcs.get_statuses`) y la instancia y el tipo
+    (como en `funcs.get_instance`). Si cambia cualquiera de ellos, cambia la huella.
+    Las páginas de cada acta abierta se guardan por huella, como en `CacheActas` pero
+    estén cerradas o no. En la corrida siguiente, un acta con la misma huella se rearma
+    desde acá sin abrirla y solo se abren las nuevas o cambiadas. Como se rearman
+    todas, la salida de cada corrida queda completa: la de la corrida anterior con las
+    actas nuevas y cambiadas al día.
+
+    La foto (`instantanea.json`) guarda los datos del listado de cada acta vista. Al
+    cerrar una corrida que recorrió todo el listado, se borran las actas que ya no están.
+
+    Si cambian las notas de un acta sin que cambie su fila en el listado, el acta no se
+    vuelve a leer; para eso hay que correr sin sincronizar.
+
+    Args:
+        carpeta: Carpeta de la instantánea.
+        max_mb: Tamaño máximo en MB (si se supera, se vuelven a abrir las actas más viejas).
+    """
+
+    def __init__(self, carpeta: str, max_mb: float = MAX_MB):
+        super().__init__(carpeta, max_mb)
+        self._path_foto = os.path.join(carpeta, ARCHIVO_FOTO)
+        self.anterior: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self._path_foto, "r", encoding="utf-8") as f:
+                self.anterior = json.load(f)["actas"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self.actual: Dict[str, Dict[str, Any]] = {}
+
+    def huella(
+        self,
+        reporte: str,
+        fila_comision: Optional[str],
+        identidad: Optional[str],
+        actividad: Optional[str] = None,
+        estado: Optional[str] = None,
+        instancia: Optional[str] = None,
+        tipo: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Arma la huella de un acta del listado y la anota en la foto de esta corrida.
+
+        Args:
+            reporte: Nombre del reporte (ver `reportes.Reporte`).
+            fila_comision: Identidad de la fila de la comisión (None si no hay).
+            identidad: Identidad de la fila del acta (la `identidad` de
+                `funcs.filas_listado`).
+            actividad: Actividad del acta según el listado.
+            estado: Estado del acta según el listado.
+            instancia: Instancia del acta según el listado.
+            tipo: Tipo del acta según el listado.
+
+        Returns:
+            Huella a usar como clave con `obtener` y `guardar`, o None si la fila no
+            se pudo identificar (el acta se abre siempre).
+        """
+        clave = huella_acta(
+            reporte, fila_comision, identidad, actividad, estado, instancia, tipo
+        )
+        if clave is not None:
+            with self._lock:
+                self.actual[clave] = {
+                    "comision": fila_comision,
+                    "identidad": identidad,
+                    "actividad": actividad,
+                    "estado": estado,
+                    "instancia": instancia,
+                    "tipo": tipo,
+                }
+        return clave
+
+    def guarda(self, estado: Any) -> bool:
+        """Se guardan todas las actas, porque lo que decide si cambiaron es la huella."""
+        return True
+
+    def cerrar(self, completa: bool) -> Dict[str, int]:
+        """
+        Guarda la foto de esta corrida en lugar de la anterior.
+
+        Args:
+            completa: Si la corrida recorrió todo el listado desde el principio. Solo
+                entonces se borran las actas que ya no están; si no, la foto nueva
+                conserva también las de la anterior.
+
+        Returns:
+            Diccionario con la cantidad de actas `sin_cambios`, `nuevas` (o cambiadas)
+            y `eliminadas` respecto a la foto anterior.
+        """
+        with self._lock:
+            foto = dict(self.actual) if completa else {**self.anterior, **self.actual}
+            eliminadas = [c for c in self.anterior if c not in foto]
+            for clave in eliminadas:
+                self._borrar(clave, self._leer_indice(clave) or [])
+            with open(self._path_foto + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"actas": foto}, f, ensure_ascii=False)
+            os.replace(self._path_foto + ".tmp", self._path_foto)
+            sin_cambios = sum(1 for c in self.actual if c in self.anterior)
+            return {
+                "sin_cambios": sin_cambios,
+                "nuevas": len(self.actual) - sin_cambios,
+                "eliminadas": len(eliminadas),
+            }
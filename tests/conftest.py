@@ -0,0 +1,223 @@
+import json
+import os
+import sys
+import threading
+from concurrent.futures import Executor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+import pytest
+import requests
+
+# Los módulos del scraper están en la raíz del repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import motor  # noqa: E402
+import progreso  # noqa: E402
+import replay as rp  # noqa: E402
+from backend_http import SesionHTTP  # noqa: E402
+from checkpoint import Checkpoint  # noqa: E402
+from reportes import EXAMENES  # noqa: E402
+from workers import ResultadoPaginas, unir_resultados  # noqa: E402
+
+# Actas de cada página del listado del sitio de prueba
+ACTAS = {1: ["A1", "A2", "A3"], 2: ["A4", "A5"]}
+# Páginas de alumnos de cada acta
+PAGINAS_ALUMNOS = 2
+FILTRO = {"año": "2024", "llamado": "Julio"}
+# (actividad, alumno) de cada fila de una corrida completa, en el orden del listado
+ESPERADAS = [
+    (f"Act {acta}", f"{acta}-alumno-{p}")
+    for pagina in sorted(ACTAS)
+    for acta in ACTAS[pagina]
+    for p in range(1, PAGINAS_ALUMNOS + 1)
+]
+# (página, acta) de cada acta del listado, en orden
+POSICIONES = [
+    (pagina, j) for pagina in sorted(ACTAS) for j in range(len(ACTAS[pagina]))
+]
+
+
+def _tabla(filas: List[List[str]]) -> str:
+    celdas = "".join(
+        "<tr>" + "".join(f"<td>{c}</td>" for c in fila) + "</tr>" for fila in filas
+    )
+    return f"<table>{celdas}</table>"
+
+
+def _paginacion(cuadro: str, actual: int, total: int) -> str:
+    # Como los cuadros Toba: input con la página actual y el total en el pie del cuadro
+    return (
+        f'<input id="{cuadro}__pagina_actual" name="{cuadro}__pagina_actual" '
+        f'value="{actual}">'
+        f'<table id="cuerpo_js_{cuadro}"><tr><td>x</td></tr><tr><td>x</td></tr>'
+        f"<tr><td>x</td></tr><tr><td><div><strong>{actual}</strong>"
+        f"<strong>{total}</strong></div></td></tr></table>"
+    )
+
+
+class SitioToba(ThreadingHTTPServer):
+    """
+    Sitio mínimo con la forma del reporte de exámenes de Guaraní, para grabarlo.
+
+    Tiene un listado de actas en `ACTAS` y cada acta `PAGINAS_ALUMNOS` páginas de
+    alumnos, con los mismos ids de Toba que `reportes.EXAMENES`.
+    """
+
+    def __init__(self) -> None:
+        self.estado: Dict[str, Any] = {"vista": "listado", "pagina": 1}
+        super().__init__(("127.0.0.1", 0), _HandlerToba)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/aplicacion.php"
+
+    def html(self) -> str:
+        estado = self.estado
+        if estado["vista"] == "listado":
+            p = estado["pagina"]
+            cuerpo = _tabla([["0"]]) + _paginacion(EXAMENES.listado, p, len(ACTAS))
+            for acta in ACTAS[p]:
+                cuerpo += (
+                    f"<table><tr><td>{acta} fila</td>"
+                    "<td><img src='/img/rojo.png'></td>"
+                    "<td><button class='ei-boton-fila' onclick=\"return "
+                    f"js_{EXAMENES.listado}.seleccionar('{acta}','seleccion')\">"
+                    "ver</button></td></tr></table>"
+                )
+        else:
+            acta, p = estado["acta"], estado["pagina_alumnos"]
+            info = _tabla(
+                [
+                    ["x"] * 6,
+                    ["Actividad", f"Act {acta}", "Estado", "Cerrada", "Fecha", "1"],
+                    ["Libro", "1", "Folio", "2", "Sede", "LP"],
+                    ["a", "b", "c", "d", "e", "f"],
+                    ["g", "h", "i", "j", "k", "l"],
+                ]
+            )
+            cuerpo = _tabla([["0"]]) + info
+            cuerpo += "".join(_tabla([[str(i)]]) for i in range(2, 5))
+            cuerpo += _paginacion(EXAMENES.alumnos, p, PAGINAS_ALUMNOS)
+            cuerpo += _tabla(
+                [["Nº", "Alumno", "Nota"], ["1", f"{acta}-alumno-{p}", str(p + 5)]]
+            )
+        return (
+            "<html><body><form id='formulario_toba' method='post' "
+            "action='/aplicacion.php'>"
+            f"<input type='hidden' name='{EXAMENES.ci}' value=''>"
+            f"<input type='hidden' name='{EXAMENES.listado}' value=''>"
+            f"{cuerpo}</form></body></html>"
+        )
+
+    def post(self, campos: Dict[str, str]) -> None:
+        estado, listado, alumnos = self.estado, EXAMENES.listado, EXAMENES.alumnos
+        if campos.get(listado) == "cambiar_pagina":
+            estado["pagina"] = int(campos[f"{listado}__pagina_actual"])
+        elif campos.get(listado) == "seleccion":
+            estado.update(
+                vista="acta", acta=campos[f"{listado}__seleccion"], pagina_alumnos=1
+            )
+        elif campos.get(alumnos) == "cambiar_pagina":
+            estado["pagina_alumnos"] = int(campos[f"{alumnos}__pagina_actual"])
+        elif campos.get(EXAMENES.ci) == "cancelar":
+            # Al volver del acta, Guaraní deja el listado en la página en que estaba
+            estado["vista"] = "listado"
+
+
+class _HandlerToba(BaseHTTPRequestHandler):
+    server: SitioToba
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _responder(self) -> None:
+        cuerpo = self.server.html().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def do_GET(self) -> None:
+        self._responder()
+
+    def do_POST(self) -> None:
+        largo = int(self.headers.get("Content-Length") or 0)
+        self.server.post(dict(parse_qsl(self.rfile.read(largo).decode("utf-8"))))
+        self._responder()
+
+
+def abrir_sesion_replay(servidor: rp.ServidorReplay) -> SesionHTTP:
+    """Empieza una sesión HTTP en la página de inicio de la grabación."""
+    respuesta = requests.get(servidor.url, timeout=30)
+    return SesionHTTP(
+        servidor.url, respuesta.text, cookies=respuesta.cookies.get_dict()
+    )
+
+
+def correr(
+    servidor: rp.ServidorReplay,
+    checkpoint: Optional[Checkpoint] = None,
+    parseo: Optional[Executor] = None,
+) -> ResultadoPaginas:
+    """Corre el motor HTTP sobre todas las páginas de la grabación."""
+    sesion = abrir_sesion_replay(servidor)
+    try:
+        return motor.scrapear_paginas_http(
+            sesion, EXAMENES, sorted(ACTAS), checkpoint=checkpoint, parseo=parseo
+        )
+    finally:
+        sesion.cerrar()
+
+
+def filas(resultados: ResultadoPaginas) -> List[Tuple[str, str]]:
+    """(actividad, alumno) de cada fila de los resultados, en orden."""
+    df = unir_resultados(resultados)
+    if df.empty:
+        return []
+    return list(zip(df["Actividad"].astype(str), df["Alumno"]))
+
+
+def registros(path: str, tipo: str) -> List[Tuple[int, Optional[int]]]:
+    """(página, acta) de cada registro de tipo `tipo` del checkpoint, en orden."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [
+            (r["pagina"], r["acta"]) for r in map(json.loads, f) if r["tipo"] == tipo
+        ]
+
+
+@pytest.fixture(scope="session")
+def grabacion(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Carpeta con una grabación de una corrida completa sobre `SitioToba`."""
+    carpeta = str(tmp_path_factory.mktemp("grabacion"))
+    sitio = SitioToba()
+    threading.Thread(target=sitio.serve_forever, daemon=True).start()
+    grabador = rp.Grabador(carpeta, FILTRO, recursos=False)
+    try:
+        sesion = SesionHTTP(sitio.url, sitio.html(), grabador=grabador)
+        motor.scrapear_paginas_http(sesion, EXAMENES, sorted(ACTAS))
+        sesion.cerrar()
+    finally:
+        grabador.cerrar()
+        sitio.shutdown()
+        sitio.server_close()
+    return carpeta
+
+
+@pytest.fixture
+def servidor(grabacion: str) -> Iterator[rp.ServidorReplay]:
+    """Servidor de replay de la grabación."""
+    servidor = rp.servir(grabacion)
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture(autouse=True)
+def sin_progreso() -> Iterator[None]:
+    """Cada test empieza y termina sin progreso activo (ver `progreso.activar`)."""
+    progreso.activar(None)
+    yield
+    progreso.activar(None)
@@ -0,0 +1,24 @@
+from typing import List
+
+import pandas as pd
+
+import motor
+from workers import unir_resultados
+
+from conftest import correr
+
+
+def test_acumulador_igual_a_concat(servidor, monkeypatch):
+    actas: List[pd.DataFrame] = []
+    original = motor.registrar_resultado
+
+    def registrar(df, *args, **kwargs):
+        if not isinstance(df, str):
+            actas.append(df)
+        original(df, *args, **kwargs)
+
+    monkeypatch.setattr(motor, "registrar_resultado", registrar)
+    resultado = unir_resultados(correr(servidor))
+
+    esperado = pd.concat(actas, ignore_index=True)
+    pd.testing.assert_frame_equal(resultado.astype(object), esperado.astype(object))
@@ -0,0 +1,61 @@
+import os
+
+from cache import CacheActas, clave_acta
+
+
+def _html(n: int) -> str:
+    # Sin repeticiones, para que comprimido ocupe unos 20 KB
+    return os.urandom(20000).hex() + str(n)
+
+
+def _paginas(cache: CacheActas) -> int:
+    return len(os.listdir(os.path.join(cache.carpeta, "paginas")))
+
+
+def test_clave_acta():
+    assert clave_acta("examen", "A1|Cerrada") == clave_acta("examen", "A1|Cerrada")
+    assert clave_acta("examen", "A1|Cerrada") != clave_acta("examen", "A2|Cerrada")
+    # Sin fila no se cachea
+    assert clave_acta("examen", None) is None
+    assert clave_acta("examen", "") is None
+
+
+def test_paginas_compartidas_se_guardan_una_vez(tmp_path):
+    cache = CacheActas(str(tmp_path))
+    x, y, z = _html(1), _html(2), _html(3)
+    cache.guardar("a", [x, y])
+    cache.guardar("b", [x, z])
+    assert _paginas(cache) == 3
+
+    # Al reemplazar "a", x sigue porque la usa "b"
+    cache.guardar("a", [z])
+    assert _paginas(cache) == 2
+    assert cache.obtener("a") == [z]
+    assert cache.obtener("b") == [x, z]
+
+    # Al abrir la caché de nuevo se cuentan las referencias desde los índices y se
+    # borran las páginas huérfanas
+    open(os.path.join(str(tmp_path), "paginas", "huerfana.html.gz"), "w").close()
+    cache = CacheActas(str(tmp_path))
+    assert _paginas(cache) == 2
+    cache.guardar("b", [_html(4)])
+    assert _paginas(cache) == 2
+    assert cache.obtener("a") == [z]
+
+
+def test_se_borran_las_actas_usadas_hace_mas_tiempo(tmp_path):
+    # Entran dos actas de unos 20 KB, no tres
+    cache = CacheActas(str(tmp_path), max_mb=50 / 1024)
+    a, b, c = [_html(1)], [_html(2)], [_html(3)]
+    cache.guardar("a", a)
+    cache.guardar("b", b)
+    os.utime(os.path.join(str(tmp_path), "actas", "a.json"), (1000, 1000))
+    os.utime(os.path.join(str(tmp_path), "actas", "b.json"), (2000, 2000))
+    # Usar "a" la deja como la más reciente
+    assert cache.obtener("a") == a
+
+    cache.guardar("c", c)
+    assert cache.obtener("b") is None
+    assert cache.obtener("a") == a
+    assert cache.obtener("c") == c
+    assert _paginas(cache) == 2
@@ -0,0 +1,83 @@
+import motor
+import progreso
+import reintentos as rt
+from checkpoint import Checkpoint
+
+from conftest import ESPERADAS, FILTRO, PAGINAS_ALUMNOS, POSICIONES
+from conftest import correr, filas, registros
+
+
+class CancelarDespues(progreso.Progreso):
+    """Progreso que pide cancelar después de `n` actas."""
+
+    def __init__(self, n: int):
+        super().__init__()
+        self.n = n
+
+    def acta(self, actividad: str) -> None:
+        super().acta(actividad)
+        if self.estado()["actas"] >= self.n:
+            self.cancelar()
+
+
+def test_reanudar_sigue_en_orden_desde_donde_quedo(servidor, tmp_path):
+    path = str(tmp_path / "corrida.checkpoint.jsonl")
+    progreso.activar(CancelarDespues(2))
+    checkpoint = Checkpoint(path, FILTRO)
+    primera = correr(servidor, checkpoint)
+    checkpoint.cerrar()
+    progreso.activar(None)
+
+    checkpoint = Checkpoint(path, FILTRO, reanudar=True)
+    segunda = correr(servidor, checkpoint)
+    checkpoint.cerrar()
+
+    assert filas(primera) == ESPERADAS[: 2 * PAGINAS_ALUMNOS]
+    assert filas(primera) + filas(segunda) == ESPERADAS
+    # Cada acta se registró una sola vez, en el orden del listado
+    assert registros(path, "acta") == POSICIONES
+    assert registros(path, "pagina") == [(1, None), (2, None)]
+
+
+def test_reanudar_reintenta_las_actas_con_error(servidor, tmp_path, monkeypatch):
+    path = str(tmp_path / "corrida.checkpoint.jsonl")
+    original = motor.generar_acta_http
+
+    def falla_a2(sesion, accion, *args, **kwargs):
+        if "A2" in str(accion):
+            raise rt.SinReintento("falla")
+        return original(sesion, accion, *args, **kwargs)
+
+    monkeypatch.setattr(motor, "generar_acta_http", falla_a2)
+    checkpoint = Checkpoint(path, FILTRO)
+    correr(servidor, checkpoint)
+    checkpoint.cerrar()
+    # La página del acta que falló no queda completa
+    assert registros(path, "pagina") == [(2, None)]
+
+    monkeypatch.setattr(motor, "generar_acta_http", original)
+    checkpoint = Checkpoint(path, FILTRO, reanudar=True)
+    segunda = correr(servidor, checkpoint)
+    checkpoint.cerrar()
+
+    assert filas(segunda) == [f for f in ESPERADAS if f[0] == "Act A2"]
+    assert sorted(registros(path, "acta")) == POSICIONES
+    assert registros(path, "pagina") == [(2, None), (1, None)]
+
+
+def test_checkpoint_reconoce_las_filas_corridas(tmp_path):
+    path = str(tmp_path / "corrida.checkpoint.jsonl")
+    checkpoint = Checkpoint(path, FILTRO)
+    checkpoint.registrar_acta(1, None, 0, "Act A1", identidad="A1")
+    checkpoint.terminar_pagina(1, ["A1", "A2"])
+    checkpoint.cerrar()
+
+    checkpoint = Checkpoint(path, FILTRO, reanudar=True)
+    # Se publicó un acta antes de A1: A1 pasó a la segunda fila
+    assert not checkpoint.hecho(1, None, 0, "A0")
+    assert checkpoint.hecho(1, None, 1, "A1")
+    assert not checkpoint.hecho(1, identidad=["A0", "A1"])
+    assert checkpoint.hecho(1, identidad=["A1", "A2"])
+    # Sin identidad se compara solo la posición
+    assert checkpoint.hecho(1, None, 0)
+    checkpoint.cerrar()
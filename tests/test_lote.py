@@ -0,0 +1,30 @@
+import pytest
+
+from motor import objetivos_lote
+
+
+def test_objetivos_lote_combina_años_y_valores():
+    assert objetivos_lote("2019-2021, 2023", "Julio; Diciembre") == [
+        (2019, "Julio"),
+        (2019, "Diciembre"),
+        (2020, "Julio"),
+        (2020, "Diciembre"),
+        (2021, "Julio"),
+        (2021, "Diciembre"),
+        (2023, "Julio"),
+        (2023, "Diciembre"),
+    ]
+
+
+def test_objetivos_lote_sin_filtros_pregunta():
+    # Lo que no se pasa queda None, y se pregunta como en una corrida común
+    assert objetivos_lote(None, None) == [(None, None)]
+    assert objetivos_lote("2024", None) == [(2024, None)]
+    assert objetivos_lote("", "1er cuatrimestre, turno mañana") == [
+        (None, "1er cuatrimestre, turno mañana")
+    ]
+
+
+def test_objetivos_lote_año_invalido():
+    with pytest.raises(ValueError):
+        objetivos_lote("2019-", None)
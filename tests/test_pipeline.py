@@ -0,0 +1,44 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pipeline
+from checkpoint import Checkpoint
+from pipeline import Pipeline, pool_de_parseo
+from reportes import EXAMENES
+
+from conftest import ESPERADAS, FILTRO, POSICIONES, correr, filas, registros
+
+
+def test_pipeline_entrega_en_el_orden_del_listado(servidor, tmp_path):
+    path = str(tmp_path / "corrida.checkpoint.jsonl")
+    checkpoint = Checkpoint(path, FILTRO)
+    pool = pool_de_parseo(2)
+    try:
+        resultados = correr(servidor, checkpoint, pool)
+    finally:
+        pool.shutdown()
+        checkpoint.cerrar()
+
+    assert filas(resultados) == ESPERADAS
+    assert registros(path, "acta") == POSICIONES
+    assert registros(path, "pagina") == [(1, None), (2, None)]
+
+
+def test_pipeline_respeta_el_orden_de_envio(monkeypatch):
+    def parsear(htmls, reporte, datos):
+        # Las últimas actas enviadas terminan primero
+        time.sleep(0.02 * (5 - int(htmls[0])))
+        return htmls[0], "actividad"
+
+    monkeypatch.setattr(pipeline, "parsear_acta", parsear)
+    orden: List[str] = []
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        cola = Pipeline(pool, pendientes=10)
+        for k in range(5):
+            cola.enviar([str(k)], EXAMENES, None, lambda df, act: orden.append(df))
+            if k == 2:
+                cola.despues(lambda: orden.append("despues"))
+        cola.vaciar()
+
+    assert orden == ["0", "1", "2", "despues", "3", "4"]
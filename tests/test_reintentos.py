@@ -0,0 +1,147 @@
+import time
+from typing import List
+
+import pytest
+import requests
+from selenium.common import exceptions
+
+import funcs
+import reintentos as rt
+
+from conftest import ESPERADAS, correr, filas
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    respuesta = requests.Response()
+    respuesta.status_code = status
+    return requests.HTTPError(response=respuesta)
+
+
+@pytest.mark.parametrize(
+    "error, clase",
+    [
+        (rt.SinReintento("sesión"), rt.NO_REINTENTAR),
+        (exceptions.StaleElementReferenceException(), rt.ELEMENTO_VIEJO),
+        (exceptions.TimeoutException(), rt.TIMEOUT),
+        (requests.Timeout(), rt.TIMEOUT),
+        (_http_error(503), rt.SERVIDOR),
+        (_http_error(429), rt.SERVIDOR),
+        (_http_error(404), rt.NO_REINTENTAR),
+        (requests.ConnectionError(), rt.SERVIDOR),
+        (exceptions.NoSuchElementException(), rt.SIN_TABLA),
+        (rt.SinTabla("falta la tabla"), rt.SIN_TABLA),
+        (ValueError("No tables found"), rt.SIN_TABLA),
+        (ValueError("invalid literal"), rt.OTRO),
+        (IndexError("list index out of range"), rt.OTRO),
+        (KeyError("Actividad"), rt.OTRO),
+        (exceptions.WebDriverException("Reached error page"), rt.SERVIDOR),
+    ],
+)
+def test_clasificar(error, clase):
+    assert rt.clasificar(error) == clase
+
+
+def _sin_espera(intentos: int) -> rt.Backoff:
+    return rt.Backoff(intentos=intentos, base=0, maximo=0)
+
+
+def test_reintenta_segun_la_clase_del_error():
+    reintentos = rt.Reintentos(
+        politicas={rt.SIN_TABLA: _sin_espera(2), rt.OTRO: _sin_espera(1)}
+    )
+    llamadas: List[str] = []
+
+    def sin_tabla() -> None:
+        llamadas.append("intento")
+        raise rt.SinTabla("falta la tabla")
+
+    with pytest.raises(rt.SinTabla):
+        reintentos.reintentar(sin_tabla, lambda: llamadas.append("volver"))
+    # Un intento y dos reintentos, cada uno después de volver
+    assert llamadas == ["intento", "volver", "intento", "volver", "intento"]
+
+    llamadas.clear()
+
+    def sin_reintento() -> None:
+        llamadas.append("intento")
+        raise rt.SinReintento("sesión")
+
+    with pytest.raises(rt.SinReintento):
+        reintentos.reintentar(sin_reintento)
+    assert llamadas == ["intento"]
+
+
+def test_presupuesto_de_reintentos():
+    reintentos = rt.Reintentos(
+        politicas={rt.OTRO: _sin_espera(5)}, presupuesto=2, recarga=0.5
+    )
+    llamadas = []
+
+    def falla() -> None:
+        llamadas.append(1)
+        raise RuntimeError("falla")
+
+    with pytest.raises(RuntimeError):
+        reintentos.reintentar(falla)
+    # Las dos fichas alcanzan para dos reintentos, aunque la clase permita cinco
+    assert len(llamadas) == 3
+
+    llamadas.clear()
+    with pytest.raises(RuntimeError):
+        reintentos.reintentar(falla)
+    assert len(llamadas) == 1
+
+    # Cada éxito devuelve media ficha
+    reintentos.reintentar(lambda: None)
+    reintentos.reintentar(lambda: None)
+    llamadas.clear()
+    with pytest.raises(RuntimeError):
+        reintentos.reintentar(falla)
+    assert len(llamadas) == 2
+
+
+def _espera(circuito: rt.Circuito) -> float:
+    inicio = time.monotonic()
+    circuito.esperar()
+    return time.monotonic() - inicio
+
+
+def test_circuito_se_corta_y_duplica_la_pausa():
+    circuito = rt.Circuito(umbral=2, pausa=0.05, pausa_maxima=0.1)
+    circuito.falla()
+    assert _espera(circuito) < 0.04
+    circuito.falla()
+    assert _espera(circuito) >= 0.04
+    # El primer intento después de la pausa vuelve a fallar: la pausa se duplica
+    circuito.falla()
+    assert _espera(circuito) >= 0.09
+    # Hasta `pausa_maxima`
+    circuito.falla()
+    assert 0.09 <= _espera(circuito) < 0.15
+
+    # Con un éxito vuelve a la normalidad
+    circuito.exito()
+    circuito.falla()
+    assert _espera(circuito) < 0.04
+    circuito.falla()
+    assert 0.04 <= _espera(circuito) < 0.09
+
+
+def test_el_motor_reintenta_las_actas_sin_tabla_por_http(servidor, monkeypatch):
+    monkeypatch.setattr(
+        rt, "_activos", rt.Reintentos(politicas={rt.SIN_TABLA: _sin_espera(2)})
+    )
+    original = funcs.info_acta
+    fallas = {"Act A2": 1}
+
+    def info_acta(pagina, reporte, datos=None):
+        info = original(pagina, reporte, datos)
+        if fallas.get(info["Actividad"]):
+            fallas[info["Actividad"]] -= 1
+            raise rt.SinTabla("la página no terminó de cargar")
+        return info
+
+    monkeypatch.setattr(funcs, "info_acta", info_acta)
+
+    assert filas(correr(servidor)) == ESPERADAS
+    assert fallas == {"Act A2": 0}
@@ -0,0 +1,5 @@
+from conftest import ESPERADAS, correr, filas
+
+
+def test_replay_reproduce_la_corrida(servidor):
+    assert filas(correr(servidor)) == ESPERADAS
@@ -0,0 +1,72 @@
+import os
+from typing import List
+
+import pandas as pd
+
+from checkpoint import Checkpoint
+from salida import SalidaParticionada, Ubicacion, leer_todo
+
+from conftest import FILTRO
+
+
+def _acta(actividad: str, alumnos: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Alumno": [f"{actividad}-{n}" for n in range(alumnos)],
+            "Actividad": actividad,
+        }
+    )
+
+
+def test_reanudar_trunca_lo_que_no_se_registro(tmp_path):
+    carpeta = str(tmp_path / "output")
+    salida = SalidaParticionada(carpeta, FILTRO)
+    ubicaciones: List[Ubicacion] = []
+    salida.escribir(_acta("A1", 2), ubicaciones.append)
+    salida.escribir(_acta("A2", 3), ubicaciones.append)
+    # Otras columnas: parte nueva
+    salida.escribir(_acta("A3", 1).assign(Nota=7), ubicaciones.append)
+    salida.cerrar()
+    open(os.path.join(salida.directorio, "part-00002.parquet.tmp"), "w").close()
+    assert sorted(os.listdir(salida.directorio)) == [
+        "part-00000.csv",
+        "part-00001.csv",
+        "part-00002.parquet.tmp",
+    ]
+
+    # Solo A1 llegó al checkpoint
+    salida = SalidaParticionada(carpeta, FILTRO)
+    salida.reanudar(ubicaciones[:1])
+    assert os.listdir(salida.directorio) == ["part-00000.csv"]
+    pd.testing.assert_frame_equal(leer_todo(salida.directorio), _acta("A1", 2))
+
+    # Lo que se escribe después sigue en una parte nueva, sin repetir A2
+    salida.escribir(_acta("A2", 3))
+    pd.testing.assert_frame_equal(
+        salida.a_dataframe(),
+        pd.concat([_acta("A1", 2), _acta("A2", 3)], ignore_index=True),
+    )
+
+    salida = SalidaParticionada(carpeta, FILTRO)
+    salida.reanudar([])
+    assert os.listdir(salida.directorio) == []
+
+
+def test_checkpoint_descarta_las_filas_sin_registrar(tmp_path):
+    carpeta = str(tmp_path / "output")
+    path = str(tmp_path / "output.checkpoint.jsonl")
+    checkpoint = Checkpoint(path, FILTRO, salida=SalidaParticionada(carpeta, FILTRO))
+    checkpoint.registrar_acta(1, None, 0, "A1", _acta("A1", 2))
+    # Filas escritas que no llegaron a registrarse (la corrida se cortó)
+    checkpoint.salida.escribir(_acta("A2", 3))
+    checkpoint.cerrar()
+
+    salida = SalidaParticionada(carpeta, FILTRO)
+    checkpoint = Checkpoint(path, FILTRO, reanudar=True, salida=salida)
+    checkpoint.registrar_acta(1, None, 1, "A2", _acta("A2", 3))
+    checkpoint.cerrar()
+
+    pd.testing.assert_frame_equal(
+        salida.a_dataframe(),
+        pd.concat([_acta("A1", 2), _acta("A2", 3)], ignore_index=True),
+    )
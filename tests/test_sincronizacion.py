@@ -0,0 +1,46 @@
+from sincronizacion import Instantanea, huella_acta
+
+
+def _huella(instantanea: Instantanea, fila: str, estado: str) -> str:
+    return instantanea.huella("examenes", None, fila, f"Act {fila}", estado)
+
+
+def test_instantanea_abre_solo_lo_que_cambio(tmp_path):
+    carpeta = str(tmp_path / "output.instantanea")
+    instantanea = Instantanea(carpeta)
+    for fila in ("A1", "A2"):
+        instantanea.guardar(_huella(instantanea, fila, "Abierta"), [f"<{fila}>"])
+    assert instantanea.cerrar(completa=True) == {
+        "sin_cambios": 0,
+        "nuevas": 2,
+        "eliminadas": 0,
+    }
+
+    # A1 sigue igual, A2 cambió de estado y A3 es nueva. La corrida no es completa
+    # (por ejemplo, se reanudó): la foto conserva todo lo anterior.
+    instantanea = Instantanea(carpeta)
+    assert instantanea.obtener(_huella(instantanea, "A1", "Abierta")) == ["<A1>"]
+    a2_anterior = huella_acta("examenes", None, "A2", "Act A2", "Abierta", None, None)
+    assert instantanea.obtener(_huella(instantanea, "A2", "Cerrada")) is None
+    assert instantanea.obtener(_huella(instantanea, "A3", "Abierta")) is None
+    instantanea.guardar(_huella(instantanea, "A2", "Cerrada"), ["<A2 cerrada>"])
+    instantanea.guardar(_huella(instantanea, "A3", "Abierta"), ["<A3>"])
+    assert instantanea.cerrar(completa=False) == {
+        "sin_cambios": 1,
+        "nuevas": 2,
+        "eliminadas": 0,
+    }
+    assert Instantanea(carpeta).obtener(a2_anterior) == ["<A2>"]
+
+    # Una corrida completa en la que solo queda A1 borra todo lo demás
+    instantanea = Instantanea(carpeta)
+    _huella(instantanea, "A1", "Abierta")
+    assert instantanea.cerrar(completa=True) == {
+        "sin_cambios": 1,
+        "nuevas": 0,
+        "eliminadas": 3,
+    }
+    instantanea = Instantanea(carpeta)
+    assert instantanea.obtener(a2_anterior) is None
+    assert instantanea.obtener(_huella(instantanea, "A3", "Abierta")) is None
+    assert instantanea.obtener(_huella(instantanea, "A1", "Abierta")) == ["<A1>"]
@@ -0,0 +1,44 @@
+from typing import Dict, List
+
+import pytest
+
+from acumulador import Acumulador
+from workers import PaginasFallidas, correr_workers, repartir_paginas
+
+
+class Navegador:
+    def __init__(self, k: int):
+        self.k = k
+        self.cerrado = False
+
+    def quit(self) -> None:
+        self.cerrado = True
+
+
+def test_repartir_paginas_intercaladas():
+    assert repartir_paginas(range(1, 8), 3) == [[1, 4, 7], [2, 5], [3, 6]]
+    assert repartir_paginas([1], 3) == [[1]]
+
+
+def test_worker_que_falla_deja_sus_paginas_fallidas():
+    navegadores: List[Navegador] = []
+
+    def abrir(k: int) -> Navegador:
+        navegadores.append(Navegador(k))
+        return navegadores[-1]
+
+    def procesar(b: Navegador, shard: List[int], k: int) -> Dict[int, Acumulador]:
+        if k == 1:
+            raise RuntimeError("se cerró el navegador")
+        return {p: Acumulador() for p in shard}
+
+    sesiones: Dict[int, Navegador] = {}
+    with pytest.raises(PaginasFallidas) as error:
+        correr_workers(abrir, procesar, range(1, 6), 2, sesiones=sesiones)
+
+    assert error.value.paginas == [2, 4]
+    assert sorted(error.value.resultados) == [1, 3, 5]
+    # Solo se cierra (y se saca) el navegador del worker que falló
+    assert sorted(sesiones) == [0]
+    assert [b.cerrado for b in navegadores if b.k == 1] == [True]
+    assert not sesiones[0].cerrado
@@ -0,0 +1,149 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+from tqdm import tqdm
+
+import progreso
+from acumulador import Acumulador
+
+# Resultado de un worker: para cada página del listado, las filas de sus actas
+ResultadoPaginas = Dict[int, Acumulador]
+
+
+class PaginasFallidas(Exception):
+    """
+    Algunos workers fallaron y sus páginas quedaron sin procesar (ver `correr_workers`).
+
+    Args:
+        paginas: Páginas de los workers que fallaron, en orden.
+        resultados: Filas de las páginas de los workers que terminaron bien.
+        errores: Error de cada worker que falló.
+    """
+
+    def __init__(
+        self,
+        paginas: List[int],
+        resultados: ResultadoPaginas,
+        errores: List[Exception],
+    ):
+        super().__init__(f"Quedaron sin procesar las páginas {paginas}: {errores[0]}")
+        self.paginas = paginas
+        self.resultados = resultados
+        self.errores = errores
+
+
+def repartir_paginas(paginas: Sequence[int], n_workers: int) -> List[List[int]]:
+    """
+    Reparte las páginas del listado entre los workers de forma intercalada.
+
+    Se intercalan (1, N+1, 2N+1, ...) en lugar de cortar en bloques contiguos para que
+    las páginas más pesadas no caigan todas en el mismo worker.
+
+    Args:
+        paginas: Páginas a procesar.
+        n_workers: Cantidad de workers.
+
+    Returns:
+        Lista con las páginas asignadas a cada worker; no incluye workers sin páginas.
+    """
+    paginas = list(paginas)
+    shards = [paginas[k::n_workers] for k in range(max(n_workers, 1))]
+    return [shard for shard in shards if shard]
+
+
+def correr_workers(
+    abrir_sesion: Callable[[int], Any],
+    procesar: Callable[[Any, List[int], int], ResultadoPaginas],
+    paginas: Sequence[int],
+    n_workers: int,
+    sesiones: Optional[Dict[int, Any]] = None,
+) -> ResultadoPaginas:
+    """
+    Procesa las páginas de un listado con varias sesiones de navegador en paralelo.
+
+    Cada worker abre su propia sesión (login y filtros incluidos) con `abrir_sesion`,
+    procesa su parte de las páginas con `procesar` y cierra el navegador al terminar.
+    Si un worker falla, se informa el error y los demás siguen hasta terminar; después
+    se lanza `PaginasFallidas` con las páginas que quedaron sin procesar y los
+    resultados del resto, para que quien llama las reintente o las dé por fallidas.
+
+    Con `sesiones`, los navegadores no se cierran al terminar: quedan ahí para la próxima
+    llamada (por ejemplo, el próximo filtro de un lote) y los cierra quien llama. Solo se
+    cierra y se saca el de un worker que falla.
+
+    Args:
+        abrir_sesion: Función que recibe el número de worker y devuelve un navegador
+            logueado y filtrado, parado en el listado.
+        procesar: Función que recibe (navegador, páginas, número de worker) y devuelve
+            las filas de cada página.
+        paginas: Páginas a procesar.
+        n_workers: Cantidad de workers.
+        sesiones: Navegadores abiertos por número de worker, para reutilizar y conservar
+            entre llamadas (opcional); los que se abren se agregan ahí.
+
+    Returns:
+        Diccionario página -> filas de esa página, con los resultados de todos los workers.
+
+    Raises:
+        PaginasFallidas: Si falló algún worker.
+    """
+    shards = repartir_paginas(paginas, n_workers)
+    resultados: ResultadoPaginas = {}
+    lock = threading.Lock()
+
+    def worker(k: int) -> None:
+        browser = sesiones.get(k) if sesiones is not None else None
+        try:
+            if browser is None:
+                browser = abrir_sesion(k)
+                if sesiones is not None:
+                    with lock:
+                        sesiones[k] = browser
+            parcial = procesar(browser, shards[k], k)
+            with lock:
+                resultados.update(parcial)
+        except Exception:
+            if sesiones is not None and browser is not None:
+                with lock:
+                    sesiones.pop(k, None)
+                browser.quit()
+            raise
+        finally:
+            if sesiones is None and browser is not None:
+                browser.quit()
+
+    errores: List[Exception] = []
+    fallidas: List[int] = []
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+        futures = [pool.submit(worker, k) for k in range(len(shards))]
+        for k, future in enumerate(futures):
+            try:
+                future.result()
+            except Exception as e:
+                errores.append(e)
+                fallidas.extend(shards[k])
+                mensaje = f"Error en worker {k} (páginas {shards[k]}): {e}"
+                tqdm.write(mensaje)
+                progreso.error(mensaje)
+
+    if errores:
+        raise PaginasFallidas(sorted(fallidas), resultados, errores) from errores[0]
+    return resultados
+
+
+def unir_resultados(resultados: ResultadoPaginas) -> pd.DataFrame:
+    """
+    Une los resultados de los workers en un único DataFrame, en el orden de las páginas.
+
+    Args:
+        resultados: Diccionario página -> filas de esa página.
+
+    Returns:
+        DataFrame consolidado.
+    """
+    total = Acumulador()
+    for pagina in sorted(resultados):
+        total.extender(resultados[pagina])
+    return total.a_dataframe()